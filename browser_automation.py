@@ -2,19 +2,42 @@
 # 处理 OpenAI 注册、Codex 授权等浏览器自动化操作
 # 使用 DrissionPage 替代 Selenium
 
+import re
+import json
 import time
 import random
+import functools
 import subprocess
 import os
+import sys
+import queue
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
+from urllib.parse import urlsplit
 from DrissionPage import ChromiumPage, ChromiumOptions
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from DrissionPage.common import Keys
+from DrissionPage.errors import ElementLostError, ContextLostError, PageDisconnectedError, BrowserConnectError
+
 from config import (
     BROWSER_WAIT_TIMEOUT,
     BROWSER_SHORT_WAIT,
     BROWSER_HEADLESS,
+    BROWSER_POOL_SIZE,
+    BROWSER_MAX_USES,
     AUTH_PROVIDER,
     PROXY_ENABLED,
+    PROXIES,
     get_random_name,
     get_random_birthday,
     get_next_proxy,
@@ -34,34 +57,144 @@ from logger import log
 
 # ==================== 浏览器配置常量 ====================
 BROWSER_MAX_RETRIES = 3  # 浏览器启动最大重试次数
-BROWSER_RETRY_DELAY = 2  # 重试间隔 (秒)
+BROWSER_RETRY_DELAY = 2  # 重试基础间隔 (秒)，按指数退避递增
 PAGE_LOAD_TIMEOUT = 15   # 页面加载超时 (秒)
 
+# 精简启动参数: 关闭 GPU、后台网络、翻译、同步等用不到的功能，加快启动并降低内存占用
+BROWSER_LEAN_FLAGS = (
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-gpu',
+    '--disable-dev-shm-usage',  # 避免共享内存问题
+    '--no-sandbox',  # 服务器环境需要
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-features=TranslateUI,BackForwardCache',
+    '--disable-sync',
+    '--disable-default-apps',
+    '--metrics-recording-only',
+    '--mute-audio',
+)
+
+
+def _backoff(attempt: int, base: float = 1.0, cap: float = 30.0, jitter: float = 0.5) -> float:
+    """计算重试等待时间: 截断指数退避 + 随机抖动
+
+    Args:
+        attempt: 第几次重试 (从 0 开始)
+        base: 基础等待 (秒)
+        cap: 最大等待 (秒)
+        jitter: 抖动比例 (0.5 表示 ±50%)
+    """
+    return min(cap, base * 2 ** attempt) * (1 + random.uniform(-jitter, jitter))
+
+
+def _is_unrecoverable_browser_error(error: Exception) -> bool:
+    """浏览器启动异常是否不可恢复 (如找不到 Chrome 可执行文件、无权限)，不可恢复时无需重试"""
+    return isinstance(error, (FileNotFoundError, PermissionError))
+
+
 # ==================== 输入速度配置 (模拟真人) ====================
 # 设置为 True 使用更安全的慢速模式，False 使用快速模式
 SAFE_MODE = True
 TYPING_DELAY = 0.12 if SAFE_MODE else 0.06  # 打字基础延迟
-ACTION_DELAY = (1.0, 2.0) if SAFE_MODE else (0.3, 0.8)  # 操作间隔范围
+ACTION_DELAY = (0.3, 0.8)  # 操作间隔范围 (仅 SAFE_MODE 下生效)
 
+# 错误页面关键字 (编译为一个正则，一次扫描匹配全部关键字)
+_ERROR_KEYWORDS = ('出错', 'error', 'timed out', 'operation timeout', 'route error', 'invalid content')
+_ERROR_PAGE_RE = re.compile('|'.join(map(re.escape, _ERROR_KEYWORDS)), re.IGNORECASE)
+
+# 认证流程中的页面 URL 特征
+_CODEX_CALLBACK_URL = "localhost:1455/auth/callback"
+
+_RETRY_BUTTON = 'css:button[data-dd-action-name="Try again"]'
+
+# 常用元素选择器
+_SUBMIT_BUTTON = 'css:button[type="submit"]'
+_EMAIL_INPUT = 'css:input[type="email"]'
+_EMAIL_INPUT_ANY = 'css:input[type="email"], input[name="email"], #email'
+_PASSWORD_INPUT = 'css:input[type="password"]'
+_PASSWORD_INPUT_ANY = 'css:input[type="password"], input[name="password"]'
+_OTP_INPUT = 'css:input[name="otp"], input[type="text"], input[autocomplete="one-time-code"]'
+_YEAR_INPUT = 'css:[data-type="year"]'
+_MONTH_INPUT = 'css:[data-type="month"]'
+_DAY_INPUT = 'css:[data-type="day"]'
+
+
+# 后台获取验证码的线程池 (提交密码后即开始收信，与页面跳转并行)
+_code_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="verify-code")
+# 后台生成授权 URL 的线程池 (与浏览器登录并行)
+_auth_url_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="auth-url")
+
+
+def _prompt_verification_code(prompt: str) -> str:
+    """自动获取验证码失败时请求手动输入
+
+    只有主线程且标准输入是终端时才提示输入；在工作线程、GUI 或标准输入被重定向时直接返回空字符串
+    (input 会一直阻塞或抛出 EOFError)，由调用方按获取失败处理。
+    """
+    if threading.current_thread() is not threading.main_thread() or not (sys.stdin and sys.stdin.isatty()):
+        log.warning("非交互式环境，无法手动输入验证码")
+        return ""
+    try:
+        return input(prompt).strip()
+    except EOFError:
+        return ""
+
+
+def _await_verification_code(code_future, email: str) -> tuple:
+    """取后台任务获取的验证码，没有后台任务或任务失败时同步获取
+
+    Returns:
+        tuple: (code, error, email_time)
+    """
+    if code_future is not None:
+        try:
+            return code_future.result()
+        except Exception as e:
+            log.warning(f"后台获取验证码失败: {e}")
+    return unified_get_verification_code(email)
 
-# ==================== URL 监听与日志 ====================
-_last_logged_url = None  # 记录上次日志的URL，避免重复
 
+# ==================== 页面级缓存 ====================
+def _page_state(page) -> dict:
+    """页面级缓存 (上次日志的 URL、已解析元素、登录检测结果)
 
-def log_current_url(page, context: str = None, force: bool = False):
+    直接挂在页面对象上: 每个页面同一时间只由一个线程使用，清理时不会与其他线程的写入冲突；
+    页面对象释放后缓存随之释放，也不会像 id(page) 键那样在 id 复用后读到旧页面的数据。
+    """
+    state = getattr(page, '_automation_state', None)
+    if state is None:
+        state = {"elements": {}}
+        page._automation_state = state
+    return state
+
+
+def _forget_page_state(page):
+    """清空页面级缓存 (实例复用处理下一个账号或关闭前调用)"""
+    try:
+        page._automation_state = None
+    except Exception:
+        pass
+
+
+# ==================== URL 监听与日志 ====================
+def log_current_url(page, context: str = None, force: bool = False, url: str = None):
     """记录当前页面URL (完整地址)
 
     Args:
         page: 浏览器页面对象
         context: 上下文描述 (如 "点击继续后", "输入邮箱后")
         force: 是否强制记录 (即使URL未变化)
+        url: 调用方已读取的当前 URL (传入时不再访问 page.url)
     """
-    global _last_logged_url
     try:
-        current_url = page.url
+        current_url = url if url is not None else page.url
         # 只在URL变化时记录，除非强制记录
-        if force or current_url != _last_logged_url:
-            _last_logged_url = current_url
+        state = _page_state(page)
+        if force or current_url != state.get("logged_url"):
+            state["logged_url"] = current_url
 
             # 解析URL获取关键信息
             url_info = _parse_url_info(current_url)
@@ -81,8 +214,29 @@ def log_current_url(page, context: str = None, force: bool = False):
         log.warning(f"获取URL失败: {e}")
 
 
+# URL 页面类型表: host -> ((路径特征, 描述), ...), 默认描述
+_URL_HOST_RE = re.compile(r'auth\.openai\.com|chatgpt\.com|localhost:1455')
+_URL_PAGE_LABELS = {
+    "auth.openai.com": (
+        (
+            ("/log-in-or-create-account", "登录/注册选择页"),
+            ("/log-in/password", "密码登录页"),
+            ("/create-account/password", "创建账号密码页"),
+            ("/email-verification", "邮箱验证码页"),
+            ("/about-you", "个人信息填写页"),
+            ("/authorize", "授权确认页"),
+            ("/callback", "回调处理页"),
+        ),
+        "OpenAI 认证页",
+    ),
+    "chatgpt.com": ((("/auth", "ChatGPT 认证页"),), "ChatGPT 主页"),
+    "localhost:1455": ((("/auth/callback", "本地授权回调页"),), "本地服务页"),
+}
+
+
+@functools.lru_cache(maxsize=512)
 def _parse_url_info(url: str) -> str:
-    """解析URL，返回页面类型描述
+    """解析URL，返回页面类型描述 (结果按 URL 缓存，轮询时同一 URL 不重复解析)
 
     Args:
         url: 页面URL
@@ -93,40 +247,16 @@ def _parse_url_info(url: str) -> str:
     if not url:
         return ""
 
-    # OpenAI Auth 页面
-    if "auth.openai.com" in url:
-        if "/log-in-or-create-account" in url:
-            return "登录/注册选择页"
-        elif "/log-in/password" in url:
-            return "密码登录页"
-        elif "/create-account/password" in url:
-            return "创建账号密码页"
-        elif "/email-verification" in url:
-            return "邮箱验证码页"
-        elif "/about-you" in url:
-            return "个人信息填写页"
-        elif "/authorize" in url:
-            return "授权确认页"
-        elif "/callback" in url:
-            return "回调处理页"
-        else:
-            return "OpenAI 认证页"
-
-    # ChatGPT 页面
-    elif "chatgpt.com" in url:
-        if "/auth" in url:
-            return "ChatGPT 认证页"
-        else:
-            return "ChatGPT 主页"
-
-    # 回调页面
-    elif "localhost:1455" in url:
-        if "/auth/callback" in url:
-            return "本地授权回调页"
-        else:
-            return "本地服务页"
+    match = _URL_HOST_RE.search(url)
+    if not match:
+        return ""
 
-    return ""
+    rest = url[match.end():]
+    paths, default_label = _URL_PAGE_LABELS[match.group(0)]
+    for fragment, label in paths:
+        if fragment in rest:
+            return label
+    return default_label
 
 
 def log_url_change(page, old_url: str, action: str = None):
@@ -137,11 +267,10 @@ def log_url_change(page, old_url: str, action: str = None):
         old_url: 变化前的URL
         action: 触发变化的操作描述
     """
-    global _last_logged_url
     try:
         new_url = page.url
         if new_url != old_url:
-            _last_logged_url = new_url  # 更新记录，避免重复日志
+            _page_state(page)["logged_url"] = new_url  # 更新记录，避免重复日志
             new_info = _parse_url_info(new_url)
 
             # 左对齐格式: [URL] 操作 | 新地址 | 页面类型
@@ -159,9 +288,36 @@ def log_url_change(page, old_url: str, action: str = None):
         log.warning(f"记录URL变化失败: {e}")
 
 
+_last_cleanup_time = 0.0  # 上次清理残留进程的时间
+CLEANUP_DEBOUNCE = 2.0    # 清理去抖间隔 (秒)，短时间内重复调用直接跳过
+
+
 def cleanup_chrome_processes():
-    """清理残留的 Chrome 进程 (Windows)"""
+    """清理残留的 chromedriver 进程
+
+    优先使用 psutil 在进程内枚举，未安装时回退到 tasklist/taskkill (Windows)。
+    不终止 chrome 进程本身，避免误关浏览器池或其他并行任务中的实例。
+    """
+    global _last_cleanup_time
+    now = time.time()
+    if now - _last_cleanup_time < CLEANUP_DEBOUNCE:
+        return
+    _last_cleanup_time = now
+
     try:
+        if psutil is not None:
+            killed = 0
+            for proc in psutil.process_iter(['name']):
+                if (proc.info.get('name') or '').lower() in ('chromedriver', 'chromedriver.exe'):
+                    try:
+                        proc.kill()
+                        killed += 1
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        pass
+            if killed:
+                log.step("已清理 chromedriver 残留进程")
+            return
+
         # 查找并终止残留的 chrome 进程 (仅限无头或调试模式的)
         result = subprocess.run(
             ['tasklist', '/FI', 'IMAGENAME eq chrome.exe', '/FO', 'CSV'],
@@ -180,9 +336,65 @@ def cleanup_chrome_processes():
         pass  # 静默处理，不影响主流程
 
 
+def _select_proxy_argument() -> str:
+    """选择本次启动使用的代理参数 (会轮换代理，只在需要换代理时调用)
+
+    Returns:
+        str: --proxy-server=... / --no-proxy-server，或空字符串 (不设置代理)
+    """
+    if not PROXY_ENABLED:
+        # 无代理时忽略系统代理
+        return '--no-proxy-server'
+
+    proxy = get_next_proxy()
+    if not proxy:
+        return ''
+
+    # DrissionPage 不支持 socks5，只能用 http/https
+    proxy_type = proxy.get("type", "http")
+    if proxy_type.startswith("socks"):
+        log.warning(f"DrissionPage 不支持 {proxy_type} 代理，跳过代理设置")
+        return ''
+
+    proxy_url = format_proxy_url(proxy)
+    if not proxy_url:
+        return ''
+    log.info(f"使用代理: {proxy.get('host')}:{proxy.get('port')}")
+    return f'--proxy-server={proxy_url}'
+
+
+@functools.lru_cache(maxsize=16)
+def _browser_arguments(proxy_argument: str) -> tuple:
+    """启动参数列表 (按代理参数缓存)"""
+    arguments = ['--incognito', *BROWSER_LEAN_FLAGS]  # 无痕模式 + 精简参数
+    if BROWSER_HEADLESS:
+        arguments += ['--headless=new', '--window-size=1920,1080']
+    if proxy_argument:
+        arguments.append(proxy_argument)
+    return tuple(arguments)
+
+
+def _build_options(proxy_argument: str) -> ChromiumOptions:
+    """根据缓存的参数列表创建 ChromiumOptions"""
+    co = ChromiumOptions()
+    for argument in _browser_arguments(proxy_argument):
+        co.set_argument(argument)
+    co.auto_port()  # 自动分配端口，确保每次都是新实例
+    co.set_timeouts(base=PAGE_LOAD_TIMEOUT, page_load=PAGE_LOAD_TIMEOUT * 2)
+    return co
+
+
+def _is_proxy_error(error: Exception) -> bool:
+    """启动异常是否与代理有关 (需要换一个代理再试)"""
+    message = str(error).lower()
+    return 'proxy' in message or 'tunnel' in message
+
+
 def init_browser(max_retries: int = BROWSER_MAX_RETRIES) -> ChromiumPage:
     """初始化 DrissionPage 浏览器 (带重试机制)
 
+    代理只在首次启动和代理相关的失败后轮换，普通启动失败沿用同一代理重试。
+
     Args:
         max_retries: 最大重试次数
 
@@ -192,6 +404,7 @@ def init_browser(max_retries: int = BROWSER_MAX_RETRIES) -> ChromiumPage:
     log.info("初始化浏览器...", icon="browser")
     
     last_error = None
+    proxy_argument = _select_proxy_argument()
     
     for attempt in range(max_retries):
         try:
@@ -199,61 +412,180 @@ def init_browser(max_retries: int = BROWSER_MAX_RETRIES) -> ChromiumPage:
             if attempt > 0:
                 log.warning(f"浏览器启动重试 ({attempt + 1}/{max_retries})...")
                 cleanup_chrome_processes()
-                time.sleep(BROWSER_RETRY_DELAY)
-            
-            co = ChromiumOptions()
-            co.set_argument('--no-first-run')
-            co.set_argument('--disable-infobars')
-            co.set_argument('--incognito')  # 无痕模式
-            co.set_argument('--disable-gpu')  # 减少资源占用
-            co.set_argument('--disable-dev-shm-usage')  # 避免共享内存问题
-            co.set_argument('--no-sandbox')  # 服务器环境需要
-            co.auto_port()  # 自动分配端口，确保每次都是新实例
-            
-            # 无头模式 (服务器运行)
+                time.sleep(_backoff(attempt - 1, base=BROWSER_RETRY_DELAY))
+
             if BROWSER_HEADLESS:
-                co.set_argument('--headless=new')
-                co.set_argument('--window-size=1920,1080')
                 log.step("启动 Chrome (无头模式)...")
             else:
                 log.step("启动 Chrome (无痕模式)...")
 
-            # 代理设置
-            if PROXY_ENABLED:
-                proxy = get_next_proxy()
-                if proxy:
-                    # DrissionPage 不支持 socks5，只能用 http/https
-                    proxy_type = proxy.get("type", "http")
-                    if proxy_type.startswith("socks"):
-                        log.warning(f"DrissionPage 不支持 {proxy_type} 代理，跳过代理设置")
-                    else:
-                        proxy_url = format_proxy_url(proxy)
-                        if proxy_url:
-                            co.set_argument(f'--proxy-server={proxy_url}')
-                            log.info(f"使用代理: {proxy.get('host')}:{proxy.get('port')}")
-            else:
-                # 无代理时忽略系统代理
-                co.set_argument('--no-proxy-server')
-
-            # 设置超时
-            co.set_timeouts(base=PAGE_LOAD_TIMEOUT, page_load=PAGE_LOAD_TIMEOUT * 2)
-            
-            page = ChromiumPage(co)
+            page = ChromiumPage(_build_options(proxy_argument))
             log.success("浏览器启动成功")
             return page
 
         except Exception as e:
             last_error = e
             log.warning(f"浏览器启动失败 (尝试 {attempt + 1}/{max_retries}): {e}")
-            
+
             # 清理可能的残留
             cleanup_chrome_processes()
+
+            if _is_unrecoverable_browser_error(e):
+                break
+
+            # 代理问题才换下一个代理
+            if PROXY_ENABLED and _is_proxy_error(e):
+                proxy_argument = _select_proxy_argument()
     
     # 所有重试都失败
     log.error(f"浏览器启动失败，已重试 {max_retries} 次: {last_error}")
     raise last_error
 
 
+class BrowserPool:
+    """浏览器实例池 - 复用已启动的 Chrome，避免每个账号都冷启动
+
+    实例归还时关闭多余标签页并清空 Cookie/站点存储；
+    使用次数达到 max_uses 或流程异常时直接关闭，下次按需重新启动。
+    启用多代理轮换时实例不复用 (代理在浏览器启动时绑定)。
+    """
+
+    def __init__(self, max_size: int = BROWSER_POOL_SIZE, max_uses: int = BROWSER_MAX_USES):
+        self.max_size = max_size
+        self._base_size = max_size
+        self._reserved = []  # capacity() 临时申请的实例上限
+        # 配置了多个代理时每个账号都应换一个代理: 实例用完即关闭，下次启动时轮换到下一个代理
+        self.max_uses = 1 if PROXY_ENABLED and len(PROXIES) > 1 else max_uses
+        self._idle = []  # 空闲实例
+        self._uses = {}  # {id(page): 已使用次数}
+        self._created = 0
+        self._closed = False
+        # 空闲实例归还或实例关闭 (腾出新建名额) 时通知等待中的 acquire
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout: float = None, max_retries: int = BROWSER_MAX_RETRIES) -> ChromiumPage:
+        """获取一个浏览器实例 (优先复用空闲实例，未达上限时新建)
+
+        Args:
+            timeout: 实例全部占用时的最长等待时间 (秒)，None 表示一直等待
+            max_retries: 新建实例时的启动重试次数
+
+        Raises:
+            queue.Empty: 等待超时
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.max_size:
+                    self._created += 1
+                    break
+                # 全部占用: 等待实例归还或被关闭，被唤醒后重新判断 (关闭腾出的名额可以新建)
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self._cond.wait(remaining)
+
+        try:
+            page = init_browser(max_retries)
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._uses[id(page)] = 0
+        return page
+
+    @contextmanager
+    def capacity(self, size: int):
+        """在 with 块内把实例上限临时提高到至少 size (多线程并发任务需要同时持有多个实例)
+
+        退出时恢复原上限: 多出的空闲实例立即关闭，仍被占用的实例归还时关闭。
+        """
+        with self._cond:
+            self._reserved.append(size)
+            self.max_size = max([self._base_size, *self._reserved])
+            self._cond.notify_all()
+        try:
+            yield self
+        finally:
+            with self._cond:
+                self._reserved.remove(size)
+                self.max_size = max([self._base_size, *self._reserved])
+                surplus_count = min(len(self._idle), max(0, self._created - self.max_size))
+                surplus = self._idle[:surplus_count]
+                del self._idle[:surplus_count]
+            for page in surplus:
+                self._discard(page)
+
+    def release(self, page, healthy: bool = True):
+        """归还浏览器实例
+
+        Args:
+            page: 浏览器实例
+            healthy: 本次流程是否正常结束，异常时直接关闭实例
+        """
+        if page is None:
+            return
+
+        with self._cond:
+            uses = self._uses.get(id(page), 0) + 1
+            reusable = (healthy and not self._closed and uses < self.max_uses
+                        and self._created <= self.max_size)
+        if reusable:
+            try:
+                # 只保留当前标签页，并清空上一个账号的状态
+                page.close_tabs(page.tab_id, others=True)
+                reset_browser_state(page)
+                with self._cond:
+                    self._uses[id(page)] = uses
+                    self._idle.append(page)
+                    self._cond.notify()
+                return
+            except Exception as e:
+                log.warning(f"浏览器实例重置失败，关闭实例: {e}")
+
+        self._discard(page)
+
+    def _discard(self, page):
+        """关闭并移除实例 (腾出的名额通知等待者新建)"""
+        with self._cond:
+            self._uses.pop(id(page), None)
+            self._created = max(0, self._created - 1)
+            self._cond.notify()
+        _forget_page_state(page)
+        log.step("关闭浏览器...")
+        try:
+            page.quit()
+        except Exception as e:
+            log.warning(f"浏览器关闭异常: {e}")
+
+    def shutdown(self):
+        """关闭池中所有空闲实例"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for page in idle:
+            self._discard(page)
+
+
+_browser_pool = None
+_browser_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """获取进程内共享的浏览器池 (首次调用时创建，进程退出时关闭)"""
+    global _browser_pool
+    if _browser_pool is None:
+        with _browser_pool_lock:
+            if _browser_pool is None:
+                _browser_pool = BrowserPool()
+                atexit.register(_browser_pool.shutdown)
+    return _browser_pool
+
+
 @contextmanager
 def browser_context(max_retries: int = BROWSER_MAX_RETRIES):
     """浏览器上下文管理器 - 自动管理浏览器生命周期
@@ -262,7 +594,9 @@ def browser_context(max_retries: int = BROWSER_MAX_RETRIES):
         with browser_context() as page:
             page.get("https://example.com")
             # 做一些操作...
-        # 浏览器会自动关闭
+        # 浏览器会自动归还到实例池
+
+    浏览器实例从 BrowserPool 获取，正常结束后归还复用，异常时关闭。
 
     Args:
         max_retries: 浏览器启动最大重试次数
@@ -270,20 +604,17 @@ def browser_context(max_retries: int = BROWSER_MAX_RETRIES):
     Yields:
         ChromiumPage: 浏览器页面实例
     """
-    page = None
+    pool = get_browser_pool()
+    page = pool.acquire(max_retries=max_retries)
+    healthy = False
     try:
-        page = init_browser(max_retries)
         yield page
+        healthy = True
     finally:
-        if page:
-            log.step("关闭浏览器...")
-            try:
-                page.quit()
-            except Exception as e:
-                log.warning(f"浏览器关闭异常: {e}")
-            finally:
-                # 确保清理残留进程
-                cleanup_chrome_processes()
+        pool.release(page, healthy=healthy)
+        if not healthy:
+            # 确保清理残留进程
+            cleanup_chrome_processes()
 
 
 @contextmanager
@@ -315,14 +646,26 @@ def browser_context_with_retry(max_browser_retries: int = 2):
         ctx.cleanup()
 
 
+def _is_browser_failure(error: Exception) -> bool:
+    """流程异常是否由浏览器本身引起 (连接断开/无法连接)，此时需要重启浏览器"""
+    return isinstance(error, (PageDisconnectedError, BrowserConnectError)) or \
+        _is_unrecoverable_browser_error(error)
+
+
 class BrowserRetryContext:
-    """浏览器重试上下文"""
+    """浏览器重试上下文
 
-    def __init__(self, max_retries: int = 2):
+    重试时默认复用当前浏览器 (清空 Cookie/站点存储后重新开始)，
+    只有浏览器本身异常或调用方 force_relaunch() 时才关闭并重新获取实例。
+    """
+
+    def __init__(self, max_retries: int = 2, reuse_browser: bool = True):
         self.max_retries = max_retries
+        self.reuse_browser = reuse_browser
         self.current_attempt = 0
         self.page = None
         self._should_continue = True
+        self._relaunch = False
 
     def attempts(self):
         """生成重试迭代器"""
@@ -335,90 +678,198 @@ class BrowserRetryContext:
             # 非首次尝试时的清理和等待
             if attempt > 0:
                 log.warning(f"重试整体流程 ({attempt + 1}/{self.max_retries})...")
-                self._cleanup_page()
-                cleanup_chrome_processes()
-                time.sleep(2)
-
-            # 初始化浏览器
+                if self.page and self.reuse_browser and not self._relaunch:
+                    try:
+                        reset_browser_state(self.page)
+                    except Exception as e:
+                        log.warning(f"浏览器状态重置失败，重新启动: {e}")
+                        self._relaunch = True
+                if self._relaunch or not self.reuse_browser:
+                    self._cleanup_page()
+                    cleanup_chrome_processes()
+                time.sleep(_backoff(attempt - 1, base=2.0))
+
+            # 从实例池获取浏览器 (复用时沿用当前实例)
             try:
-                self.page = init_browser()
+                if self.page is None:
+                    self._relaunch = False
+                    self.page = get_browser_pool().acquire()
                 yield attempt
             except Exception as e:
                 log.error(f"浏览器初始化失败: {e}")
-                if attempt >= self.max_retries - 1:
+                if attempt >= self.max_retries - 1 or _is_unrecoverable_browser_error(e):
                     raise
 
     def handle_error(self, error: Exception):
         """处理错误，决定是否继续重试"""
         log.error(f"流程异常: {error}")
+        if _is_browser_failure(error):
+            self._relaunch = True
         if self.current_attempt >= self.max_retries - 1:
             self._should_continue = False
         else:
             log.warning("准备重试...")
 
+    def force_relaunch(self):
+        """下次重试时关闭当前浏览器并重新获取实例"""
+        self._relaunch = True
+
     def stop(self):
         """停止重试"""
         self._should_continue = False
 
     def _cleanup_page(self):
-        """清理当前页面"""
+        """关闭当前浏览器实例 (状态不可信，不归还到实例池)"""
         if self.page:
-            try:
-                self.page.quit()
-            except Exception:
-                pass
+            get_browser_pool().release(self.page, healthy=False)
             self.page = None
 
     def cleanup(self):
-        """最终清理"""
+        """最终清理 (浏览器正常的实例归还到实例池)"""
         if self.page:
-            log.step("关闭浏览器...")
-            try:
-                self.page.quit()
-            except Exception:
-                pass
+            get_browser_pool().release(self.page, healthy=not self._relaunch)
             self.page = None
 
 
+# 页面快照: DOM 长度 + 已加载资源数 (网络空闲时不再增长)
+_PAGE_SNAPSHOT_JS = '''
+    const body = document.body;
+    if (!body) return '';
+    return body.childElementCount + ':' + body.innerText.length + ':' +
+           performance.getEntriesByType('resource').length;
+'''
+
+
 def wait_for_page_stable(page, timeout: int = 10, check_interval: float = 0.5) -> bool:
     """等待页面稳定 (页面加载完成且 DOM 不再变化)
-    
+
+    检查间隔从 50ms 开始，页面仍在变化时逐步放大到 check_interval，
+    已经稳定的页面约 150ms 即可返回。
+
     Args:
         page: 浏览器页面对象
         timeout: 超时时间 (秒)
-        check_interval: 检查间隔 (秒)
+        check_interval: 最大检查间隔 (秒)
     
     Returns:
         bool: 是否稳定
     """
     start_time = time.time()
-    last_html_len = 0
+
+    # 等待文档加载完成 (DrissionPage 基于 CDP 事件，加载完成即返回)
+    try:
+        page.wait.doc_loaded(timeout=timeout, raise_err=False)
+    except Exception:
+        pass
+
+    # SPA 在 load 之后仍会继续渲染/请求，确认 DOM 和网络请求都不再变化
+    # (在浏览器端计算元素数、文本长度和已加载资源数，不把整页 HTML 传回 Python)
+    last_snapshot = None
     stable_count = 0
-    
+    interval = 0.05
     while time.time() - start_time < timeout:
         try:
-            # 检查浏览器标签页是否还在加载（favicon 旋转动画）
-            ready_state = page.run_js('return document.readyState', timeout=2)
-            if ready_state != 'complete':
-                stable_count = 0
-                time.sleep(check_interval)
-                continue
-            
-            current_len = len(page.html)
-            if current_len == last_html_len:
+            snapshot = page.run_js(_PAGE_SNAPSHOT_JS, timeout=2)
+            if snapshot and snapshot == last_snapshot:
                 stable_count += 1
                 if stable_count >= 3:  # 连续 3 次检查都稳定
                     return True
             else:
                 stable_count = 0
-                last_html_len = current_len
-            time.sleep(check_interval)
+                last_snapshot = snapshot
+                interval = min(interval * 1.5, check_interval)
         except Exception:
-            time.sleep(check_interval)
+            pass
+        time.sleep(interval)
     
     return False
 
 
+def _text_any_xpath(texts: tuple, exact: bool = False) -> str:
+    """生成匹配任一文本的 XPath (与 text: 部分匹配 / text= 精确匹配一致)"""
+    if exact:
+        conditions = [f'text()="{t}"' for t in texts]
+    else:
+        conditions = [f'contains(text(), "{t}")' for t in texts]
+    return 'xpath://*[{}]'.format(' or '.join(conditions))
+
+
+# 页面内执行的 JS 均为模块级常量，参数通过 arguments 传入，不在每次调用时拼接脚本
+_TEXT_PRESENT_JS = '''
+    const texts = arguments[0];
+    const css = arguments[1];
+    if (css && document.querySelector(css)) return true;
+    const text = document.body ? document.body.innerText : "";
+    return texts.some(t => text.includes(t));
+'''
+
+
+def any_text_present(page, texts: tuple, css: str = None) -> bool:
+    """页面可见文本中是否包含任一文本 (或存在 css 匹配的元素)
+
+    仅用于判断存在性: 一次 run_js 在浏览器端完成检查，不会像 page.ele 那样等待超时。
+    需要点击元素时仍使用 page.ele 获取元素对象。
+    """
+    try:
+        return bool(page.run_js(_TEXT_PRESENT_JS, list(texts), css, timeout=1))
+    except Exception:
+        return False
+
+
+_CLICK_TEXT_BUTTON_JS = '''
+    const texts = arguments[0];
+    const els = [...document.querySelectorAll("button, a")]
+        .map(el => [el, (el.innerText || "").trim()]).filter(([, text]) => text);
+    for (const t of texts) {
+        const hit = els.find(([, text]) => text.includes(t));
+        if (hit) { hit[0].click(); return true; }
+    }
+    return false;
+'''
+
+
+def click_text_button(page, texts: tuple) -> bool:
+    """点击文本包含任一 texts 的按钮/链接 (一次 run_js 完成查找和点击)
+
+    texts 按优先级排列，前面的文本先匹配；不可见元素的 innerText 为空，不会被点击。
+
+    Returns:
+        bool: 是否找到并点击
+    """
+    try:
+        return bool(page.run_js(_CLICK_TEXT_BUTTON_JS, list(texts), timeout=3))
+    except Exception:
+        return False
+
+
+_ERROR_PAGE_TEXTS = ('糟糕，出错了', 'Something went wrong', 'Operation timed out')
+_ERROR_PAGE_RETRY_XPATH = _text_any_xpath(('重试', 'Retry'))
+
+# 注册流程中的组合定位 (一次查询匹配多个备选，替代逐个 fallback 等待)
+_SIGNUP_BUTTON = ('xpath://*[@data-testid="signup-button"]'
+                  ' | //*[contains(text(), "免费注册")] | //*[contains(text(), "Sign up")]')
+_SIGNUP_OR_LOGIN_BUTTON = _SIGNUP_BUTTON + ' | //*[contains(text(), "登录")]'
+_LOGIN_FORM_CSS = '[data-testid="login-form"]'
+_LOGIN_FORM_TEXTS = ('登录或注册', 'Log in or sign up')
+_PASSWORD_ERROR_TEXTS = ('Incorrect email address or password',)
+_EMAIL_NOT_SUPPORTED_TEXTS = ('The email you provided is not supported',)
+_OTP_LOGIN_BUTTON = _text_any_xpath(('使用一次性验证码登录', 'Log in with a one-time code'), exact=True)
+# 文本包含 "一次性验证码" / "one-time" (不区分大小写) 的按钮，精确文本找不到时使用
+_OTP_BUTTON_ANY = ('xpath://button[contains(normalize-space(.), "一次性验证码") or contains(translate(normalize-space(.), '
+                   '"ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz"), "one-time")]')
+_PASSWORDLESS_OTP_BUTTON = 'css:button[value="passwordless_login_send_otp"], button._inlinePasswordlessLogin'
+# 登录 / 工作空间流程中的组合定位
+_LOGIN_BUTTON_ANY = ('xpath://*[@data-testid="login-button"]'
+                     ' | //*[contains(text(), "登录")] | //*[contains(text(), "Log in")]')
+_WORKSPACE_PAGE_TEXT = _text_any_xpath(('启动工作空间', 'Launch workspace'))
+_WORKSPACE_OPEN_BUTTON = _text_any_xpath(('打开', 'Open'))
+_JOB_SELECTION_TEXT = _text_any_xpath(('你从事哪种工作', 'What kind of work do you do'))
+_NAME_INPUT = 'css:input[name="name"], input[autocomplete="name"]'
+_CODE_INPUT = 'css:input[name="code"], input[placeholder*="代码"]'
+_INVALID_CODE_TEXTS = ('代码不正确', 'incorrect', 'Invalid code')
+_RESEND_EMAIL_TEXTS = ('重新发送电子邮件', 'Resend email', 'resend')
+
+
 def check_and_handle_error_page(page, max_retries: int = 2) -> bool:
     """检测并处理错误页面（如 Operation timed out）
     
@@ -430,18 +881,14 @@ def check_and_handle_error_page(page, max_retries: int = 2) -> bool:
         bool: 是否成功处理（页面恢复正常）
     """
     for attempt in range(max_retries):
-        # 检测错误页面
-        error_text = page.ele('text:糟糕，出错了', timeout=1) or \
-                     page.ele('text:Something went wrong', timeout=1) or \
-                     page.ele('text:Operation timed out', timeout=1)
-        
-        if not error_text:
+        # 检测错误页面 (一次 JS 检查匹配全部提示文本，不等待超时)
+        if not any_text_present(page, _ERROR_PAGE_TEXTS):
             return True  # 没有错误，正常
         
         log.warning(f"检测到错误页面，尝试重试 ({attempt + 1}/{max_retries})...")
         
         # 点击重试按钮
-        retry_btn = page.ele('text:重试', timeout=2) or page.ele('text:Retry', timeout=1)
+        retry_btn = page.ele(_ERROR_PAGE_RETRY_XPATH, timeout=2)
         if retry_btn:
             retry_btn.click()
             time.sleep(3)
@@ -453,8 +900,7 @@ def check_and_handle_error_page(page, max_retries: int = 2) -> bool:
             wait_for_page_stable(page, timeout=8)
     
     # 最后再检查一次
-    error_text = page.ele('text:糟糕，出错了', timeout=1) or page.ele('text:Something went wrong', timeout=1)
-    return error_text is None
+    return not any_text_present(page, _ERROR_PAGE_TEXTS)
 
 
 def wait_for_element(page, selector: str, timeout: int = 10, visible: bool = True):
@@ -470,18 +916,47 @@ def wait_for_element(page, selector: str, timeout: int = 10, visible: bool = Tru
         元素对象或 None
     """
     start_time = time.time()
-    
-    while time.time() - start_time < timeout:
+
+    try:
+        # DrissionPage 内部会持续查找直到超时，无需外层轮询
+        element = page.ele(selector, timeout=timeout)
+        if not element:
+            return None
+        if not visible or element.states.is_displayed:
+            return element
+
+        # 元素已存在但不可见，等待其显示
+        remaining = timeout - (time.time() - start_time)
+        if remaining > 0 and element.wait.displayed(timeout=remaining, raise_err=False):
+            return element
+    except Exception:
+        pass
+
+    return None
+
+
+def wait_until(predicate, timeout: float = 5, interval: float = 0.05) -> bool:
+    """轮询 predicate 直到返回真值或超时 (代替固定时长的 sleep)
+
+    Args:
+        predicate: 无参可调用对象，异常视为 False
+        timeout: 超时时间 (秒)
+        interval: 轮询间隔 (秒)
+
+    Returns:
+        predicate 返回的真值，超时返回 False
+    """
+    deadline = time.time() + timeout
+    while True:
         try:
-            element = page.ele(selector, timeout=1)
-            if element:
-                if not visible or (element.states.is_displayed if hasattr(element, 'states') else True):
-                    return element
+            result = predicate()
+            if result:
+                return result
         except Exception:
             pass
-        time.sleep(0.3)
-    
-    return None
+        if time.time() >= deadline:
+            return False
+        time.sleep(interval)
 
 
 def wait_for_url_change(page, old_url: str, timeout: int = 15, contains: str = None) -> bool:
@@ -497,7 +972,19 @@ def wait_for_url_change(page, old_url: str, timeout: int = 15, contains: str = N
         bool: URL 是否已变化
     """
     start_time = time.time()
-    
+
+    # 优先使用 DrissionPage 的 URL 等待，跳转完成即返回，不必按固定间隔轮询
+    try:
+        if contains:
+            page.wait.url_change(contains, timeout=timeout, raise_err=False)
+        else:
+            page.wait.url_change(old_url, exclude=True, timeout=timeout, raise_err=False)
+        current_url = page.url
+        if current_url != old_url and (contains is None or contains in current_url):
+            return True
+    except Exception:
+        pass
+
     while time.time() - start_time < timeout:
         try:
             current_url = page.url
@@ -511,53 +998,489 @@ def wait_for_url_change(page, old_url: str, timeout: int = 15, contains: str = N
     return False
 
 
-def type_slowly(page, selector_or_element, text, base_delay=None):
-    """缓慢输入文本 (模拟真人输入)
+# 授权页按钮: 可见、可用的 submit 按钮且文本包含允许/授权/继续等关键字 (大小写不敏感)
+_AUTHORIZE_KEYWORDS = ('allow', 'authorize', 'continue', '授权', '允许', '继续', 'accept')
+# 关键字合并为一个正则模式串，页面内用一次 RegExp 匹配 (关键字只在这里维护)
+_AUTHORIZE_PATTERN = '|'.join(re.escape(kw) for kw in _AUTHORIZE_KEYWORDS)
+_CLICK_AUTHORIZE_JS = '''
+    const pattern = new RegExp(arguments[0], 'i');
+    for (const btn of document.querySelectorAll('button[type="submit"]')) {
+        if (btn.disabled) continue;
+        const style = getComputedStyle(btn);
+        if (style.display === 'none' || style.visibility === 'hidden') continue;
+        const text = (btn.innerText || '').trim();
+        if (pattern.test(text)) {
+            btn.click();
+            return text;
+        }
+    }
+    return null;
+'''
+
+
+def click_authorize_button(page) -> str:
+    """在页面内一次 JS 调用完成授权按钮的查找和点击
+
+    Returns:
+        str: 被点击按钮的文本，未找到时返回 None
+    """
+    try:
+        return page.run_js(_CLICK_AUTHORIZE_JS, _AUTHORIZE_PATTERN)
+    except Exception:
+        return None
+
+
+def wait_for_callback(page, timeout: float = 1.5):
+    """等待授权回调 URL (包含 code=) 出现，出现即返回，最多等待 timeout 秒
+
+    Args:
+        page: 浏览器页面对象
+        timeout: 最长等待时间 (秒)
+    """
+    try:
+        page.wait.url_change("code=", timeout=timeout, raise_err=False)
+    except Exception:
+        time.sleep(timeout)
+
+
+class _UrlWatcher:
+    """订阅主框架导航事件 (Page.frameNavigated / Page.navigatedWithinDocument)，在本地保存最新 URL
+
+    授权回调循环中用它代替每轮读取 page.url；事件订阅失败时退回到读取 page.url。
+    传入 request_filter 时还会订阅 Network.requestWillBeSent：匹配的文档请求一发出就记为最新 URL，
+    不必等到页面提交 (回调地址无法访问时也能立即拿到)。
+
+    DrissionPage 的 driver 每个事件只保存一个回调，页面自身的加载状态跟踪也挂在这些事件上，
+    因此订阅时串联原有回调，stop() 时原样恢复。
+    """
+
+    RESYNC_EVERY = 10  # 每隔若干次读取仍向浏览器确认一次 URL，防止漏掉事件
+
+    def __init__(self, page, request_filter=None):
+        self.page = page
+        self._request_filter = request_filter
+        self._driver = None
+        self._originals = {}  # {事件名: 订阅前的回调}
+        self._network_enabled = False  # Network 域是否由本监听器开启 (stop 时关闭)
+        self._urls = queue.Queue()
+        self._latest = None
+        self._reads = 0
+
+    def _subscribe(self, event: str, handler):
+        """挂上事件回调: 先调用订阅前的回调 (如有)，再调用 handler"""
+        original = self._driver.event_handlers.get(event)
+        self._originals[event] = original
+        if original is None:
+            callback = handler
+        else:
+            def callback(**kwargs):
+                try:
+                    original(**kwargs)
+                finally:
+                    handler(**kwargs)
+        self._driver.set_callback(event, callback)
+
+    def _restore_callbacks(self):
+        """恢复订阅前的回调 (原来没有回调的事件会被移除)"""
+        for event, original in self._originals.items():
+            try:
+                self._driver.set_callback(event, original)
+            except Exception:
+                pass
+        self._originals.clear()
+
+    def start(self):
+        """开始订阅导航事件"""
+        try:
+            driver = self.page.driver
+            if not isinstance(getattr(driver, 'event_handlers', None), dict):
+                return self  # 无法读取原有回调时不订阅，避免覆盖页面自身的事件处理
+            self._driver = driver
+            self._subscribe('Page.frameNavigated', self._on_frame_navigated)
+            self._subscribe('Page.navigatedWithinDocument', self._on_navigated_within_document)
+            self._latest = self.page.url
+        except Exception:
+            if self._driver is not None:
+                self._restore_callbacks()
+            self._driver = None
+            return self
+
+        if self._request_filter is not None:
+            try:
+                self.page.run_cdp('Network.enable')
+                self._network_enabled = True
+                self._subscribe('Network.requestWillBeSent', self._on_request_will_be_sent)
+            except Exception:
+                pass
+        return self
+
+    def stop(self):
+        """取消订阅，恢复订阅前的回调，关闭本监听器开启的 Network 域"""
+        if self._driver is not None:
+            self._restore_callbacks()
+            self._driver = None
+        if self._network_enabled:
+            try:
+                self.page.run_cdp('Network.disable')
+            except Exception:
+                pass
+            self._network_enabled = False
+
+    def _on_frame_navigated(self, **kwargs):
+        frame = kwargs.get('frame') or {}
+        if frame.get('parentId'):
+            return  # 只关心主框架
+        # 回调地址无法访问时 url 为错误页，原地址在 unreachableUrl 中
+        url = frame.get('unreachableUrl') or frame.get('url')
+        if url:
+            self._urls.put(url)
+
+    def _on_navigated_within_document(self, **kwargs):
+        if kwargs.get('frameId') == getattr(self.page, 'tab_id', None) and kwargs.get('url'):
+            self._urls.put(kwargs['url'])
+
+    def _on_request_will_be_sent(self, **kwargs):
+        if kwargs.get('type') != 'Document':
+            return
+        url = (kwargs.get('request') or {}).get('url')
+        if url and self._request_filter(url):
+            self._urls.put(url)
+
+    def _drain(self):
+        while True:
+            try:
+                self._latest = self._urls.get_nowait()
+            except queue.Empty:
+                return
+
+    def current_url(self) -> str:
+        """当前 URL (订阅生效时直接返回本地记录)"""
+        self._reads += 1
+        if self._driver is None or self._latest is None or self._reads % self.RESYNC_EVERY == 0:
+            self._latest = self.page.url
+            return self._latest
+        self._drain()
+        return self._latest
+
+    def wait(self, timeout: float):
+        """等待下一次导航，最多 timeout 秒 (未订阅时等待授权回调 URL 出现)"""
+        if self._driver is None:
+            wait_for_callback(self.page, timeout=timeout)
+            return
+        try:
+            self._latest = self._urls.get(timeout=timeout)
+        except queue.Empty:
+            return
+        self._drain()
+
+    def wait_change(self, old_url: str, timeout: float) -> bool:
+        """等待 URL 变为不同于 old_url 的地址，最多 timeout 秒 (未订阅时退回 wait_for_url_change)
+
+        Returns:
+            bool: URL 是否已变化
+        """
+        if self._driver is None:
+            return wait_for_url_change(self.page, old_url, timeout=timeout)
+        deadline = time.time() + timeout
+        while True:
+            self._drain()
+            if self._latest != old_url:
+                return True
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            try:
+                self._latest = self._urls.get(timeout=remaining)
+            except queue.Empty:
+                return False
+
+
+# 授权回调等待中表示授权已失败的 URL 特征
+_AUTH_ERROR_URL_MARKERS = ('/error', 'access_denied', 'login_required', 'invalid_request')
+MAX_IDLE_CALLBACK_POLLS = 15  # 同一 URL 连续轮询次数上限 (约 25s)
+
+
+def _callback_poll_delay(poll: int) -> float:
+    """授权回调轮询间隔: 从 0.3s 开始指数增长，最多 2s (±30% 抖动)"""
+    return _backoff(min(poll, 3), base=0.3, cap=2.0, jitter=0.3)
+
+
+def _cached_element(page, selector: str, url: str = None):
+    """取出缓存的元素 (URL 未变化且元素仍在 DOM 中时才有效)
+
+    已解析元素存放在页面级缓存中: {selector: (url, element)}，元素失效时再重新查找。
+    """
+    elements = _page_state(page)["elements"]
+    cached = elements.get(selector)
+    if cached is None:
+        return None
+    cached_url, element = cached
+    try:
+        valid = (url is None or cached_url == url) and element.states.is_alive
+    except Exception:
+        valid = False
+    if not valid:
+        elements.pop(selector, None)
+        return None
+    return element
+
+
+def _resolve_element(page, selector: str, timeout: int = 10, refresh: bool = False):
+    """按选择器获取元素，命中缓存 (URL 未变化且元素仍有效) 时不再查询 DOM
+
+    Args:
+        page: 浏览器页面对象
+        selector: 元素选择器
+        timeout: 查找超时 (秒)
+        refresh: 是否忽略缓存强制重新查找 (元素失效时使用)
+
+    Returns:
+        元素对象或 None
+    """
+    url = page.url
+    if not refresh:
+        # 与 get_el 相同: 只复用同一 URL 下仍在 DOM 中的元素
+        element = _cached_element(page, selector, url)
+        if element is not None:
+            return element
+
+    elements = _page_state(page)["elements"]
+    element = page.ele(selector, timeout=timeout)
+    if element:
+        elements[selector] = (url, element)
+    else:
+        elements.pop(selector, None)
+        element = None
+    return element
+
+
+def get_el(page, selector: str, timeout: int = 10):
+    """获取可见元素，同一 URL 下复用之前找到且仍有效的元素
+
+    用于验证码重试等循环中反复查找相同选择器的场景；URL 变化后自动重新查找。
+    """
+    url = page.url
+    element = _cached_element(page, selector, url)
+    if element is not None:
+        return element
+
+    element = wait_for_element(page, selector, timeout=timeout)
+    if element:
+        _page_state(page)["elements"][selector] = (url, element)
+    return element
+
+
+def type_slowly(page, selector_or_element, text, base_delay=None, stealth=True):
+    """输入文本 (一次性写入整段文本，stealth 模式下先模拟一次思考停顿)
 
     Args:
         page: 浏览器页面对象 (用于重新获取元素)
         selector_or_element: CSS 选择器字符串或元素对象
         text: 要输入的文本
-        base_delay: 基础延迟 (秒)，默认使用 TYPING_DELAY
+        base_delay: 基础延迟 (秒)，默认使用 TYPING_DELAY；stealth 模式下输入前停顿 2~4 倍 base_delay
+        stealth: 是否在输入前模拟停顿 (仅 SAFE_MODE 下生效)；验证码、姓名等字段传 False
     """
     if base_delay is None:
         base_delay = TYPING_DELAY
-    
-    # 获取元素 (如果传入的是选择器则查找，否则直接使用)
-    if isinstance(selector_or_element, str):
-        element = page.ele(selector_or_element, timeout=10)
+
+    # 获取元素 (选择器只解析一次，元素失效时才重新查找)
+    selector = selector_or_element if isinstance(selector_or_element, str) else None
+    if selector:
+        element = _resolve_element(page, selector, timeout=10, refresh=True)
     else:
         element = selector_or_element
 
     if not text:
         return
 
-    # 对于短文本（如验证码），直接一次性输入，速度更快
-    if len(text) <= 8:
+    if stealth and SAFE_MODE:
+        time.sleep(base_delay * random.uniform(2, 4))
+
+    # 整段文本一次输入 (一次 CDP 调用)，不再逐字符输入
+    try:
         element.input(text, clear=True)
-        return
+    except (ElementLostError, ContextLostError):
+        if not selector:
+            raise
+        element = _resolve_element(page, selector, timeout=5, refresh=True)
+        element.input(text, clear=True)
+
+
+_FAST_FILL_JS = '''
+    const el = document.querySelector(arguments[0]);
+    if (!(el instanceof HTMLInputElement)) return false;
+    el.focus();
+    // 使用原生 setter 赋值，React 受控输入框才能感知到变化
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    setter.call(el, arguments[1]);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    return el.value === arguments[1];
+'''
+
+
+def fast_fill(page, selector: str, text: str):
+    """通过一次 JS 调用写入输入框并触发 input/change 事件
+
+    只支持 css: 选择器；找不到输入框或页面未接受该值时回退到 type_slowly。
+
+    Args:
+        page: 浏览器页面对象
+        selector: css: 选择器
+        text: 要输入的文本
+    """
+    if selector.startswith('css:') and text:
+        # 等待输入框渲染 (与 type_slowly 一致，元素找不到时交给回退路径处理)
+        if _resolve_element(page, selector, timeout=10, refresh=True):
+            try:
+                if page.run_js(_FAST_FILL_JS, selector[4:], text):
+                    return
+            except Exception:
+                pass
+    type_slowly(page, selector, text, stealth=False)
+
+
+_CLICK_SUBMIT_JS = '''
+    const btn = document.querySelector('button[type="submit"]:not([disabled])');
+    if (!btn) return false;
+    btn.click();
+    return true;
+'''
+
+
+def click_submit(page, timeout: int = 10) -> bool:
+    """点击提交按钮: 先用一次 JS 调用查找并点击，找不到时再等待按钮出现后点击一次
+
+    Returns:
+        bool: 是否已点击
+    """
+    try:
+        if page.run_js(_CLICK_SUBMIT_JS):
+            return True
+    except Exception:
+        pass
+
+    try:
+        submit_btn = get_el(page, _SUBMIT_BUTTON, timeout=timeout)
+        if submit_btn:
+            submit_btn.click()
+            return True
+    except Exception:
+        pass
+    return False
+
+
+def submit_with_enter(page, selector: str, old_url: str, timeout: float = 3, fallback_timeout: float = 10) -> bool:
+    """在已输入的输入框上按回车提交表单，URL 未变化时再点击提交按钮
+
+    Args:
+        page: 浏览器页面对象
+        selector: 输入框选择器 (与 type_slowly 使用的一致，可直接命中元素缓存)
+        old_url: 提交前的 URL
+        timeout: 回车后等待跳转的时间 (秒)
+        fallback_timeout: 点击提交按钮后等待跳转的时间 (秒)
+
+    Returns:
+        bool: URL 是否已变化
+    """
+    element = _resolve_element(page, selector, timeout=1)
+    if element:
+        try:
+            element.input(Keys.ENTER, clear=False)
+            if wait_for_url_change(page, old_url, timeout=timeout):
+                return True
+        except Exception:
+            pass
+
+    # 回车未触发跳转，回退到点击提交按钮
+    continue_btn = wait_for_element(page, _SUBMIT_BUTTON, timeout=5)
+    if continue_btn and page.url == old_url:
+        continue_btn.click()
+        return wait_for_url_change(page, old_url, timeout=fallback_timeout)
+    return page.url != old_url
+
+
+# 批量写入生日字段，触发 React 能识别的 input/change 事件；任一字段不是 input 时返回 false
+_FILL_BIRTHDAY_JS = '''
+    const fields = [['year', arguments[0]], ['month', arguments[1]], ['day', arguments[2]]]
+        .map(([type, value]) => [document.querySelector(`[data-type="${type}"]`), value]);
+    if (!fields.every(([el]) => el instanceof HTMLInputElement)) return false;
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    for (const [el, value] of fields) {
+        el.focus();
+        setter.call(el, value);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    return true;
+'''
+
+# 读取年份输入框当前值，用于确认 JS 写入已被页面接受
+_BIRTHDAY_YEAR_VALUE_JS = '''
+    const el = document.querySelector('[data-type="year"]');
+    return el ? String(el.value || el.textContent || '') : '';
+'''
+
+
+def _birthday_year_filled(page, year) -> bool:
+    """年份输入框的值是否已是目标年份"""
+    try:
+        return str(year) in (page.run_js(_BIRTHDAY_YEAR_VALUE_JS) or '')
+    except Exception:
+        return False
+
+
+def fill_birthday(page, birthday: dict):
+    """填写生日 (年/月/日 三个输入框)
 
-    # 长文本使用逐字符输入
-    element.input(text[0], clear=True)
-    time.sleep(random.uniform(0.1, 0.2))
+    Args:
+        page: 浏览器页面对象
+        birthday: {"year": ..., "month": ..., "day": ...}
+    """
+    # 等待年份输入框渲染后，一次 JS 调用写入三个字段
+    if _resolve_element(page, _YEAR_INPUT, timeout=10, refresh=True):
+        try:
+            if page.run_js(_FILL_BIRTHDAY_JS, birthday['year'], birthday['month'], birthday['day']) \
+                    and _birthday_year_filled(page, birthday['year']):
+                return
+        except Exception:
+            pass
 
-    # 逐个输入剩余字符，不重新获取元素
-    for char in text[1:]:
-        element.input(char, clear=False)
-        # 随机延迟
-        actual_delay = base_delay * random.uniform(0.5, 1.2)
-        if char in ' @._-':
-            actual_delay *= 1.3
-        time.sleep(actual_delay)
+    # 非 input 元素 (如 spinbutton) 无法直接赋值，逐个输入
+    fields = (
+        (_YEAR_INPUT, birthday['year'], 10),
+        (_MONTH_INPUT, birthday['month'], 5),
+        (_DAY_INPUT, birthday['day'], 5),
+    )
+    for selector, value, timeout in fields:
+        element = _resolve_element(page, selector, timeout=timeout, refresh=True)
+        if not element:
+            continue
+        try:
+            element.click()
+            element.input(value, clear=True)
+        except (ElementLostError, ContextLostError):
+            # 输入框被重新渲染，重新获取一次
+            element = _resolve_element(page, selector, timeout=timeout, refresh=True)
+            if not element:
+                continue
+            element.click()
+            element.input(value, clear=True)
+        # 等待输入框的值更新后再填写下一个字段
+        wait_until(lambda: str(value) in (element.attr('value') or element.text or ''), timeout=1)
 
 
 def human_delay(min_sec: float = None, max_sec: float = None):
-    """模拟人类操作间隔
-    
+    """模拟人类操作间隔 (非 SAFE_MODE 下不等待)
+
+    只用于页面上的首个操作前；提交后会等待 URL 变化的操作不需要再额外停顿。
+
     Args:
         min_sec: 最小延迟 (秒)，默认使用 ACTION_DELAY[0]
         max_sec: 最大延迟 (秒)，默认使用 ACTION_DELAY[1]
     """
+    if not SAFE_MODE:
+        return
     if min_sec is None:
         min_sec = ACTION_DELAY[0]
     if max_sec is None:
@@ -565,30 +1488,31 @@ def human_delay(min_sec: float = None, max_sec: float = None):
     time.sleep(random.uniform(min_sec, max_sec))
 
 
-def check_and_handle_error(page, max_retries=5) -> bool:
-    """检查并处理页面错误 (带自动重试)"""
-    for attempt in range(max_retries):
-        try:
-            page_source = page.html.lower()
-            error_keywords = ['出错', 'error', 'timed out', 'operation timeout', 'route error', 'invalid content']
-            has_error = any(keyword in page_source for keyword in error_keywords)
+def check_and_handle_error(page, wait_time: float = 5) -> bool:
+    """检查并处理页面错误 (单次检查，重试由调用方循环负责)
 
-            if has_error:
-                try:
-                    retry_btn = page.ele('css:button[data-dd-action-name="Try again"]', timeout=2)
-                    if retry_btn:
-                        log.warning(f"检测到错误页面，点击重试 ({attempt + 1}/{max_retries})...")
-                        retry_btn.click()
-                        wait_time = 3 + attempt  # 递增等待，但减少基础时间
-                        time.sleep(wait_time)
-                        return True
-                except Exception:
-                    time.sleep(1)
-                    continue
+    Args:
+        page: 浏览器页面对象
+        wait_time: 点击重试后等待页面恢复的时间 (秒)
+
+    Returns:
+        bool: 是否检测到错误并点击了重试
+    """
+    try:
+        # 先查重试按钮，没有按钮就无需读取整页 HTML
+        retry_btn = page.ele(_RETRY_BUTTON, timeout=0.5)
+        if not retry_btn:
             return False
-        except Exception:
+
+        if not _ERROR_PAGE_RE.search(page.html):
             return False
-    return False
+
+        log.warning("检测到错误页面，点击重试...")
+        retry_btn.click()
+        time.sleep(wait_time * random.uniform(0.75, 1.25))
+        return True
+    except Exception:
+        return False
 
 
 def retry_on_page_refresh(func):
@@ -603,47 +1527,296 @@ def retry_on_page_refresh(func):
                 if '页面被刷新' in error_msg or 'page refresh' in error_msg or 'stale' in error_msg:
                     if attempt < max_retries - 1:
                         log.warning(f"页面刷新，重试操作 ({attempt + 1}/{max_retries})...")
-                        time.sleep(1)
+                        time.sleep(_backoff(attempt, base=0.5, cap=4.0))
                         continue
                 raise
         return None
     return wrapper
 
 
+# 登录状态缓存: 页面级缓存 login_ok_at 记录上次确认已登录的时间
+LOGIN_CACHE_TTL = 5  # 已登录结果缓存时间 (秒)
+SESSION_COOKIE_PREFIX = "__Secure-next-auth.session-token"
+
+
+def _has_session_cookie(page) -> bool:
+    """检查当前页面是否带有 ChatGPT 会话 Cookie (无网络请求)"""
+    try:
+        cookies = page.cookies(all_domains=False)
+    except Exception:
+        return True  # 读取 Cookie 失败时不做判断，交给 API 检测
+    return any(str(c.get("name", "")).startswith(SESSION_COOKIE_PREFIX) for c in cookies)
+
+
+_LOGIN_PROBE_JS = '''
+    return Promise.race([
+        fetch('/api/auth/session', {
+            method: 'GET',
+            credentials: 'include'
+        })
+        .then(r => r.json())
+        .then(d => d && d.user && d.accessToken ? JSON.stringify({email: d.user.email || ''}) : '')
+        .catch(e => ''),
+        new Promise((_, reject) => setTimeout(() => reject('timeout'), arguments[0]))
+    ]).catch(() => '');
+'''
+
+
 def is_logged_in(page, timeout: int = 5) -> bool:
     """检测是否已登录 ChatGPT (通过 API 请求判断)
 
     通过请求 /api/auth/session 接口判断:
     - 已登录: 返回包含 user 字段的 JSON
     - 未登录: 返回 {}
+
+    没有会话 Cookie 时直接返回 False；已登录结果缓存 LOGIN_CACHE_TTL 秒。
     """
+    state = _page_state(page)
+    cached_at = state.get("login_ok_at")
+    if cached_at and time.time() - cached_at < LOGIN_CACHE_TTL:
+        return True
+
+    if not _has_session_cookie(page):
+        state.pop("login_ok_at", None)
+        return False
+
     try:
         # 使用 JavaScript 请求 session API，设置超时
-        result = page.run_js(f'''
-            return Promise.race([
-                fetch('/api/auth/session', {{
-                    method: 'GET',
-                    credentials: 'include'
-                }})
-                .then(r => r.json())
-                .then(data => JSON.stringify(data))
-                .catch(e => '{{}}'),
-                new Promise((_, reject) => setTimeout(() => reject('timeout'), {timeout * 1000}))
-            ]).catch(() => '{{}}');
-        ''', timeout=timeout + 2)
-
-        if result and result != '{}':
-            import json
-            data = json.loads(result)
-            if data.get('user') and data.get('accessToken'):
-                log.success(f"已登录: {data['user'].get('email', 'unknown')}")
-                return True
+        result = page.run_js(_LOGIN_PROBE_JS, timeout * 1000, timeout=timeout + 2)
+
+        # 浏览器端只返回登录邮箱，未登录时返回空字符串
+        if result:
+            email = json.loads(result).get('email') or 'unknown'
+            log.success(f"已登录: {email}")
+            state["login_ok_at"] = time.time()
+            return True
+        state.pop("login_ok_at", None)
         return False
     except Exception as e:
         log.warning(f"登录检测异常: {e}")
         return False
 
 
+LOGIN_PROBE_TTL = 3  # 同一 URL 下登录检测结果 (含未登录) 的复用时间 (秒)
+
+
+def _is_logged_in_cached(page, url: str = None) -> bool:
+    """带短时缓存的 is_logged_in，注册流程在同一页面反复判断时复用上次结果
+
+    URL 未变化且距上次检测不足 LOGIN_PROBE_TTL 秒时直接返回上次结果，
+    避免步骤循环停留在 chatgpt.com 时重复发起 session 请求。
+    """
+    if url is None:
+        url = page.url
+    state = _page_state(page)
+    cached = state.get("login_probe")  # (url, 检测时间, 结果)
+    if cached and cached[0] == url and time.time() - cached[1] < LOGIN_PROBE_TTL:
+        return cached[2]
+
+    result = is_logged_in(page)
+    state["login_probe"] = (url, time.time(), result)
+    return result
+
+
+# 注册步骤处理结果
+STEP_NEXT = "next"      # 已处理，继续下一轮
+STEP_DONE = "done"      # 到达验证码/补充信息页面，结束步骤循环
+STEP_FAILED = "failed"  # 无法继续，注册失败
+
+
+@functools.lru_cache(maxsize=512)
+def _url_path(url: str) -> str:
+    """提取 URL 路径 (去掉末尾 /)，用于注册步骤分派"""
+    return urlsplit(url).path.rstrip("/")
+
+
+def _register_step_email(page, state: dict, current_url: str) -> str:
+    """注册步骤: 输入邮箱 (log-in-or-create-account 页面)"""
+    log.step("等待邮箱输入框...")
+    email_input = wait_for_element(page, _EMAIL_INPUT, timeout=15)
+    if not email_input:
+        log.error("无法找到邮箱输入框")
+        return STEP_FAILED
+
+    human_delay()  # 模拟人类思考时间
+    log.step("输入邮箱...")
+    fast_fill(page, _EMAIL_INPUT, state["email"])
+    log.success("邮箱已输入")
+
+    # 回车提交 (未跳转时点击继续)
+    log.step("点击继续...")
+    submit_with_enter(page, _EMAIL_INPUT, current_url)
+    return STEP_NEXT
+
+
+def _switch_to_otp_login(page, old_url: str, timeout: float = 1) -> bool:
+    """出现密码错误提示时改用一次性验证码登录，返回是否已切换
+
+    Args:
+        timeout: 等待密码错误提示出现的最长时间 (秒)
+    """
+    try:
+        if wait_until(lambda: any_text_present(page, _PASSWORD_ERROR_TEXTS), timeout=timeout):
+            log.warning("密码错误，尝试使用一次性验证码登录...")
+            otp_btn = wait_for_element(page, _OTP_LOGIN_BUTTON, timeout=3)
+            if otp_btn:
+                otp_btn.click()
+                wait_for_url_change(page, old_url, timeout=10)
+                return True
+    except Exception:
+        pass
+    return False
+
+
+def _register_step_password(page, state: dict, current_url: str) -> str:
+    """注册步骤: 输入密码 (log-in/password 或 create-account/password 页面)"""
+    # 先检查是否有密码错误提示，如果有则使用一次性验证码登录
+    if _switch_to_otp_login(page, current_url):
+        return STEP_NEXT
+
+    # 检查密码框是否已有内容（避免重复输入）
+    password_input = wait_for_element(page, _PASSWORD_INPUT, timeout=5)
+    if not password_input:
+        log.error("无法找到密码输入框")
+        return STEP_FAILED
+
+    # 检查是否已输入密码
+    try:
+        current_value = password_input.attr('value') or ''
+        if len(current_value) > 0:
+            log.info("密码已输入，点击继续...")
+            continue_btn = wait_for_element(page, _SUBMIT_BUTTON, timeout=5)
+            if continue_btn:
+                continue_btn.click()
+                wait_for_url_change(page, current_url, timeout=10)
+            return STEP_NEXT
+    except Exception:
+        pass
+
+    log.step("等待密码输入框...")
+    human_delay()  # 模拟人类思考时间
+    log.step("输入密码...")
+    fast_fill(page, _PASSWORD_INPUT, state["password"])
+    log.success("密码已输入")
+
+    # 回车提交 (未跳转时点击继续)
+    log.step("点击继续...")
+    # 新账号提交密码后会发送验证码邮件，后台提前开始收取
+    if state["code_future"] is None and "create-account/password" in current_url:
+        state["code_future"] = _code_executor.submit(unified_get_verification_code, state["email"])
+    # 等待页面跳转，未跳转时检测是否密码错误
+    if submit_with_enter(page, _PASSWORD_INPUT, current_url, timeout=2, fallback_timeout=2):
+        return STEP_NEXT
+
+    if not _switch_to_otp_login(page, current_url):
+        wait_for_url_change(page, current_url, timeout=10)
+    return STEP_NEXT
+
+
+def _register_step_done(page, state: dict, current_url: str) -> str:
+    """注册步骤: 验证码页面 / 姓名年龄页面，交给步骤循环之后的流程处理"""
+    return STEP_DONE
+
+
+# auth.openai.com 路径 -> 注册步骤处理函数
+_REGISTER_STEP_HANDLERS = {
+    "/log-in-or-create-account": _register_step_email,
+    "/log-in/password": _register_step_password,
+    "/create-account/password": _register_step_password,
+    "/email-verification": _register_step_done,
+    "/about-you": _register_step_done,
+}
+
+
+# 邮箱验证码校验接口 (page.listen 按 URL 片段匹配)
+_CODE_VALIDATE_API = 'email-otp/validate'
+
+
+def _submit_code_and_check(page, click) -> bool:
+    """提交验证码，返回验证码是否被拒绝
+
+    优先监听校验接口的响应 (非 2xx 即为验证码错误)，不必等待页面渲染错误提示；
+    未捕获到响应时退回到等待跳转或错误提示出现。
+
+    Args:
+        page: 浏览器页面对象
+        click: 执行提交的无参函数
+    """
+    old_url = page.url
+    listening = False
+    try:
+        page.listen.start(_CODE_VALIDATE_API)
+        listening = True
+    except Exception:
+        pass
+
+    try:
+        click()
+        if listening:
+            packet = page.listen.wait(timeout=5)
+            if packet and packet.response is not None and packet.response.status:
+                return not 200 <= packet.response.status < 300
+    except Exception:
+        pass
+    finally:
+        if listening:
+            try:
+                page.listen.stop()
+            except Exception:
+                pass
+
+    wait_until(lambda: page.url != old_url or any_text_present(page, _INVALID_CODE_TEXTS), timeout=5)
+    return any_text_present(page, _INVALID_CODE_TEXTS)
+
+
+def _fill_about_you(page, name_timeout: int = 10):
+    """填写 about-you 页面 (随机姓名 + 生日) 并提交，等待提交结果
+
+    Args:
+        page: 浏览器页面对象
+        name_timeout: 等待姓名输入框的超时时间 (秒)
+
+    Returns:
+        "blacklisted" / "success" / "navigated"，超时未变化时返回 False
+    """
+    # 输入姓名 (随机外国名字)
+    random_name = get_random_name()
+    log.step(f"输入姓名: {random_name}")
+    wait_for_element(page, _NAME_INPUT, timeout=name_timeout)
+    fast_fill(page, _NAME_INPUT, random_name)
+
+    # 输入生日 (随机 2000-2005)
+    birthday = get_random_birthday()
+    log.step(f"输入生日: {birthday['year']}/{birthday['month']}/{birthday['day']}")
+    fill_birthday(page, birthday)
+    log.success("生日已输入")
+
+    # 最终提交
+    log.step("点击最终提交...")
+    old_url = page.url
+    click_submit(page)
+
+    # 同时等待跳转和 "email not supported" 提示，先出现的为准
+    outcome = wait_until(lambda: _final_submit_outcome(page, old_url), timeout=5)
+    if outcome != "success" and outcome != "blacklisted":
+        # 未跳转或跳转到其他 auth 页面时，提示可能稍后才渲染，再等待一会
+        if wait_until(lambda: any_text_present(page, _EMAIL_NOT_SUPPORTED_TEXTS), timeout=2):
+            return "blacklisted"
+    return outcome
+
+
+def _final_submit_outcome(page, old_url: str):
+    """判断最终提交后的结果: "blacklisted" / "success" / "navigated"，尚无结果时返回 None"""
+    if any_text_present(page, _EMAIL_NOT_SUPPORTED_TEXTS):
+        return "blacklisted"
+    current_url = page.url
+    if "chatgpt.com" in current_url and "auth.openai.com" not in current_url:
+        return "success"
+    if current_url != old_url:
+        return "navigated"
+    return None
+
+
 def register_openai_account(page, email: str, password: str) -> bool:
     """使用浏览器注册 OpenAI 账号
 
@@ -675,10 +1848,7 @@ def register_openai_account(page, email: str, password: str) -> bool:
             log.info("已跳转到认证页面")
         else:
             # 在 chatgpt.com，检查是否有注册按钮
-            page_ok = page.ele('css:[data-testid="signup-button"]', timeout=1) or \
-                      page.ele('text:免费注册', timeout=1) or \
-                      page.ele('text:Sign up', timeout=1) or \
-                      page.ele('text:登录', timeout=1)  # 也可能显示登录按钮
+            page_ok = page.ele(_SIGNUP_OR_LOGIN_BUTTON, timeout=1)  # 也可能显示登录按钮
             if not page_ok:
                 log.warning("页面加载异常，3秒后刷新...")
                 time.sleep(3)
@@ -688,7 +1858,7 @@ def register_openai_account(page, email: str, password: str) -> bool:
 
         # 检测是否已登录 (通过 API 判断)
         try:
-            if is_logged_in(page):
+            if _is_logged_in_cached(page):
                 log.success("检测到已登录，跳过注册步骤")
                 return True
         except Exception:
@@ -696,27 +1866,17 @@ def register_openai_account(page, email: str, password: str) -> bool:
 
         # 点击"免费注册"按钮
         log.step("点击免费注册...")
-        signup_btn = wait_for_element(page, 'css:[data-testid="signup-button"]', timeout=5)
-        if not signup_btn:
-            signup_btn = wait_for_element(page, 'text:免费注册', timeout=3)
-        if not signup_btn:
-            signup_btn = wait_for_element(page, 'text:Sign up', timeout=3)
+        signup_btn = wait_for_element(page, _SIGNUP_BUTTON, timeout=5)
         if signup_btn:
             old_url = page.url
             signup_btn.click()
-            # 等待 URL 变化或弹窗/输入框出现 (最多3秒快速检测)
-            for _ in range(6):
+            # 等待弹窗或认证页面中的邮箱输入框出现 (最多3秒)
+            try:
+                page.wait.ele_displayed(_EMAIL_INPUT_ANY, timeout=3, raise_err=False)
+            except Exception:
                 time.sleep(0.5)
-                if page.url != old_url:
-                    log_url_change(page, old_url, "点击注册按钮")
-                    break
-                # 检测弹窗中的邮箱输入框
-                try:
-                    email_input = page.ele('css:input[type="email"], input[name="email"]', timeout=1)
-                    if email_input and email_input.states.is_displayed:
-                        break
-                except Exception:
-                    pass
+            if page.url != old_url:
+                log_url_change(page, old_url, "点击注册按钮")
 
         current_url = page.url
         log_current_url(page, "注册按钮点击后")
@@ -726,11 +1886,7 @@ def register_openai_account(page, email: str, password: str) -> bool:
             log.step("尝试在当前弹窗中输入邮箱...")
             
             # 快速检查弹窗是否正常加载（包含登录表单）
-            login_form = wait_for_element(page, 'css:[data-testid="login-form"]', timeout=1)
-            if not login_form:
-                login_form = page.ele('text:登录或注册', timeout=1) or page.ele('text:Log in or sign up', timeout=1)
-            
-            if not login_form:
+            if not wait_until(lambda: any_text_present(page, _LOGIN_FORM_TEXTS, css=_LOGIN_FORM_CSS), timeout=1):
                 # 弹窗内容异常，关闭并刷新页面重试
                 log.warning("弹窗内容异常，刷新页面重试...")
                 close_btn = page.ele('css:button[aria-label="Close"], button[aria-label="关闭"]', timeout=1)
@@ -747,15 +1903,12 @@ def register_openai_account(page, email: str, password: str) -> bool:
                 
                 # 重新点击注册按钮
                 log.step("重新点击免费注册...")
-                signup_btn = wait_for_element(page, 'css:[data-testid="signup-button"]', timeout=5) or \
-                             wait_for_element(page, 'text:免费注册', timeout=3)
+                signup_btn = wait_for_element(page, _SIGNUP_BUTTON, timeout=5)
                 if signup_btn:
                     signup_btn.click()
                     time.sleep(2)
                     # 再次检查弹窗
-                    login_form = page.ele('css:[data-testid="login-form"]', timeout=3) or \
-                                 page.ele('text:登录或注册', timeout=2)
-                    if not login_form:
+                    if not wait_until(lambda: any_text_present(page, _LOGIN_FORM_TEXTS, css=_LOGIN_FORM_CSS), timeout=3):
                         log.error("重试后弹窗仍然异常，跳过此账号")
                         return False
                 else:
@@ -763,146 +1916,55 @@ def register_openai_account(page, email: str, password: str) -> bool:
                     return False
             
             # 尝试输入邮箱
-            email_input = wait_for_element(page, 'css:input[type="email"], input[name="email"], input[id="email"]', timeout=5)
+            email_input = wait_for_element(page, _EMAIL_INPUT_ANY, timeout=5)
             if email_input:
                 human_delay()
-                type_slowly(page, 'css:input[type="email"], input[name="email"], input[id="email"]', email)
+                fast_fill(page, _EMAIL_INPUT_ANY, email)
                 log.success("邮箱已输入")
 
                 # 点击继续
-                human_delay(0.5, 1.0)
                 log.step("点击继续...")
-                continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
+                continue_btn = wait_for_element(page, _SUBMIT_BUTTON, timeout=5)
                 if continue_btn:
                     old_url = page.url
                     continue_btn.click()
                     wait_for_url_change(page, old_url, timeout=10, contains="/password")
 
-        # === 使用循环处理整个注册流程 ===
+        # === 使用循环处理整个注册流程 (按 URL 路径分派到各步骤) ===
+        state = {"email": email, "password": password, "code_future": None}
         max_steps = 10  # 防止无限循环
         for step in range(max_steps):
             current_url = page.url
-            log_current_url(page, f"注册流程步骤 {step + 1}")
+            log_current_url(page, f"注册流程步骤 {step + 1}", url=current_url)
 
             # 如果在 chatgpt.com 且已登录，注册成功
             if "chatgpt.com" in current_url and "auth.openai.com" not in current_url:
                 try:
-                    if is_logged_in(page):
+                    if _is_logged_in_cached(page):
                         log.success("检测到已登录，账号已注册成功")
                         return True
                 except Exception:
                     pass
 
-            # 步骤1: 输入邮箱 (在 log-in-or-create-account 页面)
-            if "auth.openai.com/log-in-or-create-account" in current_url:
-                log.step("等待邮箱输入框...")
-                email_input = wait_for_element(page, 'css:input[type="email"]', timeout=15)
-                if not email_input:
-                    log.error("无法找到邮箱输入框")
-                    return False
-
-                human_delay()  # 模拟人类思考时间
-                log.step("输入邮箱...")
-                type_slowly(page, 'css:input[type="email"]', email)
-                log.success("邮箱已输入")
-
-                # 点击继续
-                human_delay(0.5, 1.2)
-                log.step("点击继续...")
-                continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
-                if continue_btn:
-                    old_url = page.url
-                    continue_btn.click()
-                    wait_for_url_change(page, old_url, timeout=10)
-                continue
-
-            # 步骤2: 输入密码 (在密码页面: log-in/password 或 create-account/password)
-            if "auth.openai.com/log-in/password" in current_url or "auth.openai.com/create-account/password" in current_url:
-                # 先检查是否有密码错误提示，如果有则使用一次性验证码登录
-                try:
-                    error_text = page.ele('text:Incorrect email address or password', timeout=1)
-                    if error_text and error_text.states.is_displayed:
-                        log.warning("密码错误，尝试使用一次性验证码登录...")
-                        otp_btn = wait_for_element(page, 'text=使用一次性验证码登录', timeout=3)
-                        if not otp_btn:
-                            otp_btn = wait_for_element(page, 'text=Log in with a one-time code', timeout=3)
-                        if otp_btn:
-                            old_url = page.url
-                            otp_btn.click()
-                            wait_for_url_change(page, old_url, timeout=10)
-                            continue
-                except Exception:
-                    pass
-
-                # 检查密码框是否已有内容（避免重复输入）
-                password_input = wait_for_element(page, 'css:input[type="password"]', timeout=5)
-                if not password_input:
-                    log.error("无法找到密码输入框")
+            handler = None
+            if "auth.openai.com" in current_url:
+                handler = _REGISTER_STEP_HANDLERS.get(_url_path(current_url))
+            if handler:
+                result = handler(page, state, current_url)
+                if result == STEP_DONE:
+                    break  # 验证码/补充信息页面，跳出循环继续后续流程
+                if result == STEP_FAILED:
                     return False
-                
-                # 检查是否已输入密码
-                try:
-                    current_value = password_input.attr('value') or ''
-                    if len(current_value) > 0:
-                        log.info("密码已输入，点击继续...")
-                        continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
-                        if continue_btn:
-                            old_url = page.url
-                            continue_btn.click()
-                            wait_for_url_change(page, old_url, timeout=10)
-                        continue
-                except Exception:
-                    pass
-
-                log.step("等待密码输入框...")
-                human_delay()  # 模拟人类思考时间
-                log.step("输入密码...")
-                type_slowly(page, 'css:input[type="password"]', password)
-                log.success("密码已输入")
-
-                # 点击继续
-                human_delay(0.5, 1.2)
-                log.step("点击继续...")
-                continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
-                if continue_btn:
-                    old_url = page.url
-                    continue_btn.click()
-                    # 等待页面变化，检测是否密码错误
-                    time.sleep(2)
-                    
-                    # 检查是否出现密码错误提示
-                    try:
-                        error_text = page.ele('text:Incorrect email address or password', timeout=1)
-                        if error_text and error_text.states.is_displayed:
-                            log.warning("密码错误，尝试使用一次性验证码登录...")
-                            otp_btn = wait_for_element(page, 'text=使用一次性验证码登录', timeout=3)
-                            if not otp_btn:
-                                otp_btn = wait_for_element(page, 'text=Log in with a one-time code', timeout=3)
-                            if otp_btn:
-                                otp_btn.click()
-                                wait_for_url_change(page, old_url, timeout=10)
-                                continue
-                    except Exception:
-                        pass
-                    
-                    wait_for_url_change(page, old_url, timeout=10)
-                continue
-
-            # 步骤3: 验证码页面
-            if "auth.openai.com/email-verification" in current_url:
-                break  # 跳出循环，进入验证码流程
-
-            # 步骤4: 姓名/年龄页面 (账号已存在)
-            if "auth.openai.com/about-you" in current_url:
-                break  # 跳出循环，进入补充信息流程
+                continue  # 各步骤内部已等待页面跳转
 
             # 处理错误
             if check_and_handle_error(page):
-                time.sleep(0.5)
                 continue
 
-            # 短暂等待页面变化
-            time.sleep(0.5)
+            # 未知页面，等待 URL 变化 (代替固定休眠轮询)
+            wait_for_url_change(page, current_url, timeout=5)
+
+        code_future = state["code_future"]
 
         # === 根据 URL 快速判断页面状态 ===
         current_url = page.url
@@ -910,7 +1972,7 @@ def register_openai_account(page, email: str, password: str) -> bool:
         # 如果是 chatgpt.com 首页，说明已注册成功
         if "chatgpt.com" in current_url and "auth.openai.com" not in current_url:
             try:
-                if is_logged_in(page):
+                if _is_logged_in_cached(page):
                     log.success("检测到已登录，账号已注册成功")
                     return True
             except Exception:
@@ -921,53 +1983,8 @@ def register_openai_account(page, email: str, password: str) -> bool:
             log_current_url(page, "个人信息页面")
             log.info("检测到姓名输入页面，账号已存在，补充信息...")
 
-            # 等待页面加载
-            name_input = wait_for_element(page, 'css:input[name="name"]', timeout=5)
-            if not name_input:
-                name_input = wait_for_element(page, 'css:input[autocomplete="name"]', timeout=3)
-            
-            # 输入姓名
-            random_name = get_random_name()
-            log.step(f"输入姓名: {random_name}")
-            type_slowly(page, 'css:input[name="name"], input[autocomplete="name"]', random_name)
-
-            # 输入生日 (与正常注册流程一致)
-            birthday = get_random_birthday()
-            log.step(f"输入生日: {birthday['year']}/{birthday['month']}/{birthday['day']}")
-
-            # 年份
-            year_input = wait_for_element(page, 'css:[data-type="year"]', timeout=10)
-            if year_input:
-                year_input.click()
-                time.sleep(0.15)
-                year_input.input(birthday['year'], clear=True)
-                time.sleep(0.2)
-
-            # 月份
-            month_input = wait_for_element(page, 'css:[data-type="month"]', timeout=5)
-            if month_input:
-                month_input.click()
-                time.sleep(0.15)
-                month_input.input(birthday['month'], clear=True)
-                time.sleep(0.2)
-
-            # 日期
-            day_input = wait_for_element(page, 'css:[data-type="day"]', timeout=5)
-            if day_input:
-                day_input.click()
-                time.sleep(0.15)
-                day_input.input(birthday['day'], clear=True)
-
-            log.success("生日已输入")
-
-            # 点击提交
-            log.step("点击最终提交...")
-            time.sleep(0.5)
-            submit_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
-            if submit_btn:
-                submit_btn.click()
-
-            time.sleep(2)
+            _fill_about_you(page, name_timeout=5)
+
             log.success(f"注册完成: {email}")
             return True
 
@@ -987,7 +2004,7 @@ def register_openai_account(page, email: str, password: str) -> bool:
         # 只有在 chatgpt.com 页面且已登录才能判断为成功
         if not needs_verification:
             try:
-                if "chatgpt.com" in page.url and is_logged_in(page):
+                if "chatgpt.com" in page.url and _is_logged_in_cached(page):
                     log.success("账号已注册成功")
                     return True
             except Exception:
@@ -997,10 +2014,10 @@ def register_openai_account(page, email: str, password: str) -> bool:
 
         # 获取验证码
         log.step("等待验证码邮件...")
-        verification_code, error, email_time = unified_get_verification_code(email)
+        verification_code, error, email_time = _await_verification_code(code_future, email)
 
         if not verification_code:
-            verification_code = input("   ⚠️ 请手动输入验证码: ").strip()
+            verification_code = _prompt_verification_code("   ⚠️ 请手动输入验证码: ")
 
         if not verification_code:
             log.error("无法获取验证码")
@@ -1015,14 +2032,12 @@ def register_openai_account(page, email: str, password: str) -> bool:
                 time.sleep(1)
 
             # 重新获取输入框 (可能页面已刷新)
-            code_input = wait_for_element(page, 'css:input[name="code"]', timeout=10)
-            if not code_input:
-                code_input = wait_for_element(page, 'css:input[placeholder*="代码"]', timeout=5)
+            code_input = get_el(page, _CODE_INPUT, timeout=10)
 
             if not code_input:
                 # 再次检查是否已登录
                 try:
-                    if is_logged_in(page):
+                    if _is_logged_in_cached(page):
                         log.success("检测到已登录，跳过验证码输入")
                         return True
                 except Exception:
@@ -1035,50 +2050,26 @@ def register_openai_account(page, email: str, password: str) -> bool:
                 code_input.clear()
             except Exception:
                 pass
-            type_slowly(page, 'css:input[name="code"], input[placeholder*="代码"]', verification_code, base_delay=0.08)
-            time.sleep(0.5)
+            fast_fill(page, _CODE_INPUT, verification_code)
 
-            # 点击继续
+            # 点击继续，根据校验接口响应判断验证码是否正确
             log.step("点击继续...")
-            for attempt in range(3):
-                try:
-                    continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=10)
-                    if continue_btn:
-                        continue_btn.click()
-                        break
-                except Exception:
-                    time.sleep(0.5)
+            code_rejected = _submit_code_and_check(page, lambda: click_submit(page))
 
-            time.sleep(2)
-            
             # 检查是否出现"代码不正确"错误
             try:
-                error_text = page.ele('text:代码不正确', timeout=1)
-                if not error_text:
-                    error_text = page.ele('text:incorrect', timeout=1)
-                if not error_text:
-                    error_text = page.ele('text:Invalid code', timeout=1)
-                    
-                if error_text and error_text.states.is_displayed:
+                if code_rejected:
                     if code_attempt < max_code_retries - 1:
                         log.warning(f"验证码错误，尝试重新获取 ({code_attempt + 1}/{max_code_retries})...")
                         
                         # 点击"重新发送电子邮件"
-                        resend_btn = page.ele('text:重新发送电子邮件', timeout=3)
-                        if not resend_btn:
-                            resend_btn = page.ele('text:Resend email', timeout=2)
-                        if not resend_btn:
-                            resend_btn = page.ele('text:resend', timeout=2)
-                        
-                        if resend_btn:
-                            resend_btn.click()
+                        if click_text_button(page, _RESEND_EMAIL_TEXTS):
                             log.info("已点击重新发送，等待新验证码...")
-                            time.sleep(3)
-                            
-                            # 重新获取验证码
-                            verification_code, error, email_time = unified_get_verification_code(email)
+
+                            # 重新获取验证码 (跳过已用过的旧邮件，新邮件到达即返回)
+                            verification_code, error, email_time = unified_get_verification_code(email, after=email_time)
                             if not verification_code:
-                                verification_code = input("   ⚠️ 请手动输入验证码: ").strip()
+                                verification_code = _prompt_verification_code("   ⚠️ 请手动输入验证码: ")
                             if verification_code:
                                 continue  # 继续下一次尝试
                         
@@ -1099,61 +2090,12 @@ def register_openai_account(page, email: str, password: str) -> bool:
         # 记录当前页面 (应该是 about-you 个人信息页面)
         log_current_url(page, "验证码通过后-个人信息页面")
 
-        # 输入姓名 (随机外国名字)
-        random_name = get_random_name()
-        log.step(f"输入姓名: {random_name}")
-        name_input = wait_for_element(page, 'css:input[name="name"]', timeout=15)
-        if not name_input:
-            name_input = wait_for_element(page, 'css:input[autocomplete="name"]', timeout=5)
-        type_slowly(page, 'css:input[name="name"], input[autocomplete="name"]', random_name)
-
-        # 输入生日 (随机 2000-2005)
-        birthday = get_random_birthday()
-        log.step(f"输入生日: {birthday['year']}/{birthday['month']}/{birthday['day']}")
-
-        # 年份
-        year_input = wait_for_element(page, 'css:[data-type="year"]', timeout=10)
-        if year_input:
-            year_input.click()
-            time.sleep(0.15)
-            year_input.input(birthday['year'], clear=True)
-            time.sleep(0.2)
-
-        # 月份
-        month_input = wait_for_element(page, 'css:[data-type="month"]', timeout=5)
-        if month_input:
-            month_input.click()
-            time.sleep(0.15)
-            month_input.input(birthday['month'], clear=True)
-            time.sleep(0.2)
-
-        # 日期
-        day_input = wait_for_element(page, 'css:[data-type="day"]', timeout=5)
-        if day_input:
-            day_input.click()
-            time.sleep(0.15)
-            day_input.input(birthday['day'], clear=True)
-
-        log.success("生日已输入")
-
-        # 最终提交
-        log.step("点击最终提交...")
-        continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=10)
-        if continue_btn:
-            continue_btn.click()
-
-        # 等待并检查是否出现 "email not supported" 错误
-        time.sleep(2)
-        try:
-            error_text = page.ele('text:The email you provided is not supported', timeout=2)
-            if error_text and error_text.states.is_displayed:
-                log.error("邮箱域名不被支持，需要加入黑名单")
-                return "domain_blacklisted"
-        except Exception:
-            pass
+        # 提交后出现 "email not supported" 错误时加入黑名单
+        if _fill_about_you(page, name_timeout=15) == "blacklisted":
+            log.error("邮箱域名不被支持，需要加入黑名单")
+            return "domain_blacklisted"
 
         log.success(f"注册完成: {email}")
-        time.sleep(1)
         return True
 
     except Exception as e:
@@ -1161,13 +2103,168 @@ def register_openai_account(page, email: str, password: str) -> bool:
         return False
 
 
-def perform_codex_authorization(page, email: str, password: str) -> dict:
+def _generate_codex_auth_url() -> tuple:
+    """按 AUTH_PROVIDER 生成 Codex 授权 URL
+
+    Returns:
+        tuple: (auth_url, session_id)，失败时为 (None, None)
+    """
+    if AUTH_PROVIDER == "s2a":
+        return s2a_generate_auth_url()
+    return crs_generate_auth_url()
+
+
+def _generate_auth_url() -> tuple:
+    """按 AUTH_PROVIDER 生成授权 URL (CPA 返回 state，CRS/S2A 返回 session_id)
+
+    Returns:
+        tuple: (auth_url, state 或 session_id)，失败时为 (None, None)
+    """
+    if AUTH_PROVIDER == "cpa":
+        return cpa_generate_auth_url()
+    return _generate_codex_auth_url()
+
+
+def _prefetched_auth_info(auth_future) -> tuple:
+    """取出后台生成的授权 URL，失败时返回 None (由授权流程现场重新生成)"""
+    try:
+        auth_info = auth_future.result()
+    except Exception as e:
+        log.warning(f"后台生成授权 URL 失败: {e}")
+        return None
+    return auth_info if auth_info and all(auth_info) else None
+
+
+# 授权页可以开始操作的标志: 出现邮箱输入框 (或错误页的重试按钮)
+_AUTH_PAGE_READY = _EMAIL_INPUT_ANY + ', ' + _RETRY_BUTTON[len('css:'):]
+
+
+def open_auth_page(page, auth_url: str) -> bool:
+    """打开授权页面: 导航发出后即返回，再等待邮箱输入框 (或错误页重试按钮) 出现
+
+    使用 none 加载模式，不等待统计/第三方资源全部加载；不使用 eager 模式，
+    因为它在 DOMContentLoaded 后发送 Page.stopLoading，可能中断授权页 SPA 脚本的加载。
+
+    Returns:
+        bool: 页面是否已就绪 (未就绪时已退回到等待页面稳定，交给后续的错误页检测处理)
+    """
+    try:
+        page.set.load_mode.none()
+        page.get(auth_url)
+    finally:
+        try:
+            page.set.load_mode.normal()
+        except Exception:
+            pass
+
+    if wait_for_element(page, _AUTH_PAGE_READY, timeout=8):
+        return True
+    log.warning("授权页面未出现邮箱输入框，等待页面加载完成")
+    wait_for_page_stable(page, timeout=5)
+    return False
+
+
+def _wait_for_codex_callback(page, max_wait: int = 45, label: str = "") -> str:
+    """等待 Codex 授权回调 URL 并提取授权码，期间点击授权页上的授权按钮
+
+    Args:
+        page: 浏览器页面对象
+        max_wait: 最长等待时间 (秒)
+        label: URL 日志前缀
+
+    Returns:
+        str: 授权码，超时或授权失败时返回 None
+    """
+    start_time = time.time()
+    code = None
+    progress_shown = False
+    last_url_in_loop = None
+    poll = 0  # 同一 URL 下的轮询次数，URL 变化时重置
+    log.step(f"等待授权回调 (最多 {max_wait}s)...")
+
+    url_watcher = _UrlWatcher(page).start()
+    while time.time() - start_time < max_wait:
+        try:
+            current_url = url_watcher.current_url()
+
+            # 记录URL变化
+            if current_url != last_url_in_loop:
+                log_current_url(page, f"{label}等待回调中", url=current_url)
+                last_url_in_loop = current_url
+                poll = 0
+
+            # 检查是否到达回调页面
+            if _CODEX_CALLBACK_URL in current_url and "code=" in current_url:
+                if progress_shown:
+                    log.progress_clear()
+                log.success("获取到回调 URL")
+                log.info(f"[URL] 回调地址: {current_url}", icon="browser")
+                code = extract_code_from_url(current_url)
+                if code:
+                    log.success("提取授权码成功")
+                    break
+
+            # 授权明确失败或页面长时间无变化时提前结束，不必等满 max_wait
+            if any(marker in current_url for marker in _AUTH_ERROR_URL_MARKERS):
+                if progress_shown:
+                    log.progress_clear()
+                    progress_shown = False
+                log.warning(f"授权失败页面: {current_url}")
+                break
+            if poll >= MAX_IDLE_CALLBACK_POLLS:
+                if progress_shown:
+                    log.progress_clear()
+                    progress_shown = False
+                log.warning("页面长时间无变化，授权流程可能卡住")
+                break
+
+            # 尝试点击授权按钮
+            clicked = click_authorize_button(page)
+            if clicked is not None:
+                if progress_shown:
+                    log.progress_clear()
+                    progress_shown = False
+                log.step(f"点击按钮: {clicked}")
+                url_watcher.wait(1.5)
+
+            elapsed = int(time.time() - start_time)
+            log.progress_inline(f"[等待中... {elapsed}s]")
+            progress_shown = True
+            url_watcher.wait(_callback_poll_delay(poll))
+            poll += 1
+
+        except Exception as e:
+            if progress_shown:
+                log.progress_clear()
+                progress_shown = False
+            log.warning(f"检查异常: {e}")
+            time.sleep(_callback_poll_delay(poll))
+            poll += 1
+
+    url_watcher.stop()
+
+    if not code:
+        if progress_shown:
+            log.progress_clear()
+        log.warning("授权超时")
+        try:
+            current_url = page.url
+            if "code=" in current_url:
+                code = extract_code_from_url(current_url)
+        except Exception:
+            pass
+
+    return code
+
+
+def perform_codex_authorization(page, email: str, password: str, auth_info: tuple = None) -> dict:
     """执行 Codex 授权流程
 
     Args:
         page: 浏览器实例
         email: 邮箱地址
         password: 密码
+        auth_info: 预先生成的 (auth_url, session_id)，为空时现场生成
 
     Returns:
         dict: codex_data 或 None
@@ -1175,10 +2272,7 @@ def perform_codex_authorization(page, email: str, password: str) -> dict:
     log.info(f"开始 Codex 授权: {email}", icon="code")
 
     # 生成授权 URL
-    if AUTH_PROVIDER == "s2a":
-        auth_url, session_id = s2a_generate_auth_url()
-    else:
-        auth_url, session_id = crs_generate_auth_url()
+    auth_url, session_id = auth_info or _generate_codex_auth_url()
     if not auth_url or not session_id:
         log.error("无法获取授权 URL")
         return None
@@ -1186,8 +2280,7 @@ def perform_codex_authorization(page, email: str, password: str) -> dict:
     # 打开授权页面
     log.step("打开授权页面...")
     log.info(f"[URL] 授权URL: {auth_url}", icon="browser")
-    page.get(auth_url)
-    wait_for_page_stable(page, timeout=5)
+    open_auth_page(page, auth_url)
     log_current_url(page, "授权页面加载完成", force=True)
     
     # 检测错误页面
@@ -1200,25 +2293,18 @@ def perform_codex_authorization(page, email: str, password: str) -> dict:
         # 再次检测错误页面
         check_and_handle_error_page(page)
         
-        email_input = wait_for_element(page, 'css:input[type="email"]', timeout=10)
+        email_input = wait_for_element(page, _EMAIL_INPUT_ANY, timeout=10)
         if not email_input:
             # 可能是错误页面，再检测一次
             if check_and_handle_error_page(page):
-                email_input = wait_for_element(page, 'css:input[type="email"]', timeout=5)
-        if not email_input:
-            email_input = wait_for_element(page, 'css:input[name="email"]', timeout=5)
-        if not email_input:
-            email_input = wait_for_element(page, '#email', timeout=5)
-        type_slowly(page, 'css:input[type="email"], input[name="email"], #email', email, base_delay=0.06)
+                email_input = wait_for_element(page, _EMAIL_INPUT_ANY, timeout=5)
+        fast_fill(page, _EMAIL_INPUT_ANY, email)
 
-        # 点击继续
+        # 回车提交 (未跳转时点击继续)
         log.step("点击继续...")
-        continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
-        if continue_btn:
-            old_url = page.url
-            continue_btn.click()
-            wait_for_url_change(page, old_url, timeout=8)
-            log_url_change(page, old_url, "输入邮箱后点击继续")
+        old_url = page.url
+        submit_with_enter(page, _EMAIL_INPUT_ANY, old_url, fallback_timeout=8)
+        log_url_change(page, old_url, "输入邮箱后点击继续")
 
     except Exception as e:
         log.warning(f"邮箱输入步骤异常: {e}")
@@ -1233,11 +2319,11 @@ def perform_codex_authorization(page, email: str, password: str) -> dict:
         if "auth.openai.com/log-in" in current_url and "/password" not in current_url:
             log.info("重试后回到登录页，重新输入邮箱...")
             try:
-                email_input = wait_for_element(page, 'css:input[type="email"]', timeout=5)
+                email_input = wait_for_element(page, _EMAIL_INPUT, timeout=5)
                 if email_input:
-                    type_slowly(page, 'css:input[type="email"]', email, base_delay=0.06)
+                    fast_fill(page, _EMAIL_INPUT, email)
                     log.step("点击继续...")
-                    continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
+                    continue_btn = wait_for_element(page, _SUBMIT_BUTTON, timeout=5)
                     if continue_btn:
                         old_url = page.url
                         continue_btn.click()
@@ -1249,29 +2335,24 @@ def perform_codex_authorization(page, email: str, password: str) -> dict:
     current_url = page.url
     
     # 只有在密码页面才输入密码
-    if "/password" in current_url or "log-in/password" in current_url or "create-account/password" in current_url:
+    if "/password" in current_url:
         try:
             # 输入密码
             log.step("输入密码...")
-            password_input = wait_for_element(page, 'css:input[type="password"]', timeout=10)
+            password_input = wait_for_element(page, _PASSWORD_INPUT_ANY, timeout=10)
             if not password_input:
                 # 可能是错误页面
                 if check_and_handle_error_page(page):
-                    password_input = wait_for_element(page, 'css:input[type="password"]', timeout=5)
-            if not password_input:
-                password_input = wait_for_element(page, 'css:input[name="password"]', timeout=5)
+                    password_input = wait_for_element(page, _PASSWORD_INPUT_ANY, timeout=5)
             
             if password_input:
-                type_slowly(page, 'css:input[type="password"], input[name="password"]', password, base_delay=0.06)
+                fast_fill(page, _PASSWORD_INPUT_ANY, password)
 
-                # 点击继续
+                # 回车提交 (未跳转时点击继续)
                 log.step("点击继续...")
-                continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
-                if continue_btn:
-                    old_url = page.url
-                    continue_btn.click()
-                    wait_for_url_change(page, old_url, timeout=8)
-                    log_url_change(page, old_url, "输入密码后点击继续")
+                old_url = page.url
+                submit_with_enter(page, _PASSWORD_INPUT_ANY, old_url, fallback_timeout=8)
+                log_url_change(page, old_url, "输入密码后点击继续")
 
         except Exception as e:
             log.warning(f"密码输入步骤异常: {e}")
@@ -1279,24 +2360,24 @@ def perform_codex_authorization(page, email: str, password: str) -> dict:
         # 不在密码页面，可能需要先输入邮箱
         log.info(f"当前不在密码页面: {current_url}")
         try:
-            email_input = wait_for_element(page, 'css:input[type="email"]', timeout=3)
+            email_input = wait_for_element(page, _EMAIL_INPUT, timeout=3)
             if email_input:
                 log.step("输入邮箱...")
-                type_slowly(page, 'css:input[type="email"]', email, base_delay=0.06)
+                fast_fill(page, _EMAIL_INPUT, email)
                 log.step("点击继续...")
-                continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
+                continue_btn = wait_for_element(page, _SUBMIT_BUTTON, timeout=5)
                 if continue_btn:
                     old_url = page.url
                     continue_btn.click()
                     wait_for_url_change(page, old_url, timeout=8)
                     
                     # 现在应该在密码页面了
-                    password_input = wait_for_element(page, 'css:input[type="password"]', timeout=10)
+                    password_input = wait_for_element(page, _PASSWORD_INPUT, timeout=10)
                     if password_input:
                         log.step("输入密码...")
-                        type_slowly(page, 'css:input[type="password"]', password, base_delay=0.06)
+                        fast_fill(page, _PASSWORD_INPUT, password)
                         log.step("点击继续...")
-                        continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
+                        continue_btn = wait_for_element(page, _SUBMIT_BUTTON, timeout=5)
                         if continue_btn:
                             old_url = page.url
                             continue_btn.click()
@@ -1307,72 +2388,7 @@ def perform_codex_authorization(page, email: str, password: str) -> dict:
     log_current_url(page, "密码步骤完成后")
 
     # 等待授权回调
-    max_wait = 45  # 减少等待时间
-    start_time = time.time()
-    code = None
-    progress_shown = False
-    last_url_in_loop = None
-    log.step(f"等待授权回调 (最多 {max_wait}s)...")
-
-    while time.time() - start_time < max_wait:
-        try:
-            current_url = page.url
-
-            # 记录URL变化
-            if current_url != last_url_in_loop:
-                log_current_url(page, "等待回调中")
-                last_url_in_loop = current_url
-
-            # 检查是否到达回调页面
-            if "localhost:1455/auth/callback" in current_url and "code=" in current_url:
-                if progress_shown:
-                    log.progress_clear()
-                log.success("获取到回调 URL")
-                log.info(f"[URL] 回调地址: {current_url}", icon="browser")
-                code = extract_code_from_url(current_url)
-                if code:
-                    log.success("提取授权码成功")
-                    break
-
-            # 尝试点击授权按钮
-            try:
-                buttons = page.eles('css:button[type="submit"]')
-                for btn in buttons:
-                    if btn.states.is_displayed and btn.states.is_enabled:
-                        btn_text = btn.text.lower()
-                        if any(x in btn_text for x in ['allow', 'authorize', 'continue', '授权', '允许', '继续', 'accept']):
-                            if progress_shown:
-                                log.progress_clear()
-                                progress_shown = False
-                            log.step(f"点击按钮: {btn.text}")
-                            btn.click()
-                            time.sleep(1.5)  # 减少等待
-                            break
-            except Exception:
-                pass
-
-            elapsed = int(time.time() - start_time)
-            log.progress_inline(f"[等待中... {elapsed}s]")
-            progress_shown = True
-            time.sleep(1.5)  # 减少轮询间隔
-
-        except Exception as e:
-            if progress_shown:
-                log.progress_clear()
-                progress_shown = False
-            log.warning(f"检查异常: {e}")
-            time.sleep(1.5)
-
-    if not code:
-        if progress_shown:
-            log.progress_clear()
-        log.warning("授权超时")
-        try:
-            current_url = page.url
-            if "code=" in current_url:
-                code = extract_code_from_url(current_url)
-        except Exception:
-            pass
+    code = _wait_for_codex_callback(page)
 
     if not code:
         log.error("无法获取授权码")
@@ -1425,21 +2441,18 @@ def perform_codex_authorization_with_otp(page, email: str) -> dict:
     # 打开授权页面
     log.step("打开授权页面...")
     log.info(f"[URL] 授权URL: {auth_url}", icon="browser")
-    page.get(auth_url)
-    wait_for_page_stable(page, timeout=5)
+    open_auth_page(page, auth_url)
     log_current_url(page, "OTP授权页面加载完成", force=True)
 
     try:
         # 输入邮箱
         log.step("输入邮箱...")
-        email_input = wait_for_element(page, 'css:input[type="email"]', timeout=10)
-        if not email_input:
-            email_input = wait_for_element(page, 'css:input[name="email"]', timeout=5)
-        type_slowly(page, 'css:input[type="email"], input[name="email"], #email', email, base_delay=0.06)
+        email_input = wait_for_element(page, _EMAIL_INPUT_ANY, timeout=10)
+        fast_fill(page, _EMAIL_INPUT_ANY, email)
 
         # 点击继续
         log.step("点击继续...")
-        continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
+        continue_btn = get_el(page, _SUBMIT_BUTTON, timeout=5)
         if continue_btn:
             old_url = page.url
             continue_btn.click()
@@ -1451,26 +2464,21 @@ def perform_codex_authorization_with_otp(page, email: str) -> dict:
 
     log_current_url(page, "OTP流程-邮箱步骤完成后")
 
+    code_future = None  # 点击 OTP 按钮后在后台开始收取验证码
     try:
         # 检查是否在密码页面，如果是则点击"使用一次性验证码登录"
         current_url = page.url
         if "/log-in/password" in current_url or "/password" in current_url:
             log.step("检测到密码页面，点击使用一次性验证码登录...")
-            otp_btn = wait_for_element(page, 'text=使用一次性验证码登录', timeout=5)
-            if not otp_btn:
-                otp_btn = wait_for_element(page, 'text=Log in with a one-time code', timeout=3)
+            otp_btn = wait_for_element(page, _OTP_LOGIN_BUTTON, timeout=5)
             if not otp_btn:
                 # 尝试通过按钮文本查找
-                buttons = page.eles('css:button')
-                for btn in buttons:
-                    btn_text = btn.text.lower()
-                    if '一次性验证码' in btn_text or 'one-time' in btn_text:
-                        otp_btn = btn
-                        break
+                otp_btn = page.ele(_OTP_BUTTON_ANY, timeout=0)
             
             if otp_btn:
                 old_url = page.url
                 otp_btn.click()
+                code_future = _code_executor.submit(unified_get_verification_code, email)
                 log.success("已点击一次性验证码登录按钮")
                 wait_for_url_change(page, old_url, timeout=8)
                 log_url_change(page, old_url, "点击OTP按钮后")
@@ -1479,20 +2487,16 @@ def perform_codex_authorization_with_otp(page, email: str) -> dict:
         else:
             # 不在密码页面，尝试直接找 OTP 按钮
             log.step("点击使用一次性验证码登录...")
-            otp_btn = wait_for_element(page, 'css:button[value="passwordless_login_send_otp"]', timeout=10)
+            otp_btn = wait_for_element(page, _PASSWORDLESS_OTP_BUTTON, timeout=10)
             if not otp_btn:
-                otp_btn = wait_for_element(page, 'css:button._inlinePasswordlessLogin', timeout=5)
-            if not otp_btn:
-                buttons = page.eles('css:button')
-                for btn in buttons:
-                    if '一次性验证码' in btn.text or 'one-time' in btn.text.lower():
-                        otp_btn = btn
-                        break
+                otp_btn = page.ele(_OTP_BUTTON_ANY, timeout=0)
 
             if otp_btn:
+                old_url = page.url
                 otp_btn.click()
+                code_future = _code_executor.submit(unified_get_verification_code, email)
                 log.success("已点击一次性验证码登录按钮")
-                time.sleep(2)
+                wait_for_url_change(page, old_url, timeout=5)
             else:
                 log.warning("未找到一次性验证码登录按钮，尝试继续...")
 
@@ -1503,12 +2507,12 @@ def perform_codex_authorization_with_otp(page, email: str) -> dict:
 
     # 等待并获取验证码
     log.step("等待验证码邮件...")
-    verification_code, error, email_time = unified_get_verification_code(email)
+    verification_code, error, email_time = _await_verification_code(code_future, email)
 
     if not verification_code:
         log.warning(f"自动获取验证码失败: {error}")
         # 手动输入
-        verification_code = input("⚠️ 请手动输入验证码: ").strip()
+        verification_code = _prompt_verification_code("⚠️ 请手动输入验证码: ")
         if not verification_code:
             log.error("未输入验证码")
             return None
@@ -1519,11 +2523,7 @@ def perform_codex_authorization_with_otp(page, email: str) -> dict:
         try:
             # 输入验证码
             log.step(f"输入验证码: {verification_code}")
-            code_input = wait_for_element(page, 'css:input[name="otp"]', timeout=10)
-            if not code_input:
-                code_input = wait_for_element(page, 'css:input[type="text"]', timeout=5)
-            if not code_input:
-                code_input = wait_for_element(page, 'css:input[autocomplete="one-time-code"]', timeout=5)
+            code_input = get_el(page, _OTP_INPUT, timeout=10)
 
             if code_input:
                 # 清空并输入验证码
@@ -1531,7 +2531,7 @@ def perform_codex_authorization_with_otp(page, email: str) -> dict:
                     code_input.clear()
                 except Exception:
                     pass
-                type_slowly(page, 'css:input[name="otp"], input[type="text"], input[autocomplete="one-time-code"]', verification_code, base_delay=0.08)
+                fast_fill(page, _OTP_INPUT, verification_code)
                 log.success("验证码已输入")
             else:
                 log.error("未找到验证码输入框")
@@ -1539,41 +2539,25 @@ def perform_codex_authorization_with_otp(page, email: str) -> dict:
 
             # 点击继续/验证按钮
             log.step("点击继续...")
-            time.sleep(1)
-            continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
+            continue_btn = get_el(page, _SUBMIT_BUTTON, timeout=5)
+            code_rejected = False
             if continue_btn:
-                old_url = page.url
-                continue_btn.click()
-                time.sleep(2)
-                
+                code_rejected = _submit_code_and_check(page, continue_btn.click)
+
             # 检查是否出现"代码不正确"错误
             try:
-                error_text = page.ele('text:代码不正确', timeout=1)
-                if not error_text:
-                    error_text = page.ele('text:incorrect', timeout=1)
-                if not error_text:
-                    error_text = page.ele('text:Invalid code', timeout=1)
-                    
-                if error_text and error_text.states.is_displayed:
+                if code_rejected:
                     if code_attempt < max_code_retries - 1:
                         log.warning(f"验证码错误，尝试重新获取 ({code_attempt + 1}/{max_code_retries})...")
                         
                         # 点击"重新发送电子邮件"
-                        resend_btn = page.ele('text:重新发送电子邮件', timeout=3)
-                        if not resend_btn:
-                            resend_btn = page.ele('text:Resend email', timeout=2)
-                        if not resend_btn:
-                            resend_btn = page.ele('text:resend', timeout=2)
-                        
-                        if resend_btn:
-                            resend_btn.click()
+                        if click_text_button(page, _RESEND_EMAIL_TEXTS):
                             log.info("已点击重新发送，等待新验证码...")
-                            time.sleep(3)
-                            
-                            # 重新获取验证码
-                            verification_code, error, email_time = unified_get_verification_code(email)
+
+                            # 重新获取验证码 (跳过已用过的旧邮件，新邮件到达即返回)
+                            verification_code, error, email_time = unified_get_verification_code(email, after=email_time)
                             if not verification_code:
-                                verification_code = input("   ⚠️ 请手动输入验证码: ").strip()
+                                verification_code = _prompt_verification_code("   ⚠️ 请手动输入验证码: ")
                             if verification_code:
                                 continue  # 继续下一次尝试
                         
@@ -1593,72 +2577,7 @@ def perform_codex_authorization_with_otp(page, email: str) -> dict:
             break
 
     # 等待授权回调
-    max_wait = 45
-    start_time = time.time()
-    code = None
-    progress_shown = False
-    last_url_in_loop = None
-    log.step(f"等待授权回调 (最多 {max_wait}s)...")
-
-    while time.time() - start_time < max_wait:
-        try:
-            current_url = page.url
-
-            # 记录URL变化
-            if current_url != last_url_in_loop:
-                log_current_url(page, "OTP流程-等待回调中")
-                last_url_in_loop = current_url
-
-            # 检查是否到达回调页面
-            if "localhost:1455/auth/callback" in current_url and "code=" in current_url:
-                if progress_shown:
-                    log.progress_clear()
-                log.success("获取到回调 URL")
-                log.info(f"[URL] 回调地址: {current_url}", icon="browser")
-                code = extract_code_from_url(current_url)
-                if code:
-                    log.success("提取授权码成功")
-                    break
-
-            # 尝试点击授权按钮
-            try:
-                buttons = page.eles('css:button[type="submit"]')
-                for btn in buttons:
-                    if btn.states.is_displayed and btn.states.is_enabled:
-                        btn_text = btn.text.lower()
-                        if any(x in btn_text for x in ['allow', 'authorize', 'continue', '授权', '允许', '继续', 'accept']):
-                            if progress_shown:
-                                log.progress_clear()
-                                progress_shown = False
-                            log.step(f"点击按钮: {btn.text}")
-                            btn.click()
-                            time.sleep(1.5)
-                            break
-            except Exception:
-                pass
-
-            elapsed = int(time.time() - start_time)
-            log.progress_inline(f"[等待中... {elapsed}s]")
-            progress_shown = True
-            time.sleep(1.5)
-
-        except Exception as e:
-            if progress_shown:
-                log.progress_clear()
-                progress_shown = False
-            log.warning(f"检查异常: {e}")
-            time.sleep(1.5)
-
-    if not code:
-        if progress_shown:
-            log.progress_clear()
-        log.warning("授权超时")
-        try:
-            current_url = page.url
-            if "code=" in current_url:
-                code = extract_code_from_url(current_url)
-        except Exception:
-            pass
+    code = _wait_for_codex_callback(page, label="OTP流程-")
 
     if not code:
         log.error("无法获取授权码")
@@ -1780,7 +2699,32 @@ def register_and_authorize(email: str, password: str) -> tuple:
                 if ctx.current_attempt >= ctx.max_retries - 1:
                     return False, None
 
-    return False, None
+    return False, None
+
+
+# 复用浏览器时需要清理的站点数据
+_RESET_ORIGINS = ("https://chatgpt.com", "https://auth.openai.com", "https://openai.com")
+
+
+def reset_browser_state(page):
+    """清空 Cookie 和站点存储，让同一个浏览器可以继续处理下一个账号
+
+    Args:
+        page: 浏览器页面对象
+    """
+    try:
+        page.get("about:blank")
+    except Exception:
+        pass
+    page.run_cdp("Network.clearBrowserCookies")
+    for origin in _RESET_ORIGINS:
+        try:
+            page.run_cdp("Storage.clearDataForOrigin", origin=origin, storageTypes="all")
+        except Exception:
+            pass
+
+    # 页面对象复用，清掉按页面缓存的状态
+    _forget_page_state(page)
 
 
 def authorize_only(email: str, password: str) -> tuple[bool, dict]:
@@ -1795,13 +2739,21 @@ def authorize_only(email: str, password: str) -> tuple[bool, dict]:
             - CRS 模式: codex_data 包含 tokens
             - CPA 模式: codex_data 为 None (后台自动处理)
     """
+    # 先生成授权 URL: 授权服务不可用时直接返回，不启动浏览器
+    auth_info = _generate_auth_url()
+    if not all(auth_info):
+        log.error("无法获取授权 URL，跳过浏览器授权")
+        return False, None
+
     with browser_context_with_retry(max_browser_retries=2) as ctx:
         for attempt in ctx.attempts():
+            # 预生成的授权 URL 只用于首次尝试，重试时重新生成
+            attempt_auth_info, auth_info = auth_info, None
             try:
                 # 根据配置选择授权方式
                 if AUTH_PROVIDER == "cpa":
                     log.info("已注册账号，使用 CPA 进行 Codex 授权...", icon="auth")
-                    success = perform_cpa_authorization(ctx.page, email, password)
+                    success = perform_cpa_authorization(ctx.page, email, password, auth_info=attempt_auth_info)
                     if success:
                         return True, None  # CPA 模式不返回 codex_data
                     else:
@@ -1812,7 +2764,7 @@ def authorize_only(email: str, password: str) -> tuple[bool, dict]:
                 else:
                     # CRS 模式
                     log.info("已注册账号，直接进行 Codex 授权...", icon="auth")
-                    codex_data = perform_codex_authorization(ctx.page, email, password)
+                    codex_data = perform_codex_authorization(ctx.page, email, password, auth_info=attempt_auth_info)
 
                     if codex_data:
                         return True, codex_data
@@ -1830,9 +2782,179 @@ def authorize_only(email: str, password: str) -> tuple[bool, dict]:
     return False, None
 
 
+def _run_batch_account(email: str, password: str, register: bool, should_stop=None, on_start=None):
+    """批量任务: 执行单个账号的浏览器流程，已请求停止时不再开始 (返回 None)"""
+    if should_stop is not None and should_stop():
+        return None
+    if on_start is not None:
+        on_start(email)
+    if register:
+        return register_and_authorize(email, password)
+    return authorize_only(email, password)
+
+
+def register_and_authorize_batch(accounts: list, max_workers: int = BROWSER_POOL_SIZE, should_stop=None,
+                                 on_start=None, on_result=None) -> dict:
+    """多线程并发执行浏览器流程 (注册 + 授权，或已注册账号仅授权)
+
+    每个线程调用 register_and_authorize / authorize_only (各自带重试)，浏览器实例统一从 BrowserPool 获取；
+    执行期间实例池上限临时提高到 max_workers，各账号等待验证码/回调的时间相互重叠。
+
+    Args:
+        accounts: [(email, password, register), ...]，register 为 False 时只执行授权
+        max_workers: 并发线程数 (同时运行的浏览器数)
+        should_stop: 返回 True 时不再开始新的账号 (如收到中断信号)，已开始的账号照常完成
+        on_start: on_start(email)，账号开始处理时在工作线程中调用
+        on_result: on_result(email, (success, codex_data))，每个账号完成后立即在调用线程中调用，
+            调用方可以在这里逐个保存结果，中断时已完成的账号不会丢失
+
+    Returns:
+        dict: {email: (success, codex_data)}，与 register_and_authorize / authorize_only 的返回值相同；
+            因停止而未开始的账号不在结果中
+    """
+    results = {}
+    if not accounts:
+        return results
+
+    max_workers = max(1, min(max_workers, len(accounts)))
+    futures = {}
+    reported = set()
+
+    def report(future):
+        reported.add(future)
+        email = futures[future]
+        try:
+            outcome = future.result()
+        except Exception as e:
+            log.error(f"并发处理异常 ({email}): {e}")
+            outcome = (False, None)
+        if outcome is None:
+            return
+        results[email] = outcome
+        if on_result is not None:
+            try:
+                on_result(email, outcome)
+            except Exception as e:
+                log.error(f"保存账号结果异常 ({email}): {e}")
+
+    with get_browser_pool().capacity(max_workers):
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="browser-batch")
+        try:
+            for email, password, register in accounts:
+                future = executor.submit(_run_batch_account, email, password, register, should_stop, on_start)
+                futures[future] = email
+            for future in as_completed(futures):
+                report(future)
+        finally:
+            # 中断时取消排队中的账号，只等待已开始的流程结束
+            executor.shutdown(wait=True, cancel_futures=True)
+            # 等待期间完成的账号同样交给 on_result 保存
+            for future in futures:
+                if future not in reported and future.done() and not future.cancelled():
+                    report(future)
+
+    return results
+
+
+def authorize_only_batch(accounts: list, max_workers: int = 4) -> list:
+    """多线程并发执行仅授权流程 (已注册但未授权的账号)
+
+    Args:
+        accounts: [(email, password), ...]
+        max_workers: 并发线程数 (同时运行的浏览器数)
+
+    Returns:
+        list: [(email, success, codex_data), ...]，顺序与 accounts 一致
+    """
+    results = register_and_authorize_batch(
+        [(email, password, False) for email, password in accounts],
+        max_workers=max_workers,
+    )
+    return [(email, *results.get(email, (False, None))) for email, _ in accounts]
+
+
 # ==================== CPA 授权函数 ====================
 
-def perform_cpa_authorization(page, email: str, password: str) -> bool:
+def _cpa_poll_delay(poll: int) -> float:
+    """CPA 回调轮询间隔: 从 0.15s 开始按 1.5 倍增长，最多 1.5s"""
+    return min(1.5, 0.15 * 1.5 ** poll)
+
+
+def _wait_for_cpa_callback(page, max_wait: int = 45, label: str = "CPA") -> str:
+    """等待 CPA 授权回调 URL (localhost:1455)，期间点击授权页上的授权按钮
+
+    Args:
+        page: 浏览器页面对象
+        max_wait: 最长等待时间 (秒)
+        label: 日志前缀
+
+    Returns:
+        str: 回调 URL，超时返回 None
+    """
+    start_time = time.time()
+    callback_url = None
+    progress_shown = False
+    last_url_in_loop = None
+    poll = 0  # 同一 URL 下的轮询次数，URL 变化时重置
+    log.step(f"等待 {label} 授权回调 (最多 {max_wait}s)...")
+
+    # 回调请求一发出即可拿到地址，不必等待页面跳转完成
+    url_watcher = _UrlWatcher(page, request_filter=is_cpa_callback_url).start()
+    while time.time() - start_time < max_wait:
+        try:
+            current_url = url_watcher.current_url()
+
+            # 记录 URL 变化
+            if current_url != last_url_in_loop:
+                log_current_url(page, f"{label}等待回调中", url=current_url)
+                last_url_in_loop = current_url
+                poll = 0
+
+            # 检查是否到达回调页面 (CPA 使用 localhost:1455)
+            if is_cpa_callback_url(current_url):
+                if progress_shown:
+                    log.progress_clear()
+                    progress_shown = False
+                log.success("CPA 获取到回调 URL")
+                log.info(f"[URL] CPA回调地址: {current_url}", icon="browser")
+                callback_url = current_url
+                break
+
+            # 尝试点击授权按钮 (同一页面上隔一轮查找一次)
+            if poll % 2 == 0:
+                clicked = click_authorize_button(page)
+                if clicked is not None:
+                    if progress_shown:
+                        log.progress_clear()
+                        progress_shown = False
+                    log.step(f"点击按钮: {clicked}")
+                    url_watcher.wait(1.5)
+
+            elapsed = int(time.time() - start_time)
+            log.progress_inline(f"[{label}等待中... {elapsed}s]")
+            progress_shown = True
+            url_watcher.wait(_cpa_poll_delay(poll))
+            poll += 1
+
+        except Exception as e:
+            if progress_shown:
+                log.progress_clear()
+                progress_shown = False
+            log.warning(f"{label}检查异常: {e}")
+            time.sleep(_cpa_poll_delay(poll))
+            poll += 1
+
+    url_watcher.stop()
+
+    if progress_shown:
+        log.progress_clear()
+
+    if not callback_url:
+        log.error(f"{label} 无法获取回调 URL")
+    return callback_url
+
+
+def perform_cpa_authorization(page, email: str, password: str, auth_info: tuple = None) -> bool:
     """执行 CPA 授权流程 (密码登录)
 
     与 CRS 的关键差异:
@@ -1844,6 +2966,7 @@ def perform_cpa_authorization(page, email: str, password: str) -> bool:
         page: 浏览器实例
         email: 邮箱地址
         password: 密码
+        auth_info: 预先生成的 (auth_url, state)，为空时现场生成
 
     Returns:
         bool: 授权是否成功
@@ -1851,7 +2974,7 @@ def perform_cpa_authorization(page, email: str, password: str) -> bool:
     log.info(f"开始 CPA 授权: {email}", icon="code")
 
     # 生成授权 URL
-    auth_url, state = cpa_generate_auth_url()
+    auth_url, state = auth_info or cpa_generate_auth_url()
     if not auth_url or not state:
         log.error("无法获取 CPA 授权 URL")
         return False
@@ -1859,8 +2982,7 @@ def perform_cpa_authorization(page, email: str, password: str) -> bool:
     # 打开授权页面
     log.step("打开 CPA 授权页面...")
     log.info(f"[URL] CPA授权URL: {auth_url}", icon="browser")
-    page.get(auth_url)
-    wait_for_page_stable(page, timeout=5)
+    open_auth_page(page, auth_url)
     log_current_url(page, "CPA授权页面加载完成", force=True)
 
     # 检测错误页面
@@ -1869,15 +2991,13 @@ def perform_cpa_authorization(page, email: str, password: str) -> bool:
     try:
         # 输入邮箱
         log.step("输入邮箱...")
-        email_input = wait_for_element(page, 'css:input[type="email"]', timeout=10)
-        if not email_input:
-            email_input = wait_for_element(page, 'css:input[name="email"]', timeout=5)
+        email_input = wait_for_element(page, _EMAIL_INPUT_ANY, timeout=10)
         if email_input:
-            type_slowly(page, 'css:input[type="email"], input[name="email"]', email, base_delay=0.06)
+            type_slowly(page, _EMAIL_INPUT_ANY, email, base_delay=0.06)
 
             # 点击继续
             log.step("点击继续...")
-            continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
+            continue_btn = wait_for_element(page, _SUBMIT_BUTTON, timeout=5)
             if continue_btn:
                 old_url = page.url
                 continue_btn.click()
@@ -1886,20 +3006,19 @@ def perform_cpa_authorization(page, email: str, password: str) -> bool:
     except Exception as e:
         log.warning(f"CPA 邮箱输入步骤异常: {e}")
 
-    log_current_url(page, "CPA-邮箱步骤完成后")
-
     # 输入密码
     current_url = page.url
+    log_current_url(page, "CPA-邮箱步骤完成后", url=current_url)
     if "/password" in current_url:
         try:
             log.step("输入密码...")
-            password_input = wait_for_element(page, 'css:input[type="password"]', timeout=10)
+            password_input = wait_for_element(page, _PASSWORD_INPUT, timeout=10)
 
             if password_input:
-                type_slowly(page, 'css:input[type="password"]', password, base_delay=0.06)
+                fast_fill(page, _PASSWORD_INPUT, password)
 
                 log.step("点击继续...")
-                continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
+                continue_btn = wait_for_element(page, _SUBMIT_BUTTON, timeout=5)
                 if continue_btn:
                     old_url = page.url
                     continue_btn.click()
@@ -1911,65 +3030,9 @@ def perform_cpa_authorization(page, email: str, password: str) -> bool:
     log_current_url(page, "CPA-密码步骤完成后")
 
     # 等待授权回调
-    max_wait = 45
-    start_time = time.time()
-    callback_url = None
-    progress_shown = False
-    last_url_in_loop = None
-    log.step(f"等待 CPA 授权回调 (最多 {max_wait}s)...")
-
-    while time.time() - start_time < max_wait:
-        try:
-            current_url = page.url
-
-            # 记录 URL 变化
-            if current_url != last_url_in_loop:
-                log_current_url(page, "CPA等待回调中")
-                last_url_in_loop = current_url
-
-            # 检查是否到达回调页面 (CPA 使用 localhost:1455)
-            if is_cpa_callback_url(current_url):
-                if progress_shown:
-                    log.progress_clear()
-                log.success("CPA 获取到回调 URL")
-                log.info(f"[URL] CPA回调地址: {current_url}", icon="browser")
-                callback_url = current_url
-                break
-
-            # 尝试点击授权按钮
-            try:
-                buttons = page.eles('css:button[type="submit"]')
-                for btn in buttons:
-                    if btn.states.is_displayed and btn.states.is_enabled:
-                        btn_text = btn.text.lower()
-                        if any(x in btn_text for x in ['allow', 'authorize', 'continue', '授权', '允许', '继续', 'accept']):
-                            if progress_shown:
-                                log.progress_clear()
-                                progress_shown = False
-                            log.step(f"点击按钮: {btn.text}")
-                            btn.click()
-                            time.sleep(1.5)
-                            break
-            except Exception:
-                pass
-
-            elapsed = int(time.time() - start_time)
-            log.progress_inline(f"[CPA等待中... {elapsed}s]")
-            progress_shown = True
-            time.sleep(1.5)
-
-        except Exception as e:
-            if progress_shown:
-                log.progress_clear()
-                progress_shown = False
-            log.warning(f"CPA检查异常: {e}")
-            time.sleep(1.5)
-
-    if progress_shown:
-        log.progress_clear()
+    callback_url = _wait_for_cpa_callback(page, label="CPA")
 
     if not callback_url:
-        log.error("CPA 无法获取回调 URL")
         return False
 
     # CPA 特有流程: 提交回调 URL
@@ -2008,21 +3071,18 @@ def perform_cpa_authorization_with_otp(page, email: str) -> bool:
     # 打开授权页面
     log.step("打开 CPA 授权页面...")
     log.info(f"[URL] CPA授权URL: {auth_url}", icon="browser")
-    page.get(auth_url)
-    wait_for_page_stable(page, timeout=5)
+    open_auth_page(page, auth_url)
     log_current_url(page, "CPA-OTP授权页面加载完成", force=True)
 
     try:
         # 输入邮箱
         log.step("输入邮箱...")
-        email_input = wait_for_element(page, 'css:input[type="email"]', timeout=10)
-        if not email_input:
-            email_input = wait_for_element(page, 'css:input[name="email"]', timeout=5)
-        type_slowly(page, 'css:input[type="email"], input[name="email"], #email', email, base_delay=0.06)
+        email_input = wait_for_element(page, _EMAIL_INPUT_ANY, timeout=10)
+        type_slowly(page, _EMAIL_INPUT_ANY, email, base_delay=0.06)
 
         # 点击继续
         log.step("点击继续...")
-        continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
+        continue_btn = wait_for_element(page, _SUBMIT_BUTTON, timeout=5)
         if continue_btn:
             old_url = page.url
             continue_btn.click()
@@ -2032,23 +3092,16 @@ def perform_cpa_authorization_with_otp(page, email: str) -> bool:
     except Exception as e:
         log.warning(f"CPA OTP 邮箱输入步骤异常: {e}")
 
-    log_current_url(page, "CPA-OTP流程-邮箱步骤完成后")
+    current_url = page.url
+    log_current_url(page, "CPA-OTP流程-邮箱步骤完成后", url=current_url)
 
     try:
         # 检查是否在密码页面，如果是则点击"使用一次性验证码登录"
-        current_url = page.url
         if "/log-in/password" in current_url or "/password" in current_url:
             log.step("检测到密码页面，点击使用一次性验证码登录...")
-            otp_btn = wait_for_element(page, 'text=使用一次性验证码登录', timeout=5)
-            if not otp_btn:
-                otp_btn = wait_for_element(page, 'text=Log in with a one-time code', timeout=3)
+            otp_btn = wait_for_element(page, _OTP_LOGIN_BUTTON, timeout=5)
             if not otp_btn:
-                buttons = page.eles('css:button')
-                for btn in buttons:
-                    btn_text = btn.text.lower()
-                    if '一次性验证码' in btn_text or 'one-time' in btn_text:
-                        otp_btn = btn
-                        break
+                otp_btn = page.ele(_OTP_BUTTON_ANY, timeout=0)
 
             if otp_btn:
                 old_url = page.url
@@ -2070,7 +3123,7 @@ def perform_cpa_authorization_with_otp(page, email: str) -> bool:
 
     if not verification_code:
         log.warning(f"自动获取验证码失败: {error}")
-        verification_code = input("   请手动输入验证码: ").strip()
+        verification_code = _prompt_verification_code("   请手动输入验证码: ")
         if not verification_code:
             log.error("未输入验证码")
             return False
@@ -2080,49 +3133,35 @@ def perform_cpa_authorization_with_otp(page, email: str) -> bool:
     for code_attempt in range(max_code_retries):
         try:
             log.step(f"输入验证码: {verification_code}")
-            code_input = wait_for_element(page, 'css:input[name="otp"]', timeout=10)
-            if not code_input:
-                code_input = wait_for_element(page, 'css:input[type="text"]', timeout=5)
-            if not code_input:
-                code_input = wait_for_element(page, 'css:input[autocomplete="one-time-code"]', timeout=5)
+            code_input = wait_for_element(page, _OTP_INPUT, timeout=10)
 
             if code_input:
                 try:
                     code_input.clear()
                 except Exception:
                     pass
-                type_slowly(page, 'css:input[name="otp"], input[type="text"], input[autocomplete="one-time-code"]', verification_code, base_delay=0.08)
+                fast_fill(page, _OTP_INPUT, verification_code)
                 log.success("验证码已输入")
             else:
                 log.error("未找到验证码输入框")
                 return False
 
             log.step("点击继续...")
-            time.sleep(1)
-            continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
+            continue_btn = wait_for_element(page, _SUBMIT_BUTTON, timeout=5)
+            code_rejected = False
             if continue_btn:
-                continue_btn.click()
-                time.sleep(2)
+                code_rejected = _submit_code_and_check(page, continue_btn.click)
 
             # 检查验证码错误
             try:
-                error_text = page.ele('text:代码不正确', timeout=1) or \
-                             page.ele('text:incorrect', timeout=1) or \
-                             page.ele('text:Invalid code', timeout=1)
-
-                if error_text and error_text.states.is_displayed:
+                if code_rejected:
                     if code_attempt < max_code_retries - 1:
                         log.warning(f"验证码错误，尝试重新获取 ({code_attempt + 1}/{max_code_retries})...")
-                        resend_btn = page.ele('text:重新发送电子邮件', timeout=3) or \
-                                     page.ele('text:Resend email', timeout=2) or \
-                                     page.ele('text:resend', timeout=2)
-                        if resend_btn:
-                            resend_btn.click()
+                        if click_text_button(page, _RESEND_EMAIL_TEXTS):
                             log.info("已点击重新发送，等待新验证码...")
-                            time.sleep(3)
-                            verification_code, error, email_time = unified_get_verification_code(email)
+                            verification_code, error, email_time = unified_get_verification_code(email, after=email_time)
                             if not verification_code:
-                                verification_code = input("   请手动输入验证码: ").strip()
+                                verification_code = _prompt_verification_code("   请手动输入验证码: ")
                             if verification_code:
                                 continue
                         log.warning("无法重新发送验证码")
@@ -2139,62 +3178,9 @@ def perform_cpa_authorization_with_otp(page, email: str) -> bool:
             break
 
     # 等待授权回调
-    max_wait = 45
-    start_time = time.time()
-    callback_url = None
-    progress_shown = False
-    last_url_in_loop = None
-    log.step(f"等待 CPA 授权回调 (最多 {max_wait}s)...")
-
-    while time.time() - start_time < max_wait:
-        try:
-            current_url = page.url
-
-            if current_url != last_url_in_loop:
-                log_current_url(page, "CPA-OTP流程-等待回调中")
-                last_url_in_loop = current_url
-
-            if is_cpa_callback_url(current_url):
-                if progress_shown:
-                    log.progress_clear()
-                log.success("CPA 获取到回调 URL")
-                log.info(f"[URL] CPA回调地址: {current_url}", icon="browser")
-                callback_url = current_url
-                break
-
-            try:
-                buttons = page.eles('css:button[type="submit"]')
-                for btn in buttons:
-                    if btn.states.is_displayed and btn.states.is_enabled:
-                        btn_text = btn.text.lower()
-                        if any(x in btn_text for x in ['allow', 'authorize', 'continue', '授权', '允许', '继续', 'accept']):
-                            if progress_shown:
-                                log.progress_clear()
-                                progress_shown = False
-                            log.step(f"点击按钮: {btn.text}")
-                            btn.click()
-                            time.sleep(1.5)
-                            break
-            except Exception:
-                pass
-
-            elapsed = int(time.time() - start_time)
-            log.progress_inline(f"[CPA-OTP等待中... {elapsed}s]")
-            progress_shown = True
-            time.sleep(1.5)
-
-        except Exception as e:
-            if progress_shown:
-                log.progress_clear()
-                progress_shown = False
-            log.warning(f"CPA OTP 检查异常: {e}")
-            time.sleep(1.5)
-
-    if progress_shown:
-        log.progress_clear()
+    callback_url = _wait_for_cpa_callback(page, label="CPA-OTP")
 
     if not callback_url:
-        log.error("CPA OTP 无法获取回调 URL")
         return False
 
     # CPA 特有流程: 提交回调 URL
@@ -2235,135 +3221,143 @@ def login_and_get_session(page, email: str, password: str) -> dict:
         url = "https://chatgpt.com"
         log.step(f"打开 {url}")
         page.get(url)
-        wait_for_page_stable(page, timeout=8)
         log_current_url(page, "登录页面加载完成", force=True)
 
-        # 检查是否已登录
-        if is_logged_in(page):
-            log.info("已登录，直接获取 Session...")
-            return _fetch_session_data(page)
-
-        # 点击登录按钮
-        log.step("点击登录...")
-        login_btn = wait_for_element(page, 'css:[data-testid="login-button"]', timeout=5)
-        if not login_btn:
-            login_btn = wait_for_element(page, 'text:登录', timeout=3)
-        if not login_btn:
-            login_btn = wait_for_element(page, 'text:Log in', timeout=3)
+        # 先看会话 Cookie (无网络请求): 没有 Cookie 时不必等待 SPA 渲染稳定再做登录检测，
+        # 直接进入登录步骤 (点击登录按钮时会等待按钮出现)
+        if _has_session_cookie(page):
+            wait_for_page_stable(page, timeout=8)
+            if is_logged_in(page):
+                log.info("已登录，直接获取 Session...")
+                return _fetch_session_data(page)
 
-        if login_btn:
-            old_url = page.url
-            login_btn.click()
-            # 等待页面变化
-            for _ in range(6):
-                time.sleep(0.5)
-                if page.url != old_url:
-                    log_url_change(page, old_url, "点击登录按钮")
-                    break
-                # 检测弹窗中的邮箱输入框
-                try:
-                    email_input = page.ele('css:input[type="email"], input[name="email"]', timeout=1)
-                    if email_input and email_input.states.is_displayed:
-                        break
-                except Exception:
-                    pass
+        # 订阅导航事件: 登录流程中由 URL 变化驱动，不再按固定间隔轮询
+        url_watcher = _UrlWatcher(page).start()
+        try:
+            return _login_steps(page, email, password, url_watcher)
+        finally:
+            url_watcher.stop()
 
-        current_url = page.url
-        log_current_url(page, "登录按钮点击后")
+    except Exception as e:
+        log.error(f"登录失败: {e}")
+        return None
 
-        # 登录流程循环
-        max_steps = 10
-        for step in range(max_steps):
-            current_url = page.url
-            log_current_url(page, f"登录流程步骤 {step + 1}")
 
-            # 检查是否已登录成功
-            if "chatgpt.com" in current_url and "auth.openai.com" not in current_url:
-                if is_logged_in(page):
-                    log.success("登录成功")
-                    # 检查并选择工作空间
-                    _check_and_select_workspace(page)
-                    time.sleep(1)
-                    return _fetch_session_data(page)
-
-            # 步骤1: 输入邮箱
-            if "auth.openai.com/log-in-or-create-account" in current_url or \
-               ("chatgpt.com" in current_url and "auth.openai.com" not in current_url):
-                email_input = wait_for_element(page, 'css:input[type="email"]', timeout=5)
-                if email_input:
-                    log.step("输入邮箱...")
-                    human_delay()
-                    type_slowly(page, 'css:input[type="email"]', email)
-                    log.success("邮箱已输入")
+def _email_popup_shown(page) -> bool:
+    """登录弹窗中的邮箱输入框是否已显示"""
+    try:
+        email_input = page.ele(_EMAIL_INPUT_ANY, timeout=0)
+        return bool(email_input and email_input.states.is_displayed)
+    except Exception:
+        return False
 
-                    human_delay(0.5, 1.0)
-                    log.step("点击继续...")
-                    continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
-                    if continue_btn:
-                        old_url = page.url
-                        continue_btn.click()
-                        wait_for_url_change(page, old_url, timeout=10)
-                    continue
-
-            # 步骤2: 输入密码
-            if "/password" in current_url:
-                password_input = wait_for_element(page, 'css:input[type="password"]', timeout=5)
-                if password_input:
-                    # 检查是否已输入密码
-                    try:
-                        current_value = password_input.attr('value') or ''
-                        if len(current_value) > 0:
-                            log.info("密码已输入，点击继续...")
-                            continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
-                            if continue_btn:
-                                old_url = page.url
-                                continue_btn.click()
-                                wait_for_url_change(page, old_url, timeout=10)
-                            continue
-                    except Exception:
-                        pass
 
-                    log.step("输入密码...")
-                    human_delay()
-                    type_slowly(page, 'css:input[type="password"]', password)
-                    log.success("密码已输入")
+def _login_steps(page, email: str, password: str, url_watcher: _UrlWatcher) -> dict:
+    """login_and_get_session 的登录步骤: 点击登录、输入邮箱/密码、选择工作空间
 
-                    human_delay(0.5, 1.0)
-                    log.step("点击继续...")
-                    continue_btn = wait_for_element(page, 'css:button[type="submit"]', timeout=5)
-                    if continue_btn:
-                        old_url = page.url
-                        continue_btn.click()
-                        wait_for_url_change(page, old_url, timeout=10)
-                    continue
+    Returns:
+        dict: {"token": "...", "account_id": "..."} 或 None
+    """
+    # 点击登录按钮
+    log.step("点击登录...")
+    login_btn = wait_for_element(page, _LOGIN_BUTTON_ANY, timeout=5)
+
+    if login_btn:
+        old_url = url_watcher.current_url()
+        login_btn.click()
+        # 等待跳转或登录弹窗出现
+        wait_until(lambda: url_watcher.current_url() != old_url or _email_popup_shown(page), timeout=3)
+        if url_watcher.current_url() != old_url:
+            log_url_change(page, old_url, "点击登录按钮")
+
+    log_current_url(page, "登录按钮点击后", url=url_watcher.current_url())
+
+    # 登录流程循环
+    max_steps = 10
+    for step in range(max_steps):
+        current_url = url_watcher.current_url()
+        log_current_url(page, f"登录流程步骤 {step + 1}", url=current_url)
+
+        # 检查是否已登录成功
+        if "chatgpt.com" in current_url and "auth.openai.com" not in current_url:
+            if is_logged_in(page):
+                log.success("登录成功")
+                # 检查并选择工作空间
+                _check_and_select_workspace(page)
+                return _fetch_session_data(page)
+
+        # 步骤1: 输入邮箱
+        if "auth.openai.com/log-in-or-create-account" in current_url or \
+           ("chatgpt.com" in current_url and "auth.openai.com" not in current_url):
+            email_input = wait_for_element(page, _EMAIL_INPUT, timeout=5)
+            if email_input:
+                log.step("输入邮箱...")
+                human_delay()
+                type_slowly(page, _EMAIL_INPUT, email)
+                log.success("邮箱已输入")
 
-            # 处理错误
-            if check_and_handle_error(page):
-                time.sleep(0.5)
+                log.step("点击继续...")
+                continue_btn = wait_for_element(page, _SUBMIT_BUTTON, timeout=5)
+                if continue_btn:
+                    old_url = url_watcher.current_url()
+                    continue_btn.click()
+                    url_watcher.wait_change(old_url, timeout=10)
                 continue
 
-            # 检查是否出现工作空间选择页面
-            if _check_and_select_workspace(page):
-                # 选择工作空间后继续
-                time.sleep(1)
+        # 步骤2: 输入密码
+        if "/password" in current_url:
+            password_input = wait_for_element(page, _PASSWORD_INPUT, timeout=5)
+            if password_input:
+                # 检查是否已输入密码
+                try:
+                    current_value = password_input.attr('value') or ''
+                    if len(current_value) > 0:
+                        log.info("密码已输入，点击继续...")
+                        continue_btn = wait_for_element(page, _SUBMIT_BUTTON, timeout=5)
+                        if continue_btn:
+                            old_url = url_watcher.current_url()
+                            continue_btn.click()
+                            url_watcher.wait_change(old_url, timeout=10)
+                        continue
+                except Exception:
+                    pass
+
+                log.step("输入密码...")
+                human_delay()
+                fast_fill(page, _PASSWORD_INPUT, password)
+                log.success("密码已输入")
+
+                log.step("点击继续...")
+                continue_btn = wait_for_element(page, _SUBMIT_BUTTON, timeout=5)
+                if continue_btn:
+                    old_url = url_watcher.current_url()
+                    continue_btn.click()
+                    url_watcher.wait_change(old_url, timeout=10)
                 continue
 
-            time.sleep(0.5)
+        # 处理错误
+        if check_and_handle_error(page):
+            url_watcher.wait(0.5)
+            continue
 
-        # 最终检查是否登录成功
-        if is_logged_in(page):
-            # 再次检查工作空间选择
-            _check_and_select_workspace(page)
-            time.sleep(1)
-            log.success("登录成功")
-            return _fetch_session_data(page)
+        # 检查是否出现工作空间选择页面
+        if _check_and_select_workspace(page):
+            # 选择工作空间后继续
+            url_watcher.wait(1)
+            continue
 
-        log.error("登录流程未完成")
-        return None
+        # 等待下一次导航 (有跳转立即进入下一步)
+        url_watcher.wait(0.5)
 
-    except Exception as e:
-        log.error(f"登录失败: {e}")
-        return None
+    # 最终检查是否登录成功
+    if is_logged_in(page):
+        # 再次检查工作空间选择
+        _check_and_select_workspace(page)
+        log.success("登录成功")
+        return _fetch_session_data(page)
+
+    log.error("登录流程未完成")
+    return None
 
 
 def _check_and_select_workspace(page) -> bool:
@@ -2376,19 +3370,14 @@ def _check_and_select_workspace(page) -> bool:
     """
     try:
         # 检查是否有"启动工作空间"文字
-        workspace_text = page.ele('text:启动工作空间', timeout=2)
-        if not workspace_text:
-            workspace_text = page.ele('text:Launch workspace', timeout=1)
-        
+        workspace_text = page.ele(_WORKSPACE_PAGE_TEXT, timeout=2)
         if not workspace_text:
             return False
         
         log.info("检测到工作空间选择页面")
         
         # 直接点击第一个"打开"按钮
-        open_btn = page.ele('text:打开', timeout=2)
-        if not open_btn:
-            open_btn = page.ele('text:Open', timeout=1)
+        open_btn = page.ele(_WORKSPACE_OPEN_BUTTON, timeout=2)
         
         if open_btn:
             log.step("选择第一个工作空间...")
@@ -2420,16 +3409,39 @@ def _is_job_selection_page(page) -> bool:
         bool: 是否在职业选择页面
     """
     try:
-        job_text = page.ele('text:你从事哪种工作', timeout=2)
-        if not job_text:
-            job_text = page.ele('text:What kind of work do you do', timeout=1)
+        job_text = page.ele(_JOB_SELECTION_TEXT, timeout=2)
         return bool(job_text)
     except Exception:
         return False
 
 
+_SESSION_API_URL = "https://chatgpt.com/api/auth/session"
+_SESSION_FETCH_JS = '''
+    return fetch('/api/auth/session', {credentials: 'include'}).then(r => r.text());
+'''
+
+
+def _read_session_text(page) -> str:
+    """读取 session API 的响应文本
+
+    当前页面已在 chatgpt.com 时在页面内 fetch，不离开当前页面；
+    否则 (或 fetch 失败时) 导航到 session API 页面读取 body 文本。
+    """
+    if urlsplit(page.url or "").hostname == "chatgpt.com":
+        try:
+            text = page.run_js(_SESSION_FETCH_JS)
+            if text:
+                return text
+        except Exception as e:
+            log.warning(f"页面内获取 Session 失败，改为打开 API 页面: {e}")
+
+    page.get(_SESSION_API_URL)
+    body = page.ele('tag:body', timeout=5)
+    return body.text if body else None
+
+
 def _fetch_session_data(page) -> dict:
-    """访问 session API 页面获取 token 和 account_id
+    """获取 session API 中的 token 和 account_id
 
     Args:
         page: 浏览器页面实例
@@ -2438,25 +3450,13 @@ def _fetch_session_data(page) -> dict:
         dict: {"token": "...", "account_id": "..."} 或 None
     """
     try:
-        import json as json_module
-
-        # 直接访问 session API 页面
         log.step("获取 Session 数据...")
-        page.get("https://chatgpt.com/api/auth/session")
-        time.sleep(1)
-        
-        # 获取页面内容（JSON）
-        body = page.ele('tag:body', timeout=5)
-        if not body:
-            log.error("无法获取页面内容")
-            return None
-        
-        text = body.text
+        text = _read_session_text(page)
         if not text or text == '{}':
             log.error("Session 数据为空")
             return None
-        
-        data = json_module.loads(text)
+
+        data = orjson.loads(text) if orjson is not None else json.loads(text)
         token = data.get('accessToken')
         user = data.get('user', {})
         account = data.get('account', {})
@@ -2504,6 +3504,9 @@ def login_and_authorize_team_owner(email: str, password: str, proxy: dict = None
             try:
                 page = ctx.page
 
+                # 授权 URL 与登录无关，在后台生成，与浏览器登录并行
+                auth_future = _auth_url_executor.submit(_generate_auth_url)
+
                 if proxy:
                     proxy_url = format_proxy_url(proxy)
                     if proxy_url:
@@ -2519,10 +3522,11 @@ def login_and_authorize_team_owner(email: str, password: str, proxy: dict = None
 
                 token = session_data["token"]
                 account_id = session_data["account_id"]
+                auth_info = _prefetched_auth_info(auth_future)
 
                 # 步骤2: 进行授权
                 if AUTH_PROVIDER == "cpa":
-                    success = perform_cpa_authorization(page, email, password)
+                    success = perform_cpa_authorization(page, email, password, auth_info=auth_info)
                     return {
                         "success": success,
                         "token": token,
@@ -2530,7 +3534,7 @@ def login_and_authorize_team_owner(email: str, password: str, proxy: dict = None
                         "authorized": success
                     }
                 else:
-                    codex_data = perform_codex_authorization(page, email, password)
+                    codex_data = perform_codex_authorization(page, email, password, auth_info=auth_info)
                     if codex_data:
                         from crs_service import crs_add_account
                         crs_result = crs_add_account(email, codex_data)
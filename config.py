@@ -1,7 +1,8 @@
 # ==================== 配置模块 ====================
+import functools
 import json
 import random
-import re
+import secrets
 import string
 import sys
 from datetime import datetime
@@ -15,6 +16,16 @@ except ImportError:
     except ImportError:
         tomllib = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # ==================== 路径 ====================
 BASE_DIR = Path(__file__).parent
 CONFIG_FILE = BASE_DIR / "config.toml"
@@ -59,8 +70,20 @@ def get_config_errors() -> list:
     return _config_errors.copy()
 
 
+# 已解析的配置文件: {path: ((mtime_ns, size), data)}
+# importlib.reload(config) 时沿用上一次的缓存，文件未修改就不重新解析
+_FILE_CACHE = globals().get("_FILE_CACHE", {})
+
+
+def _parse_json_bytes(data: bytes):
+    """解析 JSON (安装了 orjson 时使用 orjson)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _load_toml() -> dict:
-    """加载 TOML 配置文件"""
+    """加载 TOML 配置文件 (按修改时间缓存解析结果，配置只读)"""
     if tomllib is None:
         _log_config("WARNING", "config.toml", "tomllib 未安装", "请安装 tomli: pip install tomli")
         return {}
@@ -70,10 +93,17 @@ def _load_toml() -> dict:
         return {}
 
     try:
+        stat = CONFIG_FILE.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = _FILE_CACHE.get(CONFIG_FILE)
+        if cached and cached[0] == version:
+            return cached[1]
+
         with open(CONFIG_FILE, "rb") as f:
             config = tomllib.load(f)
-            _log_config("INFO", "config.toml", "配置文件加载成功")
-            return config
+        _FILE_CACHE[CONFIG_FILE] = (version, config)
+        _log_config("INFO", "config.toml", "配置文件加载成功")
+        return config
     except tomllib.TOMLDecodeError as e:
         _log_config("ERROR", "config.toml", "TOML 解析错误", str(e))
         return {}
@@ -85,6 +115,19 @@ def _load_toml() -> dict:
         return {}
 
 
+def _read_team_json():
+    """读取 team.json 原始数据
+
+    安装了 ijson 且顶层是数组时逐条流式解析，不把整个文件内容读入内存
+    """
+    if ijson is not None:
+        with open(TEAM_JSON_FILE, "rb") as f:
+            if f.read(64).lstrip().startswith(b"["):
+                f.seek(0)
+                return list(ijson.items(f, "item", use_float=True))
+    return _parse_json_bytes(TEAM_JSON_FILE.read_bytes())
+
+
 def _load_teams() -> list:
     """加载 Team 配置文件"""
     if not TEAM_JSON_FILE.exists():
@@ -92,11 +135,11 @@ def _load_teams() -> list:
         return []
 
     try:
-        with open(TEAM_JSON_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            teams = data if isinstance(data, list) else [data]
-            _log_config("INFO", "team.json", f"加载了 {len(teams)} 个 Team 配置")
-            return teams
+        # 每次都重新解析: 返回的 dict 会被修改后写回 team.json，不能跨 reload 共享
+        data = _read_team_json()
+        teams = data if isinstance(data, list) else [data]
+        _log_config("INFO", "team.json", f"加载了 {len(teams)} 个 Team 配置")
+        return teams
     except json.JSONDecodeError as e:
         _log_config("ERROR", "team.json", "JSON 解析错误", str(e))
         return []
@@ -110,7 +153,6 @@ def _load_teams() -> list:
 
 # ==================== 加载配置 ====================
 _cfg = _load_toml()
-_raw_teams = _load_teams()
 
 
 def _parse_team_config(t: dict, index: int) -> dict:
@@ -168,11 +210,26 @@ def _parse_team_config(t: dict, index: int) -> dict:
         }
 
 
-# 转换 team.json 格式为 team_service.py 期望的格式
-TEAMS = []
-for i, t in enumerate(_raw_teams):
-    team_config = _parse_team_config(t, i)
-    TEAMS.append(team_config)
+@functools.lru_cache(maxsize=1)
+def _get_raw_teams() -> list:
+    """team.json 原始数据 (首次使用时才读取)"""
+    return _load_teams()
+
+
+@functools.lru_cache(maxsize=1)
+def get_teams() -> list:
+    """转换 team.json 格式为 team_service.py 期望的格式 (首次调用时加载，之后返回同一个列表)"""
+    return [_parse_team_config(t, i) for i, t in enumerate(_get_raw_teams())]
+
+
+def __getattr__(name: str):
+    """TEAMS 延迟加载 (PEP 562): 只用到标量配置的模块导入 config 时不读取 team.json
+
+    TEAMS 不写入模块全局变量，importlib.reload(config) 后会重新加载。
+    """
+    if name == "TEAMS":
+        return get_teams()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def save_team_json():
@@ -184,7 +241,7 @@ def save_team_json():
         return False
 
     updated = False
-    for team in TEAMS:
+    for team in get_teams():
         if team.get("format") == "new":
             raw = team.get("raw", {})
             # 保存 account_id
@@ -203,9 +260,12 @@ def save_team_json():
     if not updated:
         return False
 
+    # Team 数据已变化，下次查询时重建邮箱/org_id 索引
+    _team_indexes["teams"] = None
+
     try:
         with open(TEAM_JSON_FILE, "w", encoding="utf-8") as f:
-            json.dump(_raw_teams, f, ensure_ascii=False, indent=2)
+            json.dump(_get_raw_teams(), f, ensure_ascii=False, indent=2)
         return True
     except Exception as e:
         _log_config("ERROR", "team.json", "保存失败", str(e))
@@ -337,12 +397,25 @@ REGISTER_NAME = _reg.get("name", "test")
 REGISTER_BIRTHDAY = _reg.get("birthday", {"year": "2000", "month": "01", "day": "01"})
 
 
+_BIRTHDAY_YEARS = 6     # 2000-2005
+_BIRTHDAY_DAYS = 28     # 用28避免月份天数问题
+_BIRTHDAY_CACHE = {}    # 相同日期复用同一个 dict (调用方只读)
+
+
 def get_random_birthday() -> dict:
-    """生成随机生日 (2000-2005年)"""
-    year = str(random.randint(2000, 2005))
-    month = str(random.randint(1, 12)).zfill(2)
-    day = str(random.randint(1, 28)).zfill(2)  # 用28避免月份天数问题
-    return {"year": year, "month": month, "day": day}
+    """生成随机生日 (2000-2005年)，一次随机数取样后拆分出年/月/日"""
+    r = random.randrange(_BIRTHDAY_YEARS * 12 * _BIRTHDAY_DAYS)
+    r, day = divmod(r, _BIRTHDAY_DAYS)
+    year, month = divmod(r, 12)
+    key = (year, month, day)
+    birthday = _BIRTHDAY_CACHE.get(key)
+    if birthday is None:
+        birthday = _BIRTHDAY_CACHE.setdefault(key, {
+            "year": str(2000 + year),
+            "month": f"{month + 1:02d}",
+            "day": f"{day + 1:02d}",
+        })
+    return birthday
 
 # 请求
 _req = _cfg.get("request", {})
@@ -360,6 +433,8 @@ _browser = _cfg.get("browser", {})
 BROWSER_WAIT_TIMEOUT = _browser.get("wait_timeout", 60)
 BROWSER_SHORT_WAIT = _browser.get("short_wait", 10)
 BROWSER_HEADLESS = _browser.get("headless", False)
+BROWSER_POOL_SIZE = _browser.get("pool_size", 1)
+BROWSER_MAX_USES = _browser.get("max_uses", 50)
 
 # 文件
 _files = _cfg.get("files", {})
@@ -502,23 +577,61 @@ def get_random_domain() -> str:
     return random.choice(EMAIL_DOMAINS) if EMAIL_DOMAINS else EMAIL_DOMAIN
 
 
+def get_random_domains(count: int) -> list:
+    """一次取出 count 个随机域名 (批量生成邮箱用)"""
+    return random.choices(EMAIL_DOMAINS, k=count) if EMAIL_DOMAINS else [EMAIL_DOMAIN] * count
+
+
+_PREFIX_ALPHABET = string.ascii_lowercase + string.digits
+
+
+def random_email_prefix(length: int = 8) -> str:
+    """生成随机邮箱前缀 (小写字母+数字)"""
+    return ''.join(secrets.choice(_PREFIX_ALPHABET) for _ in range(length))
+
+
 def generate_random_email(prefix_len: int = 8) -> str:
-    prefix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=prefix_len))
+    prefix = random_email_prefix(prefix_len)
     return f"{prefix}oaiteam@{get_random_domain()}"
 
 
+# ASCII 中非字母数字字符的删除表 (非 ASCII 字符在 encode 时丢弃)
+_NON_ALNUM_TABLE = str.maketrans("", "", "".join(c for c in map(chr, range(128)) if not c.isalnum()))
+
+
 def generate_email_for_user(username: str) -> str:
-    safe = re.sub(r'[^a-zA-Z0-9]', '', username.lower())[:20]
+    safe = username.lower().encode("ascii", "ignore").decode("ascii").translate(_NON_ALNUM_TABLE)[:20]
     return f"{safe}oaiteam@{get_random_domain()}"
 
 
 def get_team(index: int = 0) -> dict:
-    return TEAMS[index] if 0 <= index < len(TEAMS) else {}
+    teams = get_teams()
+    return teams[index] if 0 <= index < len(teams) else {}
+
+
+# owner_email / org_id -> Team 索引，随 get_teams() 返回的列表一起重建
+_team_indexes = {"teams": None, "by_email": {}, "by_org": {}}
+
+
+def _team_index(kind: str) -> dict:
+    """按 get_teams() 的当前结果返回 Team 索引 (同一邮箱/org_id 以第一个为准)
+
+    团队列表重新加载 (返回新的列表对象) 或 save_team_json 之后自动重建。
+    """
+    teams = get_teams()
+    if _team_indexes["teams"] is not teams:
+        by_email, by_org = {}, {}
+        for t in teams:
+            by_email.setdefault(t.get("owner_email"), t)
+            if t.get("org_id"):
+                by_org.setdefault(t["org_id"], t)
+        _team_indexes.update(teams=teams, by_email=by_email, by_org=by_org)
+    return _team_indexes[kind]
 
 
 def get_team_by_email(email: str) -> dict:
-    return next((t for t in TEAMS if t.get("user", {}).get("email") == email), {})
+    return _team_index("by_email").get(email, {})
 
 
 def get_team_by_org(org_id: str) -> dict:
-    return next((t for t in TEAMS if t.get("account", {}).get("organizationId") == org_id), {})
+    return _team_index("by_org").get(org_id, {})
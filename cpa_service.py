@@ -8,9 +8,6 @@
 # - 账号入库: CPA 后台自动处理，CRS 需手动调用 add_account
 
 import time
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 from urllib.parse import urlparse, parse_qs
 
 from config import (
@@ -21,35 +18,10 @@ from config import (
     CPA_IS_WEBUI,
     REQUEST_TIMEOUT,
     USER_AGENT,
-    PROXY_ENABLED,
-    get_proxy_dict,
 )
 from logger import log
-
-
-def create_session_with_retry():
-    """创建带重试机制的 HTTP Session"""
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=5,
-        backoff_factor=1,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "POST", "OPTIONS"]
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
-
-    # 代理设置
-    if PROXY_ENABLED:
-        proxy_dict = get_proxy_dict()
-        if proxy_dict:
-            session.proxies = proxy_dict
-
-    return session
-
-
-http_session = create_session_with_retry()
+import http_client
+from http_client import get_session
 
 
 def build_cpa_headers() -> dict:
@@ -86,7 +58,7 @@ def cpa_verify_connection() -> tuple[bool, str]:
 
     try:
         # 使用获取授权 URL 接口测试连接
-        response = http_session.get(
+        response = get_session().get(
             f"{CPA_API_BASE}/v0/management/codex-auth-url",
             headers=headers,
             params={"is_webui": str(CPA_IS_WEBUI).lower()},
@@ -109,10 +81,10 @@ def cpa_verify_connection() -> tuple[bool, str]:
         else:
             return False, f"CPA 服务异常 (HTTP {response.status_code})"
 
-    except requests.exceptions.Timeout:
+    except http_client.RequestTimeout:
         return False, f"CPA 服务连接超时 ({CPA_API_BASE})"
 
-    except requests.exceptions.ConnectionError:
+    except http_client.RequestConnectionError:
         return False, f"无法连接到 CPA 服务 ({CPA_API_BASE})"
 
     except Exception as e:
@@ -132,7 +104,7 @@ def cpa_generate_auth_url() -> tuple[str, str]:
     headers = build_cpa_headers()
 
     try:
-        response = http_session.get(
+        response = get_session().get(
             f"{CPA_API_BASE}/v0/management/codex-auth-url",
             headers=headers,
             params={"is_webui": str(CPA_IS_WEBUI).lower()},
@@ -183,7 +155,7 @@ def cpa_submit_callback(redirect_url: str) -> bool:
     }
 
     try:
-        response = http_session.post(
+        response = get_session().post(
             f"{CPA_API_BASE}/v0/management/oauth-callback",
             headers=headers,
             json=payload,
@@ -210,23 +182,20 @@ def cpa_submit_callback(redirect_url: str) -> bool:
         return False
 
 
-def cpa_check_auth_status(state: str) -> tuple[bool, str]:
-    """检查授权状态
+def _get_auth_status(state: str) -> tuple[str, str]:
+    """查询授权状态原始值
 
     调用 GET /v0/management/get-auth-status?state=<state>
 
-    Args:
-        state: 会话标识
-
     Returns:
-        tuple: (is_success, status_message)
-            - is_success: 授权是否成功
+        tuple: (status, status_message)
+            - status: "ok" / "wait" / "error"，请求失败时为空字符串
             - status_message: 状态描述
     """
     headers = build_cpa_headers()
 
     try:
-        response = http_session.get(
+        response = get_session().get(
             f"{CPA_API_BASE}/v0/management/get-auth-status",
             headers=headers,
             params={"state": state},
@@ -238,18 +207,37 @@ def cpa_check_auth_status(state: str) -> tuple[bool, str]:
             status = result.get("status", "")
 
             if status == "ok":
-                return True, "授权成功"
-            else:
-                return False, f"状态: {status}"
+                return status, "授权成功"
+            if status == "error":
+                return status, f"授权失败: {result.get('error', '')}"
+            return status, f"状态: {status}"
 
-        return False, f"检查状态失败: HTTP {response.status_code}"
+        return "", f"检查状态失败: HTTP {response.status_code}"
 
     except Exception as e:
-        return False, f"检查状态异常: {e}"
+        return "", f"检查状态异常: {e}"
+
+
+def cpa_check_auth_status(state: str) -> tuple[bool, str]:
+    """检查授权状态
+
+    Args:
+        state: 会话标识
+
+    Returns:
+        tuple: (is_success, status_message)
+            - is_success: 授权是否成功
+            - status_message: 状态描述
+    """
+    status, message = _get_auth_status(state)
+    return status == "ok", message
 
 
 def cpa_poll_auth_status(state: str) -> bool:
-    """轮询授权状态直到成功或超时
+    """轮询授权状态直到成功、失败或超时
+
+    提交回调后状态通常很快就绪: 轮询间隔从 0.5s 开始按 1.5 倍增长，最多 CPA_POLL_INTERVAL；
+    服务端返回 error 时立即结束，不再等到超时。
 
     Args:
         state: 会话标识
@@ -260,16 +248,30 @@ def cpa_poll_auth_status(state: str) -> bool:
     max_wait = CPA_POLL_INTERVAL * CPA_POLL_MAX_RETRIES
     log.step(f"轮询 CPA 授权状态 (最多 {max_wait}s)...")
 
-    for attempt in range(CPA_POLL_MAX_RETRIES):
-        is_success, message = cpa_check_auth_status(state)
+    deadline = time.time() + max_wait
+    delay = min(0.5, CPA_POLL_INTERVAL)
+    attempt = 0
+    while True:
+        attempt += 1
+        status, message = _get_auth_status(state)
 
-        if is_success:
+        if status == "ok":
             log.progress_clear()
             log.success(f"CPA 授权成功: {message}")
             return True
 
-        log.progress_inline(f"[CPA轮询中... {attempt + 1}/{CPA_POLL_MAX_RETRIES}] {message}")
-        time.sleep(CPA_POLL_INTERVAL)
+        if status == "error":
+            log.progress_clear()
+            log.error(f"CPA {message}")
+            return False
+
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            break
+
+        log.progress_inline(f"[CPA轮询中... {attempt}] {message}")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.5, CPA_POLL_INTERVAL)
 
     log.progress_clear()
     log.error("CPA 授权状态轮询超时")
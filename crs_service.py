@@ -1,9 +1,7 @@
 # ==================== CRS 服务模块 ====================
 # 处理 CRS 系统相关功能 (Codex 授权、账号入库)
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import time
 from urllib.parse import urlparse, parse_qs
 
 from config import (
@@ -11,48 +9,29 @@ from config import (
     CRS_ADMIN_TOKEN,
     REQUEST_TIMEOUT,
     USER_AGENT,
-    TEAMS,
-    PROXY_ENABLED,
-    get_proxy_dict,
+    INCLUDE_TEAM_OWNERS,
+    get_teams,
 )
 from logger import log
+import http_client
+from http_client import get_session, response_json
 
 
-def create_session_with_retry():
-    """创建带重试机制的 HTTP Session"""
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=5,
-        backoff_factor=1,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "POST", "OPTIONS"]
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
-
-    # 代理设置
-    if PROXY_ENABLED:
-        proxy_dict = get_proxy_dict()
-        if proxy_dict:
-            session.proxies = proxy_dict
-
-    return session
-
-
-http_session = create_session_with_retry()
+# CRS API 请求的 Headers (进程内不变，模块加载时构建一次；
+# HTTP Session 为各服务共用，不能把 CRS 的鉴权头挂到 Session 上)
+_CRS_HEADERS = {
+    "accept": "*/*",
+    "authorization": f"Bearer {CRS_ADMIN_TOKEN}",
+    "content-type": "application/json",
+    "origin": CRS_API_BASE,
+    "referer": f"{CRS_API_BASE}/admin-next/accounts",
+    "user-agent": USER_AGENT
+}
 
 
 def build_crs_headers() -> dict:
-    """构建 CRS API 请求的 Headers"""
-    return {
-        "accept": "*/*",
-        "authorization": f"Bearer {CRS_ADMIN_TOKEN}",
-        "content-type": "application/json",
-        "origin": CRS_API_BASE,
-        "referer": f"{CRS_API_BASE}/admin-next/accounts",
-        "user-agent": USER_AGENT
-    }
+    """构建 CRS API 请求的 Headers (返回副本，可自由修改)"""
+    return dict(_CRS_HEADERS)
 
 
 def crs_verify_token() -> tuple[bool, str]:
@@ -72,18 +51,18 @@ def crs_verify_token() -> tuple[bool, str]:
     if not CRS_ADMIN_TOKEN:
         return False, "CRS_ADMIN_TOKEN 未配置"
 
-    headers = build_crs_headers()
+    headers = _CRS_HEADERS
 
     try:
         # 使用获取账号列表接口验证 Token (GET 请求，只读操作)
-        response = http_session.get(
+        response = get_session().get(
             f"{CRS_API_BASE}/admin/openai-accounts",
             headers=headers,
             timeout=REQUEST_TIMEOUT
         )
 
         if response.status_code == 200:
-            result = response.json()
+            result = response_json(response)
             if result.get("success"):
                 account_count = len(result.get("data", []))
                 return True, f"Token 有效 (CRS 中已有 {account_count} 个账号)"
@@ -99,10 +78,10 @@ def crs_verify_token() -> tuple[bool, str]:
         else:
             return False, f"CRS 服务异常 (HTTP {response.status_code})"
 
-    except requests.exceptions.Timeout:
+    except http_client.RequestTimeout:
         return False, f"CRS 服务连接超时 ({CRS_API_BASE})"
 
-    except requests.exceptions.ConnectionError:
+    except http_client.RequestConnectionError:
         return False, f"无法连接到 CRS 服务 ({CRS_API_BASE})"
 
     except Exception as e:
@@ -115,10 +94,10 @@ def crs_generate_auth_url() -> tuple[str, str]:
     Returns:
         tuple: (auth_url, session_id) 或 (None, None)
     """
-    headers = build_crs_headers()
+    headers = _CRS_HEADERS
 
     try:
-        response = http_session.post(
+        response = get_session().post(
             f"{CRS_API_BASE}/admin/openai-accounts/generate-auth-url",
             headers=headers,
             json={},
@@ -126,7 +105,7 @@ def crs_generate_auth_url() -> tuple[str, str]:
         )
 
         if response.status_code == 200:
-            result = response.json()
+            result = response_json(response)
             if result.get("success"):
                 auth_url = result["data"]["authUrl"]
                 session_id = result["data"]["sessionId"]
@@ -151,11 +130,11 @@ def crs_exchange_code(code: str, session_id: str) -> dict:
     Returns:
         dict: codex_data 或 None
     """
-    headers = build_crs_headers()
+    headers = _CRS_HEADERS
     payload = {"code": code, "sessionId": session_id}
 
     try:
-        response = http_session.post(
+        response = get_session().post(
             f"{CRS_API_BASE}/admin/openai-accounts/exchange-code",
             headers=headers,
             json=payload,
@@ -163,7 +142,7 @@ def crs_exchange_code(code: str, session_id: str) -> dict:
         )
 
         if response.status_code == 200:
-            result = response.json()
+            result = response_json(response)
             if result.get("success"):
                 log.success("授权码交换成功")
                 return result["data"]
@@ -186,7 +165,7 @@ def crs_add_account(email: str, codex_data: dict) -> dict:
     Returns:
         dict: CRS 账号数据 或 None
     """
-    headers = build_crs_headers()
+    headers = _CRS_HEADERS
     payload = {
         "name": email,
         "description": "",
@@ -203,7 +182,7 @@ def crs_add_account(email: str, codex_data: dict) -> dict:
     }
 
     try:
-        response = http_session.post(
+        response = get_session().post(
             f"{CRS_API_BASE}/admin/openai-accounts",
             headers=headers,
             json=payload,
@@ -211,10 +190,11 @@ def crs_add_account(email: str, codex_data: dict) -> dict:
         )
 
         if response.status_code == 200:
-            result = response.json()
+            result = response_json(response)
             if result.get("success"):
                 account_id = result.get("data", {}).get("id")
                 log.success(f"账号添加到 CRS 成功 (ID: {account_id})")
+                _remember_crs_account(email)
                 return result["data"]
 
         log.error(f"添加到 CRS 失败: HTTP {response.status_code}")
@@ -247,30 +227,88 @@ def extract_code_from_url(url: str) -> str:
         return None
 
 
-def crs_get_accounts() -> list:
-    """获取 CRS 中的所有账号
+# 上次成功获取的账号列表及其校验头 (服务端返回 304 时直接复用，不重新下载解析)
+_crs_accounts_cache = {"etag": None, "last_modified": None, "data": None}
+
+
+def _fetch_crs_accounts():
+    """拉取 CRS 账号列表 (带条件请求缓存)
 
     Returns:
-        list: 账号列表
+        list: 账号列表；请求失败时返回 None (与"列表为空"区分)
     """
     headers = build_crs_headers()
+    cache = _crs_accounts_cache
+    if cache["data"] is not None:
+        if cache["etag"]:
+            headers["If-None-Match"] = cache["etag"]
+        if cache["last_modified"]:
+            headers["If-Modified-Since"] = cache["last_modified"]
 
     try:
-        response = http_session.get(
+        response = get_session().get(
             f"{CRS_API_BASE}/admin/openai-accounts",
             headers=headers,
             timeout=REQUEST_TIMEOUT
         )
 
+        if response.status_code == 304 and cache["data"] is not None:
+            return cache["data"]
+
         if response.status_code == 200:
-            result = response.json()
+            result = response_json(response)
             if result.get("success"):
-                return result.get("data", [])
+                data = result.get("data", [])
+                cache["etag"] = response.headers.get("ETag")
+                cache["last_modified"] = response.headers.get("Last-Modified")
+                cache["data"] = data
+                return data
+
+        log.warning(f"获取 CRS 账号列表失败: HTTP {response.status_code}")
 
     except Exception as e:
         log.warning(f"获取 CRS 账号列表异常: {e}")
 
-    return []
+    return None
+
+
+def crs_get_accounts() -> list:
+    """获取 CRS 中的所有账号
+
+    Returns:
+        list: 账号列表 (请求失败时为空列表)
+    """
+    return _fetch_crs_accounts() or []
+
+
+# CRS 账号列表快照的缓存时长 (秒)
+CRS_ACCOUNTS_CACHE_TTL = 60
+
+# CRS 账号名 (小写) 快照: 拉取成功后 CRS_ACCOUNTS_CACHE_TTL 秒内复用，拉取失败不缓存
+_crs_names_cache = {"names": None, "fetched_at": 0.0}
+
+
+def _crs_account_names():
+    """CRS 账号名 (小写) 集合快照，避免每次检查都拉取全量列表
+
+    Returns:
+        set: 账号名集合；从未拉取成功时返回 None
+    """
+    cache = _crs_names_cache
+    if cache["names"] is None or time.time() - cache["fetched_at"] >= CRS_ACCOUNTS_CACHE_TTL:
+        accounts = _fetch_crs_accounts()
+        if accounts is None:
+            # 拉取失败: 沿用上一份成功的快照 (没有时返回 None)，下次检查重新拉取
+            return cache["names"]
+        cache["names"] = {account.get("name", "").lower() for account in accounts}
+        cache["fetched_at"] = time.time()
+    return cache["names"]
+
+
+def _remember_crs_account(email: str):
+    """添加成功后把账号记入当前快照 (不必为此重新拉取列表)"""
+    if _crs_names_cache["names"] is not None:
+        _crs_names_cache["names"].add(email.lower())
 
 
 def crs_check_account_exists(email: str) -> bool:
@@ -282,13 +320,8 @@ def crs_check_account_exists(email: str) -> bool:
     Returns:
         bool: 是否存在
     """
-    accounts = crs_get_accounts()
-
-    for account in accounts:
-        if account.get("name", "").lower() == email.lower():
-            return True
-
-    return False
+    names = _crs_account_names()
+    return names is not None and email.lower() in names
 
 
 def crs_add_team_owner(team_data: dict) -> dict:
@@ -312,7 +345,7 @@ def crs_add_team_owner(team_data: dict) -> dict:
         log.info(f"账号已存在于 CRS: {email}")
         return None
 
-    headers = build_crs_headers()
+    headers = _CRS_HEADERS
     payload = {
         "name": email,
         "description": "Team Owner (from team.json)",
@@ -334,7 +367,7 @@ def crs_add_team_owner(team_data: dict) -> dict:
     }
 
     try:
-        response = http_session.post(
+        response = get_session().post(
             f"{CRS_API_BASE}/admin/openai-accounts",
             headers=headers,
             json=payload,
@@ -342,10 +375,11 @@ def crs_add_team_owner(team_data: dict) -> dict:
         )
 
         if response.status_code == 200:
-            result = response.json()
+            result = response_json(response)
             if result.get("success"):
                 account_id = result.get("data", {}).get("id")
                 log.success(f"Team Owner 添加到 CRS: {email} (ID: {account_id})")
+                _remember_crs_account(email)
                 return result["data"]
 
         log.error(f"添加 Team Owner 到 CRS 失败: {email} - HTTP {response.status_code}")
@@ -365,19 +399,20 @@ def crs_sync_team_owners() -> int:
     if not INCLUDE_TEAM_OWNERS:
         return 0
 
-    if not TEAMS:
+    teams = get_teams()
+    if not teams:
         log.warning("team.json 为空，无 Team Owner 可同步")
         return 0
 
-    log.info(f"开始同步 {len(TEAMS)} 个 Team Owner 到 CRS...", icon="sync")
+    log.info(f"开始同步 {len(teams)} 个 Team Owner 到 CRS...", icon="sync")
 
     success_count = 0
-    for team in TEAMS:
+    for team in teams:
         raw_data = team.get("raw", {})
         if raw_data:
             result = crs_add_team_owner(raw_data)
             if result:
                 success_count += 1
 
-    log.info(f"Team Owner 同步完成: {success_count}/{len(TEAMS)}", icon="sync")
+    log.info(f"Team Owner 同步完成: {success_count}/{len(teams)}", icon="sync")
     return success_count
@@ -3,12 +3,9 @@
 
 import re
 import time
-import random
-import string
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Callable, TypeVar, Optional, Any
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from config import (
     EMAIL_API_BASE,
@@ -18,9 +15,9 @@ from config import (
     REQUEST_TIMEOUT,
     VERIFICATION_CODE_INTERVAL,
     VERIFICATION_CODE_MAX_RETRIES,
-    PROXY_ENABLED,
     get_random_domain,
-    get_proxy_dict,
+    get_random_domains,
+    random_email_prefix,
     EMAIL_PROVIDER,
     GPTMAIL_API_BASE,
     GPTMAIL_API_KEY,
@@ -29,32 +26,7 @@ from config import (
     get_random_gptmail_domain,
 )
 from logger import log
-
-
-def create_session_with_retry():
-    """创建带重试机制的 HTTP Session"""
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=5,
-        backoff_factor=1,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "POST", "OPTIONS"]
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
-
-    # 代理设置
-    if PROXY_ENABLED:
-        proxy_dict = get_proxy_dict()
-        if proxy_dict:
-            session.proxies = proxy_dict
-
-    return session
-
-
-# 全局 HTTP Session
-http_session = create_session_with_retry()
+from http_client import get_session, response_json
 
 
 # ==================== 通用轮询重试工具 ====================
@@ -70,6 +42,56 @@ class PollResult:
         self.error = error
 
 
+# 验证码提取: 先匹配带提示语的 6 位数字，找不到时再取文本中第一个 6 位数字
+_CODE_RE = re.compile(r"(?:代码为|code is|verification code[:\s]*|验证码[：:\s]*)\s*(\d{6})", re.IGNORECASE)
+_BARE_CODE_RE = re.compile(r"\d{6}")
+
+
+def extract_verification_code(text: str) -> Optional[str]:
+    """从邮件主题/正文中提取 6 位验证码，没有时返回 None"""
+    if not text:
+        return None
+    match = _CODE_RE.search(text)
+    if match:
+        return match.group(1)
+    match = _BARE_CODE_RE.search(text)
+    return match.group(0) if match else None
+
+
+def _email_time_value(value) -> Optional[float]:
+    """把邮件时间 (时间戳/ISO 字符串) 转换为秒级时间戳，无法解析时返回 None"""
+    if value is None or value == "":
+        return None
+    try:
+        ts = float(value)
+    except (TypeError, ValueError):
+        try:
+            ts = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    return ts / 1000 if ts > 1e12 else ts  # 毫秒时间戳
+
+
+def _newer_email_filter(after) -> Callable[[Any], bool]:
+    """返回判断邮件时间是否晚于 after 的函数 (after 只解析一次，after 为空时总是返回 True)"""
+    if after is None or after == "":
+        return lambda email_time: True
+    after_ts = _email_time_value(after)
+
+    def is_newer(email_time) -> bool:
+        new_ts = _email_time_value(email_time) if after_ts is not None else None
+        if new_ts is None:
+            return str(email_time) != str(after)
+        return new_ts > after_ts
+
+    return is_newer
+
+
+def _is_newer_email(email_time, after) -> bool:
+    """邮件是否晚于 after (after 为空时总是返回 True)"""
+    return _newer_email_filter(after)(email_time)
+
+
 def poll_with_retry(
     fetch_func: Callable[[], Optional[T]],
     check_func: Callable[[T], Optional[Any]],
@@ -102,6 +124,7 @@ def poll_with_retry(
 
     start_time = time.time()
     progress_shown = False
+    last_error = None
 
     for i in range(max_retries):
         try:
@@ -114,24 +137,26 @@ def poll_with_retry(
                 if result is not None:
                     if progress_shown:
                         log.progress_clear()
-                    elapsed = time.time() - start_time
                     return PollResult(success=True, data=result)
 
         except Exception as e:
-            if progress_shown:
-                log.progress_clear()
-                progress_shown = False
-            log.warning(f"{description}异常: {e}")
+            # 同一个异常连续出现时只记录一次
+            error = f"{description}异常: {e}"
+            if error != last_error:
+                if progress_shown:
+                    log.progress_clear()
+                    progress_shown = False
+                log.warning(error)
+                last_error = error
 
         if i < max_retries - 1:
             # 动态间隔: 前 fast_retries 次使用快速间隔
             wait_time = fast_interval if i < fast_retries else interval
 
-            elapsed = time.time() - start_time
             if on_progress:
-                on_progress(elapsed)
+                on_progress(time.time() - start_time)
             else:
-                log.progress_inline(f"[等待中... {elapsed:.0f}s]")
+                log.progress_inline(f"[等待中... {time.time() - start_time:.0f}s]")
                 progress_shown = True
 
             time.sleep(wait_time)
@@ -174,11 +199,11 @@ class GPTMailService:
                     payload["prefix"] = prefix
                 if domain:
                     payload["domain"] = domain
-                response = http_session.post(url, headers=self.headers, json=payload, timeout=REQUEST_TIMEOUT)
+                response = get_session().post(url, headers=self.headers, json=payload, timeout=REQUEST_TIMEOUT)
             else:
-                response = http_session.get(url, headers=self.headers, timeout=REQUEST_TIMEOUT)
+                response = get_session().get(url, headers=self.headers, timeout=REQUEST_TIMEOUT)
 
-            data = response.json()
+            data = response_json(response)
 
             if data.get("success"):
                 email = data.get("data", {}).get("email", "")
@@ -206,8 +231,8 @@ class GPTMailService:
         params = {"email": email}
 
         try:
-            response = http_session.get(url, headers=self.headers, params=params, timeout=REQUEST_TIMEOUT)
-            data = response.json()
+            response = get_session().get(url, headers=self.headers, params=params, timeout=REQUEST_TIMEOUT)
+            data = response_json(response)
 
             if data.get("success"):
                 emails = data.get("data", {}).get("emails", [])
@@ -232,8 +257,8 @@ class GPTMailService:
         url = f"{self.api_base}/api/email/{email_id}"
 
         try:
-            response = http_session.get(url, headers=self.headers, timeout=REQUEST_TIMEOUT)
-            data = response.json()
+            response = get_session().get(url, headers=self.headers, timeout=REQUEST_TIMEOUT)
+            data = response_json(response)
 
             if data.get("success"):
                 return data.get("data", {}), None
@@ -257,8 +282,8 @@ class GPTMailService:
         url = f"{self.api_base}/api/email/{email_id}"
 
         try:
-            response = http_session.delete(url, headers=self.headers, timeout=REQUEST_TIMEOUT)
-            data = response.json()
+            response = get_session().delete(url, headers=self.headers, timeout=REQUEST_TIMEOUT)
+            data = response_json(response)
 
             if data.get("success"):
                 return True, None
@@ -281,8 +306,8 @@ class GPTMailService:
         params = {"email": email}
 
         try:
-            response = http_session.delete(url, headers=self.headers, params=params, timeout=REQUEST_TIMEOUT)
-            data = response.json()
+            response = get_session().delete(url, headers=self.headers, params=params, timeout=REQUEST_TIMEOUT)
+            data = response_json(response)
 
             if data.get("success"):
                 count = data.get("data", {}).get("count", 0)
@@ -293,13 +318,15 @@ class GPTMailService:
         except Exception as e:
             return 0, str(e)
 
-    def get_verification_code(self, email: str, max_retries: int = None, interval: int = None) -> tuple[str, str, str]:
+    def get_verification_code(self, email: str, max_retries: int = None, interval: int = None,
+                              after: str = None) -> tuple[str, str, str]:
         """从邮箱获取验证码 (使用通用轮询重试)
 
         Args:
             email: 邮箱地址
             max_retries: 最大重试次数
             interval: 基础轮询间隔 (秒)
+            after: 只接受晚于该时间的邮件 (重新发送验证码时传入上一封邮件的时间)
 
         Returns:
             tuple: (code, error, email_time) - 验证码、错误信息、邮件时间
@@ -308,6 +335,7 @@ class GPTMailService:
 
         # 用于存储邮件时间的闭包变量
         email_time_holder = [None]
+        is_newer = _newer_email_filter(after)
 
         def fetch_emails():
             """获取邮件列表"""
@@ -315,8 +343,10 @@ class GPTMailService:
             return emails if emails else None
 
         def check_for_code(emails):
-            """检查邮件中是否有验证码"""
+            """检查邮件中是否有验证码 (先按时间筛掉已使用过的旧邮件，再逐封提取，找到即返回)"""
             for email_item in emails:
+                if not is_newer(email_item.get("created_at", "")):
+                    continue
                 subject = email_item.get("subject", "")
                 content = email_item.get("content", "")
                 email_time_holder[0] = email_item.get("created_at", "")
@@ -351,24 +381,7 @@ class GPTMailService:
 
     def _extract_code(self, text: str) -> str:
         """从文本中提取验证码"""
-        if not text:
-            return None
-
-        # 尝试多种模式
-        patterns = [
-            r"代码为\s*(\d{6})",
-            r"code is\s*(\d{6})",
-            r"verification code[:\s]*(\d{6})",
-            r"验证码[：:\s]*(\d{6})",
-            r"(\d{6})",  # 最后尝试直接匹配6位数字
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1)
-
-        return None
+        return extract_verification_code(text)
 
 
 # 全局 GPTMail 服务实例
@@ -378,10 +391,14 @@ gptmail_service = GPTMailService()
 # ==================== 原有 KYX 邮箱服务 ====================
 
 
-def generate_random_email() -> str:
-    """生成随机邮箱地址: {random_str}oaiteam@{random_domain}"""
-    random_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
-    domain = get_random_domain()
+def generate_random_email(domain: str = None) -> str:
+    """生成随机邮箱地址: {random_str}oaiteam@{random_domain}
+
+    Args:
+        domain: 指定域名 (默认随机选择)
+    """
+    random_str = random_email_prefix()
+    domain = domain or get_random_domain()
     email = f"{random_str}oaiteam@{domain}"
     log.success(f"生成邮箱: {email}")
     return email
@@ -395,6 +412,20 @@ def create_email_user(email: str, password: str = None, role_name: str = None) -
         password: 密码，默认使用 DEFAULT_PASSWORD
         role_name: 角色名，默认使用 EMAIL_ROLE
 
+    Returns:
+        tuple: (success, message)
+    """
+    return create_email_users([email], password, role_name)
+
+
+def create_email_users(emails: list, password: str = None, role_name: str = None) -> tuple[bool, str]:
+    """在邮箱平台批量创建用户 (/addUser 的 list 一次提交多个邮箱)
+
+    Args:
+        emails: 邮箱地址列表
+        password: 密码，默认使用 DEFAULT_PASSWORD
+        role_name: 角色名，默认使用 EMAIL_ROLE
+
     Returns:
         tuple: (success, message)
     """
@@ -409,13 +440,16 @@ def create_email_user(email: str, password: str = None, role_name: str = None) -
         "Content-Type": "application/json"
     }
     payload = {
-        "list": [{"email": email, "password": password, "roleName": role_name}]
+        "list": [{"email": email, "password": password, "roleName": role_name} for email in emails]
     }
 
     try:
-        log.info(f"创建邮箱用户: {email}", icon="email")
-        response = http_session.post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
-        data = response.json()
+        if len(emails) == 1:
+            log.info(f"创建邮箱用户: {emails[0]}", icon="email")
+        else:
+            log.info(f"批量创建邮箱用户: {len(emails)} 个", icon="email")
+        response = get_session().post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
+        data = response_json(response)
         success = data.get("code") == 200
         msg = data.get("message", "Unknown error")
 
@@ -430,13 +464,15 @@ def create_email_user(email: str, password: str = None, role_name: str = None) -
         return False, str(e)
 
 
-def get_verification_code(email: str, max_retries: int = None, interval: int = None) -> tuple[str, str, str]:
+def get_verification_code(email: str, max_retries: int = None, interval: int = None,
+                          after: str = None) -> tuple[str, str, str]:
     """从邮箱获取验证码 (使用通用轮询重试)
 
     Args:
         email: 邮箱地址
         max_retries: 最大重试次数
         interval: 基础轮询间隔 (秒)
+        after: 只接受晚于该时间的邮件 (重新发送验证码时传入上一封邮件的时间)
 
     Returns:
         tuple: (code, error, email_time) - 验证码、错误信息、邮件时间
@@ -455,35 +491,18 @@ def get_verification_code(email: str, max_retries: int = None, interval: int = N
 
     def fetch_emails():
         """获取邮件列表"""
-        response = http_session.post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
-        data = response.json()
+        response = get_session().post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
+        data = response_json(response)
         if data.get("code") != 200:
             return None
         emails = data.get("data", [])
         return emails if emails else None
 
-    def extract_code_from_subject(subject: str) -> str:
-        """从主题中提取验证码"""
-        patterns = [
-            r"代码为\s*(\d{6})",
-            r"code is\s*(\d{6})",
-            r"verification code[:\s]*(\d{6})",
-            r"验证码[：:\s]*(\d{6})",
-            r"(\d{6})",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, subject, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        return None
-
-    def extract_code(text: str) -> str:
-        """从任意文本提取验证码 (兼容)"""
-        return extract_code_from_subject(text)
-
     def check_for_code(emails):
         """检查邮件中是否有验证码"""
         latest_email = emails[0]
+        if not _is_newer_email(latest_email.get("createTime", ""), after):
+            return None  # 新邮件还没到，继续轮询
         email_time_holder[0] = latest_email.get("createTime", "")
 
         subject = latest_email.get("subject", "") or ""
@@ -491,8 +510,7 @@ def get_verification_code(email: str, max_retries: int = None, interval: int = N
         html = latest_email.get("html", "") or latest_email.get("html_content", "") or ""
         text = latest_email.get("text", "") or latest_email.get("body", "") or ""
 
-        code = extract_code("\n".join([str(subject), str(content), str(html), str(text)]))
-        return code
+        return extract_verification_code("\n".join([str(subject), str(content), str(html), str(text)]))
 
     # 使用通用轮询函数
     result = poll_with_retry(
@@ -528,8 +546,8 @@ def fetch_email_content(email: str) -> list:
     payload = {"toEmail": email}
 
     try:
-        response = http_session.post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
-        data = response.json()
+        response = get_session().post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
+        data = response_json(response)
 
         if data.get("code") == 200:
             return data.get("data", [])
@@ -539,27 +557,76 @@ def fetch_email_content(email: str) -> list:
     return []
 
 
-def batch_create_emails(count: int = 4) -> list:
+# 批量创建邮箱/获取验证码的最大并发数 (都是网络 I/O，共用同一个 HTTP Session 的连接池)
+EMAIL_MAX_WORKERS = 4
+
+
+# 邮箱平台返回 "已存在" 时的提示关键字
+_EMAIL_EXISTS_HINTS = ("exist", "存在")
+
+
+def _retry_create_email_user(email: str) -> bool:
+    """批量创建失败后单独重试一个邮箱，已存在 (批量请求中已创建) 也视为成功"""
+    success, msg = create_email_user(email, DEFAULT_PASSWORD)
+    if success:
+        return True
+    if any(hint in str(msg).lower() for hint in _EMAIL_EXISTS_HINTS):
+        log.info(f"邮箱已存在，直接使用: {email}", icon="email")
+        return True
+    log.warning(f"跳过邮箱: {email}")
+    return False
+
+
+def batch_create_emails(count: int = 4, max_workers: int = EMAIL_MAX_WORKERS) -> list:
     """批量创建邮箱 (根据 EMAIL_PROVIDER 配置自动选择邮箱系统)
 
+    Cloud Mail 一次请求创建全部邮箱；GPTMail 没有批量接口，多个邮箱并发创建，
+    返回顺序与创建序号一致。
+
     Args:
         count: 创建数量
+        max_workers: 最大并发数
 
     Returns:
         list: [{"email": "...", "password": "..."}, ...]
     """
     accounts = []
-
-    for i in range(count):
-        email, password = unified_create_email()
-
-        if email:
-            accounts.append({
-                "email": email,
-                "password": password
-            })
-        else:
-            log.warning(f"跳过第 {i+1} 个邮箱创建")
+    if count <= 0:
+        return accounts
+
+    # Cloud Mail: 一次 /addUser 提交全部邮箱，失败时只对同一批地址逐个重试
+    # (批量请求可能已创建部分邮箱，换新地址会留下无人使用的邮箱)
+    if EMAIL_PROVIDER != "gptmail" and count > 1:
+        emails = [generate_random_email(domain) for domain in get_random_domains(count)]
+        success, _ = create_email_users(emails, DEFAULT_PASSWORD)
+        if not success:
+            log.warning("批量创建邮箱失败，改为逐个重试")
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, count)),
+                                    thread_name_prefix="create-email") as executor:
+                created = list(executor.map(_retry_create_email_user, emails))
+            emails = [email for email, ok in zip(emails, created) if ok]
+        accounts = [{"email": email, "password": DEFAULT_PASSWORD} for email in emails]
+        log.info(f"邮箱创建完成: {len(accounts)}/{count}", icon="email")
+        return accounts
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, count)),
+                            thread_name_prefix="create-email") as executor:
+        futures = [executor.submit(unified_create_email) for _ in range(count)]
+
+        for i, future in enumerate(futures):
+            try:
+                email, password = future.result()
+            except Exception as e:
+                log.error(f"邮箱创建异常: {e}")
+                email, password = None, None
+
+            if email:
+                accounts.append({
+                    "email": email,
+                    "password": password
+                })
+            else:
+                log.warning(f"跳过第 {i+1} 个邮箱创建")
 
     log.info(f"邮箱创建完成: {len(accounts)}/{count}", icon="email")
     return accounts
@@ -575,7 +642,7 @@ def unified_generate_email() -> str:
     """
     if EMAIL_PROVIDER == "gptmail":
         # 生成随机前缀 + oaiteam 后缀，确保不重复
-        random_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+        random_str = random_email_prefix()
         prefix = f"{random_str}-oaiteam"
         domain = get_random_gptmail_domain() or None
         email, error = gptmail_service.generate_email(prefix=prefix, domain=domain)
@@ -595,7 +662,7 @@ def unified_create_email() -> tuple[str, str]:
     """
     if EMAIL_PROVIDER == "gptmail":
         # 生成随机前缀 + oaiteam 后缀，确保不重复
-        random_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+        random_str = random_email_prefix()
         prefix = f"{random_str}-oaiteam"
         domain = get_random_gptmail_domain() or None
         email, error = gptmail_service.generate_email(prefix=prefix, domain=domain)
@@ -612,22 +679,24 @@ def unified_create_email() -> tuple[str, str]:
     return None, None
 
 
-def unified_get_verification_code(email: str, max_retries: int = None, interval: int = None) -> tuple[str, str, str]:
+def unified_get_verification_code(email: str, max_retries: int = None, interval: int = None,
+                                  after: str = None) -> tuple[str, str, str]:
     """统一获取验证码接口 (根据 EMAIL_PROVIDER 配置自动选择)
 
     Args:
         email: 邮箱地址
         max_retries: 最大重试次数
         interval: 轮询间隔 (秒)
+        after: 只接受晚于该时间的邮件 (传入上一次返回的 email_time)
 
     Returns:
         tuple: (code, error, email_time) - 验证码、错误信息、邮件时间
     """
     if EMAIL_PROVIDER == "gptmail":
-        return gptmail_service.get_verification_code(email, max_retries, interval)
+        return gptmail_service.get_verification_code(email, max_retries, interval, after=after)
 
     # 默认使用 KYX 系统
-    return get_verification_code(email, max_retries, interval)
+    return get_verification_code(email, max_retries, interval, after=after)
 
 
 def unified_fetch_emails(email: str) -> list:
@@ -0,0 +1,86 @@
+# ==================== HTTP 客户端模块 ====================
+# 全局共享的 HTTP Session (各服务模块共用同一个连接池)
+
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from config import PROXY_ENABLED, get_proxy_dict
+
+
+# 连接池大小: 缓存的主机数 / 单主机最大保持连接数
+# (批量并发创建邮箱、轮询验证码时默认的 10 个连接不够用，多出的连接用完即丢弃需要重新握手)
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 50
+
+
+def create_session_with_retry():
+    """创建带重试机制的 HTTP Session"""
+    # requests/urllib3 在首次发请求时才导入，只读配置的代码路径不承担这部分启动开销
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=5,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "POST", "OPTIONS"]
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry_strategy
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    # 代理设置
+    if PROXY_ENABLED:
+        proxy_dict = get_proxy_dict()
+        if proxy_dict:
+            session.proxies = proxy_dict
+
+    return session
+
+
+# 全局 HTTP Session (邮箱/Team/CRS/CPA/S2A 共用，避免各自建连接池和重复 TLS 握手)
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """获取全局 HTTP Session (首次调用时创建)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session_with_retry()
+    return _session
+
+
+def response_json(response):
+    """解析响应 JSON (安装了 orjson 时直接解析原始字节)"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# requests 的异常类型 (延迟导入): 在 except 子句中以 http_client.RequestTimeout 形式引用，
+# 只有真正出现异常时才会解析属性，导入各服务模块时不必加载 requests
+_LAZY_EXCEPTIONS = {
+    "RequestTimeout": "Timeout",
+    "RequestConnectionError": "ConnectionError",
+}
+
+
+def __getattr__(name: str):
+    """requests 异常类型延迟加载 (PEP 562)"""
+    if name in _LAZY_EXCEPTIONS:
+        import requests
+        return getattr(requests.exceptions, _LAZY_EXCEPTIONS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,7 @@
 
 import os
 import sys
+import time
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -21,6 +22,14 @@ def _ensure_log_dir():
     LOG_DIR.mkdir(exist_ok=True)
 
 
+def _stdout_is_tty() -> bool:
+    """当前 stdout 是否为终端 (重定向到文件/管道/GUI 时不输出 \r 内联进度)"""
+    try:
+        return sys.stdout.isatty()
+    except Exception:
+        return False
+
+
 class ColoredFormatter(logging.Formatter):
     """带颜色的控制台日志格式化器"""
 
@@ -220,11 +229,15 @@ class Logger:
         self._logger.info(f"[{bar}] {current}/{total} ({pct:.0f}%) {msg}", extra=extra)
 
     def progress_inline(self, msg: str):
-        """内联进度 (覆盖当前行)"""
+        """内联进度 (覆盖当前行，非终端输出时跳过)"""
+        if not _stdout_is_tty():
+            return
         print(f"\r{msg}" + " " * 10, end='', flush=True)
 
     def progress_clear(self):
-        """清除内联进度"""
+        """清除内联进度 (非终端输出时跳过)"""
+        if not _stdout_is_tty():
+            return
         print("\r" + " " * 50 + "\r", end='', flush=True)
 
     def countdown(self, seconds: int, msg: str = "等待"):
@@ -234,7 +247,9 @@ class Logger:
             seconds: 倒计时秒数
             msg: 提示消息
         """
-        import time
+        if not _stdout_is_tty():
+            time.sleep(seconds)
+            return
         for remaining in range(seconds, 0, -1):
             timestamp = datetime.now().strftime("%H:%M:%S")
             print(f"\r[{timestamp}] {msg} {remaining}s...   ", end='', flush=True)
@@ -15,9 +15,10 @@ import random
 import signal
 import sys
 import atexit
+import threading
 
 from config import (
-    TEAMS, ACCOUNTS_PER_TEAM, DEFAULT_PASSWORD, AUTH_PROVIDER,
+    TEAMS, ACCOUNTS_PER_TEAM, DEFAULT_PASSWORD, AUTH_PROVIDER, BROWSER_POOL_SIZE,
     add_domain_to_blacklist, get_domain_from_email, is_email_blacklisted,
     save_team_json, get_next_proxy
 )
@@ -26,7 +27,13 @@ from team_service import batch_invite_to_team, print_team_summary, check_availab
 from crs_service import crs_add_account, crs_sync_team_owners, crs_verify_token
 from cpa_service import cpa_verify_connection
 from s2a_service import s2a_verify_connection
-from browser_automation import register_and_authorize, login_and_authorize_with_otp, authorize_only, login_and_authorize_team_owner
+from browser_automation import (
+    register_and_authorize,
+    register_and_authorize_batch,
+    login_and_authorize_with_otp,
+    authorize_only,
+    login_and_authorize_team_owner
+)
 from utils import (
     save_to_csv,
     load_team_tracker,
@@ -47,6 +54,8 @@ from logger import log
 _tracker = None
 _current_results = []
 _shutdown_requested = False
+# 并发浏览器流程中，工作线程与主线程都会更新 tracker
+_tracker_lock = threading.Lock()
 
 
 def _save_state():
@@ -215,6 +224,189 @@ def _get_team_by_name(team_name: str) -> dict:
     return {}
 
 
+def _needs_auth_only(account_status: str, account_role: str) -> bool:
+    """已注册但未授权的账号 (使用密码登录授权)
+
+    - registered: 已注册，需要授权
+    - auth_failed: 授权失败，重试
+    - 新格式 Owner (role=owner 且状态不是 team_owner/completed) 也走密码登录
+    """
+    return (
+        account_status in ["registered", "auth_failed"]
+        or (account_role == "owner" and account_status not in ["team_owner", "completed", "authorized", "partial"])
+    )
+
+
+def _set_account_status(team_name: str, email: str, status: str):
+    """更新账号状态并立即保存 tracker"""
+    with _tracker_lock:
+        update_account_status(_tracker, team_name, email, status)
+        save_team_tracker(_tracker)
+
+
+def _replace_blacklisted_account(team_name: str, email: str):
+    """注册时发现域名不被支持: 加入黑名单，移除账号并邀请新邮箱 (下次运行时处理)"""
+    domain = get_domain_from_email(email)
+    log.error(f"域名 {domain} 不被支持，加入黑名单")
+    add_domain_to_blacklist(domain)
+
+    # 从 tracker 中移除
+    with _tracker_lock:
+        remove_account_from_tracker(_tracker, team_name, email)
+        save_team_tracker(_tracker)
+
+    # 尝试创建新邮箱替代
+    log.info("尝试创建新邮箱替代...")
+    new_email, new_password = unified_create_email()
+    if new_email and not is_email_blacklisted(new_email):
+        # 邀请新邮箱
+        if invite_single_to_team(new_email, _get_team_by_name(team_name)):
+            with _tracker_lock:
+                add_account_with_password(_tracker, team_name, new_email, new_password, "invited")
+                save_team_tracker(_tracker)
+            log.success(f"已创建新邮箱: {new_email}，将在下次运行时处理")
+        else:
+            log.error("新邮箱邀请失败")
+    else:
+        log.error("无法创建有效的新邮箱")
+
+
+def _record_account_result(team_name: str, email: str, password: str, register_success,
+                           codex_data, is_team_owner_otp: bool = False) -> dict:
+    """根据注册/授权结果更新状态、入库并写入 CSV
+
+    Returns:
+        dict: 处理结果；域名被加入黑名单时返回 None (账号已被替换)
+    """
+    if register_success == "domain_blacklisted":
+        _replace_blacklisted_account(team_name, email)
+        return None
+
+    result = {
+        "team": team_name,
+        "email": email,
+        "password": password,
+        "status": "failed",
+        "crs_id": ""
+    }
+
+    if register_success:
+        _set_account_status(team_name, email, "registered")
+
+        # CPA 模式: codex_data 为 None，授权成功后直接标记完成
+        # CRS 模式: 需要 codex_data，手动添加到 CRS
+        if AUTH_PROVIDER in ("cpa", "s2a"):
+            # CPA/S2A 模式: 授权成功即完成 (后台自动处理账号)
+            # codex_data 为 None 表示授权成功
+            _set_account_status(team_name, email, "authorized")
+
+            result["status"] = "success"
+            result["crs_id"] = f"{AUTH_PROVIDER.upper()}-AUTO"  # 标记为自动处理
+
+            _set_account_status(team_name, email, "completed")
+
+            log.success(f"{AUTH_PROVIDER.upper()} 账号处理完成: {email}")
+        else:
+            # CRS 模式: 原有逻辑
+            if codex_data:
+                _set_account_status(team_name, email, "authorized")
+
+                # 添加到 CRS
+                log.step("添加到 CRS...")
+                crs_result = crs_add_account(email, codex_data)
+
+                if crs_result:
+                    crs_id = crs_result.get("id", "")
+                    result["status"] = "success"
+                    result["crs_id"] = crs_id
+
+                    _set_account_status(team_name, email, "completed")
+
+                    log.success(f"账号处理完成: {email}")
+                else:
+                    log.warning("CRS 入库失败，但注册和授权成功")
+                    result["status"] = "partial"
+                    _set_account_status(team_name, email, "partial")
+            else:
+                log.warning("Codex 授权失败")
+                result["status"] = "auth_failed"
+                _set_account_status(team_name, email, "auth_failed")
+    else:
+        if is_team_owner_otp:
+            log.error(f"OTP 登录授权失败: {email}")
+        else:
+            log.error(f"注册/授权失败: {email}")
+        _set_account_status(team_name, email, "register_failed")
+
+    # 保存到 CSV
+    save_to_csv(
+        email=email,
+        password=password,
+        team_name=team_name,
+        status=result["status"],
+        crs_id=result.get("crs_id", "")
+    )
+
+    _current_results.append(result)
+    return result
+
+
+def _run_browser_flows(accounts: list, team_name: str, results: list) -> set:
+    """浏览器池容量大于 1 时，并发执行新账号注册/已注册账号授权的浏览器流程
+
+    只处理需要 注册 + 授权 或 仅密码授权 的账号；OTP 登录、仅入库、已完成和黑名单账号
+    仍由 process_accounts 逐个处理。每个账号开始时标记为 processing，完成后立即更新状态、
+    入库并写入 CSV (结果追加到 results)，中断时已完成的账号不会丢失。
+
+    Returns:
+        set: 已在这里处理完的邮箱，process_accounts 跳过这些账号
+    """
+    if BROWSER_POOL_SIZE <= 1:
+        return set()
+
+    jobs = []
+    passwords = {}
+    for account in accounts:
+        email = account["email"]
+        account_status = account.get("status", "")
+        if account_status in ["completed", "team_owner", "authorized", "partial"] or is_email_blacklisted(email):
+            continue
+        register = not _needs_auth_only(account_status, account.get("role", "member"))
+        jobs.append((email, account["password"], register))
+        passwords[email] = (account["password"], register)
+
+    if len(jobs) < 2:
+        return set()
+
+    handled = set()
+
+    def on_start(email):
+        _set_account_status(team_name, email, "processing")
+
+    def on_result(email, outcome):
+        handled.add(email)
+        password, register = passwords[email]
+        success, codex_data = outcome
+        log.separator("#", 50)
+        log.info(f"账号完成 {len(handled)}/{len(jobs)}: {email}", icon="account")
+        log.separator("#", 50)
+        # 仅授权的账号视为已注册 (与逐个处理时一致)
+        register_success = success if register else True
+        result = _record_account_result(team_name, email, password, register_success, codex_data)
+        if result:
+            results.append(result)
+
+    log.info(f"并发处理 {len(jobs)} 个账号的浏览器流程 (同时 {BROWSER_POOL_SIZE} 个浏览器)...", icon="browser")
+    register_and_authorize_batch(
+        jobs,
+        max_workers=BROWSER_POOL_SIZE,
+        should_stop=lambda: _shutdown_requested,
+        on_start=on_start,
+        on_result=on_result,
+    )
+    return handled
+
+
 def process_accounts(accounts: list, team_name: str) -> list:
     """处理账号列表 (注册/授权/CRS)
     
@@ -228,13 +420,18 @@ def process_accounts(accounts: list, team_name: str) -> list:
     global _tracker, _current_results, _shutdown_requested
     
     results = []
-    
+
+    # 浏览器流程先并发执行，每个账号完成时即保存结果；剩余账号在下面逐个处理
+    handled = _run_browser_flows(accounts, team_name, results)
+
     for i, account in enumerate(accounts):
         if _shutdown_requested:
             log.warning("检测到中断请求，停止处理...")
             break
 
         email = account["email"]
+        if email in handled:
+            continue
         password = account["password"]
         role = account.get("role", "member")
 
@@ -275,14 +472,6 @@ def process_accounts(accounts: list, team_name: str) -> list:
         log.info(f"处理账号 {i + 1}/{len(accounts)}: {email}", icon="account")
         log.separator("#", 50)
 
-        result = {
-            "team": team_name,
-            "email": email,
-            "password": password,
-            "status": "failed",
-            "crs_id": ""
-        }
-
         # 检查账号状态，决定处理流程
         account_status = account.get("status", "")
         account_role = account.get("role", "member")
@@ -301,17 +490,10 @@ def process_accounts(accounts: list, team_name: str) -> list:
         need_crs_only = account_status in ["authorized", "partial"]
 
         # 已注册但未授权的状态 (使用密码登录授权)
-        # - registered: 已注册，需要授权
-        # - auth_failed: 授权失败，重试
-        # - 新格式 Owner (role=owner 且状态不是 team_owner/completed) 也走密码登录
-        need_auth_only = (
-            account_status in ["registered", "auth_failed"]
-            or (account_role == "owner" and account_status not in ["team_owner", "completed", "authorized", "partial"])
-        )
+        need_auth_only = _needs_auth_only(account_status, account_role)
 
         # 标记为处理中
-        update_account_status(_tracker, team_name, email, "processing")
-        save_team_tracker(_tracker)
+        _set_account_status(team_name, email, "processing")
 
         with Timer(f"账号 {email}"):
             if is_team_owner_otp:
@@ -337,100 +519,14 @@ def process_accounts(accounts: list, team_name: str) -> list:
             else:
                 # 新账号: 注册 + Codex 授权
                 register_success, codex_data = register_and_authorize(email, password)
-                
-                # 检查是否是域名黑名单错误
-                if register_success == "domain_blacklisted":
-                    domain = get_domain_from_email(email)
-                    log.error(f"域名 {domain} 不被支持，加入黑名单")
-                    add_domain_to_blacklist(domain)
-                    
-                    # 从 tracker 中移除
-                    remove_account_from_tracker(_tracker, team_name, email)
-                    save_team_tracker(_tracker)
-                    
-                    # 尝试创建新邮箱替代
-                    log.info("尝试创建新邮箱替代...")
-                    new_email, new_password = unified_create_email()
-                    if new_email and not is_email_blacklisted(new_email):
-                        # 邀请新邮箱
-                        if invite_single_to_team(new_email, _get_team_by_name(team_name)):
-                            add_account_with_password(_tracker, team_name, new_email, new_password, "invited")
-                            save_team_tracker(_tracker)
-                            log.success(f"已创建新邮箱: {new_email}，将在下次运行时处理")
-                        else:
-                            log.error("新邮箱邀请失败")
-                    else:
-                        log.error("无法创建有效的新邮箱")
-                    
-                    continue  # 跳过当前账号，继续下一个
-
-            if register_success and register_success != "domain_blacklisted":
-                update_account_status(_tracker, team_name, email, "registered")
-                save_team_tracker(_tracker)
 
-                # CPA 模式: codex_data 为 None，授权成功后直接标记完成
-                # CRS 模式: 需要 codex_data，手动添加到 CRS
-                if AUTH_PROVIDER in ("cpa", "s2a"):
-                    # CPA/S2A 模式: 授权成功即完成 (后台自动处理账号)
-                    # codex_data 为 None 表示授权成功
-                    update_account_status(_tracker, team_name, email, "authorized")
-                    save_team_tracker(_tracker)
-
-                    result["status"] = "success"
-                    result["crs_id"] = f"{AUTH_PROVIDER.upper()}-AUTO"  # 标记为自动处理
-
-                    update_account_status(_tracker, team_name, email, "completed")
-                    save_team_tracker(_tracker)
-
-                    log.success(f"{AUTH_PROVIDER.upper()} 账号处理完成: {email}")
-                else:
-                    # CRS 模式: 原有逻辑
-                    if codex_data:
-                        update_account_status(_tracker, team_name, email, "authorized")
-                        save_team_tracker(_tracker)
-
-                        # 添加到 CRS
-                        log.step("添加到 CRS...")
-                        crs_result = crs_add_account(email, codex_data)
-
-                        if crs_result:
-                            crs_id = crs_result.get("id", "")
-                            result["status"] = "success"
-                            result["crs_id"] = crs_id
-
-                            update_account_status(_tracker, team_name, email, "completed")
-                            save_team_tracker(_tracker)
-
-                            log.success(f"账号处理完成: {email}")
-                        else:
-                            log.warning("CRS 入库失败，但注册和授权成功")
-                            result["status"] = "partial"
-                            update_account_status(_tracker, team_name, email, "partial")
-                            save_team_tracker(_tracker)
-                    else:
-                        log.warning("Codex 授权失败")
-                        result["status"] = "auth_failed"
-                        update_account_status(_tracker, team_name, email, "auth_failed")
-                        save_team_tracker(_tracker)
-            elif register_success != "domain_blacklisted":
-                if is_team_owner_otp:
-                    log.error(f"OTP 登录授权失败: {email}")
-                else:
-                    log.error(f"注册/授权失败: {email}")
-                update_account_status(_tracker, team_name, email, "register_failed")
-                save_team_tracker(_tracker)
+            result = _record_account_result(team_name, email, password, register_success, codex_data,
+                                            is_team_owner_otp=is_team_owner_otp)
 
-        # 保存到 CSV
-        save_to_csv(
-            email=email,
-            password=password,
-            team_name=team_name,
-            status=result["status"],
-            crs_id=result.get("crs_id", "")
-        )
+        if result is None:
+            continue  # 域名被加入黑名单，跳过当前账号，继续下一个
 
         results.append(result)
-        _current_results.append(result)
 
         # 账号之间的间隔
         if i < len(accounts) - 1 and not _shutdown_requested:
@@ -7,9 +7,6 @@
 # - 授权流程: S2A 生成授权 URL -> 用户授权 -> 提交 code 换取 token -> 创建账号
 # - 账号入库: S2A 可一步完成 (create-from-oauth) 或分步完成 (exchange + add_account)
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 from urllib.parse import urlparse, parse_qs
 from typing import Optional, Tuple, Dict, List, Any
 
@@ -23,40 +20,16 @@ from config import (
     S2A_GROUP_NAMES,
     REQUEST_TIMEOUT,
     USER_AGENT,
-    PROXY_ENABLED,
-    get_proxy_dict,
 )
 from logger import log
+import http_client
+from http_client import get_session
 
 
 # ==================== 分组 ID 缓存 ====================
 _resolved_group_ids = None  # 缓存解析后的 group_ids
 
 
-def create_session_with_retry() -> requests.Session:
-    """创建带重试机制的 HTTP Session"""
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=5,
-        backoff_factor=1,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS"]
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
-
-    # 代理设置
-    if PROXY_ENABLED:
-        proxy_dict = get_proxy_dict()
-        if proxy_dict:
-            session.proxies = proxy_dict
-
-    return session
-
-
-http_session = create_session_with_retry()
-
 
 def build_s2a_headers() -> Dict[str, str]:
     """构建 S2A API 请求的 Headers
@@ -98,7 +71,7 @@ def s2a_get_groups() -> List[Dict[str, Any]]:
     headers = build_s2a_headers()
 
     try:
-        response = http_session.get(
+        response = get_session().get(
             f"{S2A_API_BASE}/admin/groups",
             headers=headers,
             params={"page": 1, "page_size": 100},
@@ -191,7 +164,7 @@ def s2a_verify_connection() -> Tuple[bool, str]:
 
     try:
         # 使用 /admin/groups 接口验证连接 (支持 x-api-key 认证)
-        response = http_session.get(
+        response = get_session().get(
             f"{S2A_API_BASE}/admin/groups",
             headers=headers,
             params={"page": 1, "page_size": 1},
@@ -222,10 +195,10 @@ def s2a_verify_connection() -> Tuple[bool, str]:
         else:
             return False, f"服务异常 (HTTP {response.status_code})"
 
-    except requests.exceptions.Timeout:
+    except http_client.RequestTimeout:
         return False, f"服务连接超时 ({S2A_API_BASE})"
 
-    except requests.exceptions.ConnectionError:
+    except http_client.RequestConnectionError:
         return False, f"无法连接到服务 ({S2A_API_BASE})"
 
     except Exception as e:
@@ -246,7 +219,7 @@ def s2a_generate_auth_url(proxy_id: Optional[int] = None) -> Tuple[Optional[str]
         payload["proxy_id"] = proxy_id
 
     try:
-        response = http_session.post(
+        response = get_session().post(
             f"{S2A_API_BASE}/admin/openai/generate-auth-url",
             headers=headers,
             json=payload,
@@ -307,7 +280,7 @@ def s2a_create_account_from_oauth(
         payload["group_ids"] = group_ids
 
     try:
-        response = http_session.post(
+        response = get_session().post(
             f"{S2A_API_BASE}/admin/openai/create-from-oauth",
             headers=headers,
             json=payload,
@@ -380,7 +353,7 @@ def s2a_add_account(
         payload["group_ids"] = group_ids
 
     try:
-        response = http_session.post(
+        response = get_session().post(
             f"{S2A_API_BASE}/admin/accounts",
             headers=headers,
             json=payload,
@@ -413,7 +386,7 @@ def s2a_get_accounts(platform: str = "openai") -> List[Dict[str, Any]]:
 
     try:
         params = {"platform": platform} if platform else {}
-        response = http_session.get(
+        response = get_session().get(
             f"{S2A_API_BASE}/admin/accounts",
             headers=headers,
             params=params,
@@ -1,46 +1,16 @@
 # ==================== Team 服务模块 ====================
 # 处理 ChatGPT Team 邀请相关功能
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
 from config import (
-    TEAMS,
     ACCOUNTS_PER_TEAM,
     REQUEST_TIMEOUT,
     USER_AGENT,
     BROWSER_HEADLESS,
-    PROXY_ENABLED,
     save_team_json,
-    get_proxy_dict
+    get_teams,
 )
 from logger import log
-
-
-def create_session_with_retry():
-    """创建带重试机制的 HTTP Session"""
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=5,
-        backoff_factor=1,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "POST", "OPTIONS"]
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
-
-    # 代理设置
-    if PROXY_ENABLED:
-        proxy_dict = get_proxy_dict()
-        if proxy_dict:
-            session.proxies = proxy_dict
-
-    return session
-
-
-http_session = create_session_with_retry()
+from http_client import get_session
 
 
 def fetch_account_id(team: dict, silent: bool = False) -> str:
@@ -72,7 +42,7 @@ def fetch_account_id(team: dict, silent: bool = False) -> str:
 
     try:
         # 使用 accounts/check API 获取账户信息
-        response = http_session.get(
+        response = get_session().get(
             "https://chatgpt.com/backend-api/accounts/check/v4-2023-04-27",
             headers=headers,
             timeout=REQUEST_TIMEOUT
@@ -128,7 +98,7 @@ def preload_all_account_ids() -> tuple[int, int]:
     fail_count = 0
 
     # 只处理有 token 的 Team
-    teams_with_token = [t for t in TEAMS if t.get("auth_token")]
+    teams_with_token = [t for t in get_teams() if t.get("auth_token")]
     teams_need_fetch = [t for t in teams_with_token if not t.get("account_id")]
 
     if not teams_need_fetch:
@@ -235,7 +205,7 @@ def invite_single_email(email: str, team: dict) -> tuple[bool, str]:
     invite_url = f"https://chatgpt.com/backend-api/accounts/{team['account_id']}/invites"
 
     try:
-        response = http_session.post(invite_url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
+        response = get_session().post(invite_url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 200:
             result = response.json()
@@ -278,7 +248,7 @@ def batch_invite_to_team(emails: list, team: dict) -> dict:
     }
 
     try:
-        response = http_session.post(invite_url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
+        response = get_session().post(invite_url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 200:
             resp_data = response.json()
@@ -347,7 +317,7 @@ def get_team_stats(team: dict) -> dict:
     subs_url = f"https://chatgpt.com/backend-api/subscriptions?account_id={team['account_id']}"
 
     try:
-        response = http_session.get(subs_url, headers=headers, timeout=REQUEST_TIMEOUT)
+        response = get_session().get(subs_url, headers=headers, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 200:
             data = response.json()
@@ -379,7 +349,7 @@ def get_pending_invites(team: dict) -> list:
     url = f"https://chatgpt.com/backend-api/accounts/{team['account_id']}/invites?offset=0&limit=100&query="
 
     try:
-        response = http_session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        response = get_session().get(url, headers=headers, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 200:
             data = response.json()
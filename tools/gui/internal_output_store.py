@@ -25,6 +25,18 @@ _DB_FILENAME = "data.sqlite"
 
 _KV_KEY_TRACKER = "team_tracker"
 
+# 已完成建表/切换 WAL 的数据库：路径 -> 文件标识 (st_dev, st_ino)
+# 数据库文件被删除或替换后标识变化，下次连接时重新建表
+_initialized_dbs: dict[str, tuple[int, int]] = {}
+
+
+def _file_identity(path: str) -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
 
 def get_data_dir() -> Path:
     base = os.environ.get("LOCALAPPDATA") or os.environ.get("APPDATA") or str(Path.home())
@@ -38,15 +50,31 @@ def get_db_path() -> Path:
 
 
 def _connect() -> sqlite3.Connection:
-    conn = sqlite3.connect(str(get_db_path()), timeout=10)
+    db_path = str(get_db_path())
+    # 连接前文件不存在（首次运行或被删除）时 sqlite 会新建空库，必须重新建表
+    existed = _file_identity(db_path) is not None
+    # timeout 即 busy_timeout：写入方持锁时读方最多等待 10 秒
+    conn = sqlite3.connect(db_path, timeout=10)
     conn.row_factory = sqlite3.Row
-    _init_db(conn)
+    # 连接级 PRAGMA，每个连接都要设置
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA cache_size=-20000;")
+    identity = _file_identity(db_path)
+    if not existed or identity is None or _initialized_dbs.get(db_path) != identity:
+        try:
+            _init_db(conn)
+        except Exception:
+            conn.close()
+            raise
+        if identity is not None:
+            _initialized_dbs[db_path] = identity
     return conn
 
 
 def _init_db(conn: sqlite3.Connection) -> None:
+    # WAL 模式写入数据库文件后持久生效：GUI 读取与后台任务写入互不阻塞
     conn.execute("PRAGMA journal_mode=WAL;")
-    conn.execute("PRAGMA synchronous=NORMAL;")
 
     conn.execute(
         """
@@ -223,52 +251,49 @@ def list_created_credentials(limit: int = 50) -> list[dict[str, Any]]:
         return []
 
 
-def export_accounts_csv(path: Path) -> bool:
-    """导出账号记录到 CSV（导出才会生成文件）。"""
+_EXPORT_BATCH_SIZE = 1000
+
+
+def _export_query_csv(path: Path, columns: list[str], sql: str) -> bool:
+    """把查询结果分批写入 CSV（fetchmany + writerows，不把全表一次性读入内存）。"""
     try:
         import csv
 
+        path.parent.mkdir(parents=True, exist_ok=True)
         conn = _connect()
         try:
-            rows = conn.execute(
-                "SELECT email, password, team, status, crs_id, created_at FROM accounts_log ORDER BY id ASC"
-            ).fetchall()
+            # 单个读事务：导出期间看到一致的快照（WAL 下不阻塞后台写入）
+            conn.execute("BEGIN")
+            cur = conn.execute(sql)
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                w = csv.writer(f)
+                w.writerow(columns)
+                while rows := cur.fetchmany(_EXPORT_BATCH_SIZE):
+                    w.writerows(rows)
+            conn.commit()
         finally:
             conn.close()
-
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            w.writerow(["email", "password", "team", "status", "crs_id", "created_at"])
-            for r in rows:
-                w.writerow([r["email"], r["password"], r["team"], r["status"], r["crs_id"], r["created_at"]])
         return True
     except Exception:
         return False
 
 
-def export_created_credentials_csv(path: Path) -> bool:
-    """导出凭据记录到 CSV（导出才会生成文件）。"""
-    try:
-        import csv
+def export_accounts_csv(path: Path) -> bool:
+    """导出账号记录到 CSV（导出才会生成文件）。"""
+    return _export_query_csv(
+        path,
+        ["email", "password", "team", "status", "crs_id", "created_at"],
+        "SELECT email, password, team, status, crs_id, created_at FROM accounts_log ORDER BY id ASC",
+    )
 
-        conn = _connect()
-        try:
-            rows = conn.execute(
-                "SELECT email, password, source, created_at FROM created_credentials ORDER BY id ASC"
-            ).fetchall()
-        finally:
-            conn.close()
 
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            w.writerow(["email", "password", "source", "created_at"])
-            for r in rows:
-                w.writerow([r["email"], r["password"], r["source"], r["created_at"]])
-        return True
-    except Exception:
-        return False
+def export_created_credentials_csv(path: Path) -> bool:
+    """导出凭据记录到 CSV（导出才会生成文件）。"""
+    return _export_query_csv(
+        path,
+        ["email", "password", "source", "created_at"],
+        "SELECT email, password, source, created_at FROM created_credentials ORDER BY id ASC",
+    )
 
 
 def export_tracker_json(path: Path) -> bool:
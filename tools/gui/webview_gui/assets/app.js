@@ -106,15 +106,28 @@ function setRunningUI(running) {
     .forEach((el) => (el.disabled = Boolean(running)));
 }
 
+// 控制最大长度，避免长期运行导致内存膨胀
+const LOG_MAX_CHARS = 300_000;
+let logChars = 0;
+
 function appendLog(text) {
   if (!text) return;
   const logEl = $("log");
-  logEl.textContent += text;
-
-  // 控制最大长度，避免长期运行导致内存膨胀
-  const maxChars = 300_000;
-  if (logEl.textContent.length > maxChars) {
-    logEl.textContent = logEl.textContent.slice(-maxChars);
+  // 每批日志追加为独立文本节点：不读取/重写已有内容，开销只与新增文本长度有关
+  logEl.appendChild(document.createTextNode(text));
+  logChars += text.length;
+
+  // 超出上限时从头部丢弃整段文本节点（最后一段只截掉多出的部分）
+  while (logChars > LOG_MAX_CHARS && logEl.firstChild) {
+    const first = logEl.firstChild;
+    const excess = logChars - LOG_MAX_CHARS;
+    if (first.length <= excess) {
+      logEl.removeChild(first);
+      logChars -= first.length;
+    } else {
+      first.deleteData(0, excess);
+      logChars -= excess;
+    }
   }
 
   if ($("auto-scroll").checked) {
@@ -216,7 +229,7 @@ async function pollLoop() {
   if (pollLoop._busy) return;
   pollLoop._busy = true;
   try {
-    const res = await window.pywebview.api.poll_logs(400);
+    const res = await window.pywebview.api.poll_logs(5000);
     if (!res || res.ok !== true) {
       const err = res && res.error ? res.error : "日志拉取失败";
       throw new Error(err);
@@ -483,6 +496,7 @@ function wireUi(paths) {
   $("btn-clear-log").addEventListener("click", async () => {
     await safeCall(window.pywebview.api.clear_logs);
     $("log").textContent = "";
+    logChars = 0;
     toast("已清空日志");
   });
 
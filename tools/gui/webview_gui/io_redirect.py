@@ -25,7 +25,7 @@ class 队列输出:
         if not s:
             return 0
         text = s.replace("\r", "\n")
-        if self.strip_ansi:
+        if self.strip_ansi and "\x1b" in text:
             text = _ANSI_ESCAPE_RE.sub("", text)
         self.q.put(text)
         return len(s)
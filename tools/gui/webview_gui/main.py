@@ -34,6 +34,13 @@ except ModuleNotFoundError:  # pragma: no cover
     webview = None
 
 
+# 注册表配置 / 追踪记录的缓存时长（秒）
+_CACHE_TTL = 2.0
+
+# poll_logs 单次返回的最大日志字符数
+_POLL_MAX_CHARS = 64_000
+
+
 @dataclass
 class _任务状态:
     运行中: bool
@@ -55,6 +62,24 @@ class WebviewApi:
         self._stop_event: Optional[threading.Event] = None
         self._thread: Optional[threading.Thread] = None
         self._state = _任务状态(运行中=False)
+        # 短时缓存：前端刷新时会连续调用多个接口，避免每次都读注册表/SQLite
+        self._cache: dict[str, tuple[float, Any]] = {}
+
+    def _cached(self, key: str, loader: Any) -> Any:
+        """返回 _CACHE_TTL 秒内缓存的 loader() 结果（结果只读，不要修改）。"""
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and now - hit[0] < _CACHE_TTL:
+            return hit[1]
+        value = loader()
+        self._cache[key] = (now, value)
+        return value
+
+    def _read_config(self) -> dict[str, Any]:
+        return self._cached("config", lambda: internal_config_store.读取配置() or {})
+
+    def _load_tracker(self) -> dict[str, Any]:
+        return self._cached("tracker", internal_output_store.load_team_tracker)
 
     def ping(self) -> dict[str, Any]:
         return {"ok": True, "ts": time.time()}
@@ -73,7 +98,7 @@ class WebviewApi:
 
     def get_config(self) -> dict[str, Any]:
         """读取内部配置（不依赖外部文件）。"""
-        payload = internal_config_store.读取配置() or {}
+        payload = self._read_config()
         config_text = payload.get("config_toml") if isinstance(payload, dict) else None
         team_text = payload.get("team_json") if isinstance(payload, dict) else None
 
@@ -108,6 +133,7 @@ class WebviewApi:
             "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         }
         ok = internal_config_store.保存配置(payload)
+        self._cache.pop("config", None)
         if not ok:
             return {"ok": False, "error": "保存失败：无法写入内部存储（注册表）"}
 
@@ -115,7 +141,7 @@ class WebviewApi:
 
     def create_from_example(self, overwrite: bool = False) -> dict[str, Any]:
         """从 example 初始化内部配置（默认不覆盖）。"""
-        existing = internal_config_store.读取配置() or {}
+        existing = self._read_config()
         has_existing = bool(
             isinstance(existing, dict)
             and (
@@ -186,7 +212,7 @@ class WebviewApi:
 
     def get_status_summary(self) -> dict[str, Any]:
         """读取内部追踪记录并返回结构化状态（供前端渲染）。"""
-        tracker = internal_output_store.load_team_tracker()
+        tracker = self._load_tracker()
         teams_obj = tracker.get("teams", {}) if isinstance(tracker, dict) else {}
         last_updated = tracker.get("last_updated") if isinstance(tracker, dict) else None
         tracker_path = str(internal_output_store.get_db_path())
@@ -267,7 +293,7 @@ class WebviewApi:
         accounts = internal_output_store.list_accounts(limit=int(accounts_limit))
         credentials = internal_output_store.list_created_credentials(limit=int(credentials_limit))
         counts = internal_output_store.get_counts()
-        tracker = internal_output_store.load_team_tracker()
+        tracker = self._load_tracker()
 
         return {
             "ok": True,
@@ -372,13 +398,22 @@ class WebviewApi:
             return {"ok": True, "running": True}
 
     def poll_logs(self, max_items: int = 200) -> dict[str, Any]:
-        """拉取增量日志（避免一次返回过大）。"""
+        """拉取增量日志（避免一次返回过大）。
+
+        一次 print 会写入多个小片段，按条数限制容易让积压越来越多，
+        因此同时按字符数限制：单次最多返回 _POLL_MAX_CHARS 个字符。
+        """
         chunks: list[str] = []
-        for _ in range(max(1, min(int(max_items), 2000))):
+        size = 0
+        for _ in range(max(1, min(int(max_items), 5000))):
             try:
-                chunks.append(self._log_queue.get_nowait())
+                chunk = self._log_queue.get_nowait()
             except queue.Empty:
                 break
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= _POLL_MAX_CHARS:
+                break
 
         text = "".join(chunks)
         with self._lock:
@@ -446,14 +481,14 @@ class WebviewApi:
             return f"未知模式: {mode}"
 
         if mode in {"all", "single", "test"}:
-            payload = internal_config_store.读取配置() or {}
+            payload = self._read_config()
             if not str(payload.get("config_toml", "")).strip():
                 return "未保存配置：请先在“配置编辑”页填写并保存"
             if not str(payload.get("team_json", "")).strip():
                 return "未保存 Team 配置：请先在“配置编辑”页填写并保存"
 
         if mode == "register":
-            payload = internal_config_store.读取配置() or {}
+            payload = self._read_config()
             if not str(payload.get("config_toml", "")).strip():
                 return "未保存配置：请先在“配置编辑”页填写并保存"
 
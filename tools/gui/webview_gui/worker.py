@@ -33,6 +33,7 @@ def _加载并刷新模块():
     # 这些模块会在 import 时从 config 读取常量，因此也需要 reload
     import logger as logger_module
     import utils as utils_module
+    import http_client as http_client_module
     import email_service as email_service_module
     import team_service as team_service_module
     import crs_service as crs_service_module
@@ -40,6 +41,8 @@ def _加载并刷新模块():
 
     logger_module = importlib.reload(logger_module)
     utils_module = importlib.reload(utils_module)
+    # 共享 HTTP Session 的代理设置来自 config，重新加载后下次请求按新配置创建
+    importlib.reload(http_client_module)
     email_service_module = importlib.reload(email_service_module)
     team_service_module = importlib.reload(team_service_module)
     crs_service_module = importlib.reload(crs_service_module)